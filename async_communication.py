@@ -0,0 +1,189 @@
+"""
+This module includes an asyncio version of the RS232 communication in communication.py
+Class: AsyncRS232 drives a non-blocking serial (or pty) file descriptor from an asyncio event loop, so that one loop
+         can serve the haptic sampling, several robots and telemetry without one thread per timer.
+Functions: AsyncRS232  connect() disconnect() _send() _receive_frame() _receive_all()
+Note: only POSIX file descriptors (/dev/ttyS*, /dev/ttyUSB*, /dev/pts/*) are supported.
+Author: Mr SoSimple
+"""
+
+import asyncio
+import os
+
+from communication import ByteRingBuffer
+
+
+class AsyncRS232(object):
+    def __init__(self, loop=None):
+        super(AsyncRS232, self).__init__()
+        self.__baud_rate = 115200
+        self.__timeout = 0.05
+        self.__portname = None
+        self.__loop = loop
+        # 串口状态机
+        self.__connect_state = False  # 串口打开状态
+        self.__fd = -1
+        self.__rx_buffer = ByteRingBuffer()  # 只在事件循环线程中读写
+        self.__rx_waiters = []  # 等待新数据的 future
+        self.__tx_pending = bytearray()  # 串口写满时暂存的待发数据
+        self.__tx_drained = None  # 待发数据全部写出时完成的 future
+
+    @property
+    def loop(self):
+        if self.__loop is None:
+            self.__loop = asyncio.get_event_loop()
+        return self.__loop
+
+    def set_port(self, port_name):
+        self.__portname = port_name
+
+    def set_baud_rate(self, baud_rate):
+        self.__baud_rate = baud_rate
+
+    def set_timeout(self, timeout):
+        self.__timeout = timeout
+
+    def __configure_fd(self):
+        """
+        设置为原始模式，8N1，无流控，并设置波特率
+        :return: None
+        """
+        import termios
+        import tty
+        tty.setraw(self.__fd)
+        attrs = termios.tcgetattr(self.__fd)
+        speed = getattr(termios, 'B{}'.format(self.__baud_rate), None)
+        if speed is not None:
+            attrs[4] = speed  # ispeed
+            attrs[5] = speed  # ospeed
+        termios.tcsetattr(self.__fd, termios.TCSANOW, attrs)
+
+    def connect(self):
+        try:
+            self.__fd = os.open(self.__portname, os.O_RDWR | os.O_NOCTTY | os.O_NONBLOCK)
+            self.__configure_fd()
+            self.loop.add_reader(self.__fd, self.__on_readable)
+        except Exception as e:
+            print('Connect data error: ', e)
+            if self.__fd >= 0:
+                os.close(self.__fd)
+                self.__fd = -1
+            self.__connect_state = False
+            return False
+        else:
+            self.__rx_buffer.clear()
+            self.__connect_state = True
+            return True
+
+    def is_connected(self):
+        if self.__connect_state:
+            return True
+        else:
+            return False
+
+    def disconnect(self):
+        if self.__fd < 0:
+            self.__connect_state = False
+            return True
+        try:
+            self.loop.remove_reader(self.__fd)
+            self.loop.remove_writer(self.__fd)
+            os.close(self.__fd)
+        except Exception as e:
+            print('Close port error:', e)
+            return False
+        else:
+            self.__fd = -1
+            self.__connect_state = False
+            self.__tx_pending = bytearray()
+            self.__wake_tx_drained()
+            self.__wake_rx_waiters()
+            return True
+
+    def __on_readable(self):
+        try:
+            receive_data = os.read(self.__fd, 4096)
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            print('Receive data error: ', e)
+            return
+        if receive_data:
+            self.__rx_buffer.write(receive_data)
+            self.__wake_rx_waiters()
+
+    def __wake_rx_waiters(self):
+        waiters = self.__rx_waiters
+        self.__rx_waiters = []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def __on_writable(self):
+        try:
+            n = os.write(self.__fd, self.__tx_pending)
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            print('Send data error: ', e)
+            n = len(self.__tx_pending)
+        del self.__tx_pending[:n]
+        if not self.__tx_pending:
+            self.loop.remove_writer(self.__fd)
+            self.__wake_tx_drained()
+
+    def __wake_tx_drained(self):
+        if self.__tx_drained is not None and not self.__tx_drained.done():
+            self.__tx_drained.set_result(None)
+        self.__tx_drained = None
+
+    async def _send(self, send_data):
+        """
+        非阻塞写出数据，串口写满时等待可写后继续
+        :param send_data: bytes 或 str
+        :return: None
+        """
+        data = send_data
+        if isinstance(data, str):
+            data = data.encode()
+        if not self.__tx_pending:
+            try:
+                n = os.write(self.__fd, data)
+            except (BlockingIOError, InterruptedError):
+                n = 0
+            except Exception as e:
+                print('Send data error: ', e)
+                return
+            data = data[n:]
+            if not data:
+                return
+            self.loop.add_writer(self.__fd, self.__on_writable)
+        self.__tx_pending.extend(data)
+        if self.__tx_drained is None:
+            self.__tx_drained = self.loop.create_future()
+        await self.__tx_drained
+
+    async def _receive_frame(self, frame, timeout):
+        """
+        等待并取出一个完整回复帧，帧到达即返回；超时则取出已收到的部分数据
+        :param frame: communication.ReplyFrame 回复帧形状
+        :param timeout: float 超时保护，单位秒
+        :return: str
+        """
+        deadline = self.loop.time() + timeout
+        while True:
+            end = frame.frame_end(self.__rx_buffer.peek())
+            if end >= 0:
+                return self.__rx_buffer.read(end).decode(errors='replace')
+            remaining = deadline - self.loop.time()
+            if remaining <= 0 or not self.__connect_state:
+                return self.__rx_buffer.read().decode(errors='replace')
+            waiter = self.loop.create_future()
+            self.__rx_waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                pass
+
+    def _receive_all(self):
+        return self.__rx_buffer.read().decode(errors='replace')
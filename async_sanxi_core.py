@@ -0,0 +1,225 @@
+"""
+This module includes the asyncio version of the core functions of SANXI robot
+Class: AsyncSanxi, whose base class is AsyncRS232 in async_communication.py module. It mirrors the Sanxi API in
+         sanxi_core.py, every method talking to the controller is a coroutine.
+Functions: query_coord() rect_move() multi_joints_motion() set_motion_para() freeze_motion()
+
+Author: Mr SoSimple
+"""
+
+
+import asyncio
+
+from async_communication import AsyncRS232
+from communication import SerialHistory
+from sanxi_core import FRAME_ACK, FRAME_LINE, CMD_FREEZE, CMD_QUERY_MODE, CMD_IDLE, CMD_MODE14, CMD_GCM, \
+    MODE_OF_ACK, ModeStateMachine, reply_frame_of, motion_para_codes, rect_move_code, joints_motion_code
+from coord_parser import CoordStreamParser, JointRecord
+from pose import JointPose, CartesianPose
+
+
+class AsyncSanxi(AsyncRS232):
+    def __init__(self, loop=None):
+        super(AsyncSanxi, self).__init__(loop)
+        self.mode_machine = ModeStateMachine()  # 由应答确认的控制器模式
+        self.reply_timeout = 0.05  # 有确定回复的命令（模式应答、坐标行）的超时保护，单位秒
+        self.return_code_history = SerialHistory()  # Sanxi串口的所有返回數據，有界，默认保留最新 1MB
+        self.new_return_code = ''  # Sanxi串口新添的返回数据
+        self.return_coord_mode = 1  # 返回坐标值模式：1-cartesian space 0-joint space
+        self.jn_value = JointPose()  # 伪实时关节空间坐标值，原地更新
+        self.xyz_value = CartesianPose()  # 伪实时笛卡尔空间坐标值，原地更新
+        self.coord_parser = CoordStreamParser()  # 流式坐标解析器
+        self.__request_lock = None  # 一次只有一个请求在途，首次使用时在事件循环中创建
+
+    async def connect_sanxi(self, port_name):
+        """
+        连接三喜机器人
+        :param port_name: string，串口名称 example：port_name='/dev/ttyUSB0'
+        :return: Bool
+        """
+        self.set_port(port_name)
+        self.set_baud_rate(115200)
+        self.set_timeout(0.05)
+        if self.connect() is True:
+            await self.change_to_mode14()  # 初始化为模式14
+            await self.set_return_data_mode()  # 初始化返回坐标模式为 cartesian space
+            return True
+        else:
+            return False
+
+    async def disconnect_sanxi(self):
+        """
+        停止运动，转为空闲模式，断开三喜机器人串口连接
+        :return: Bool
+        """
+        await self.stop_then_into_free_mode()
+        self.new_return_code = ''
+        self.return_code_history.clear()
+        if self.disconnect():
+            return True
+        else:
+            return False
+
+    async def send_cmd(self, send_code, delay_time, has_return_code=True):
+        """
+        统一管理命令发送，按命令推断回复帧形状，回复到达后立即更新串口消息
+        :param send_code: bytes 或 str  要发送的命令
+        :param delay_time: float 等待串口返回的最长时间，单位秒
+        :param has_return_code: Bool 是否更新串口返回的数据，一般只在串口无返回消息时设为假
+        :return:
+        """
+        if isinstance(send_code, str):
+            send_code = send_code.encode()
+        if has_return_code is True:
+            await self.request(send_code, reply_frame_of(send_code), delay_time)
+        else:
+            await self.request(send_code, None, delay_time)
+
+    async def request(self, send_code, frame, timeout):
+        """
+        发送命令并等待完整回复帧，回复到达即返回，timeout 仅为超时保护；
+        多个协程共用一个连接时按调用顺序逐个完成，回复不会被其他请求取走
+        :param send_code: bytes  要发送的命令
+        :param frame: ReplyFrame 回复帧形状，None 表示该命令无回复
+        :param timeout: float 超时保护，单位秒
+        :return: str 回复数据，超时时为已收到的部分
+        """
+        if self.__request_lock is None:
+            self.__request_lock = asyncio.Lock()
+        async with self.__request_lock:
+            self.return_code_history.append(self._receive_all())  # 发送前残留的数据（如超时后迟到的回复）只记入历史
+            await self._send(send_code)
+            if frame is None:
+                return ''
+            self.new_return_code = await self._receive_frame(frame, timeout)
+            self.return_code_history.append(self.new_return_code)
+            if frame is FRAME_ACK:
+                self.mode_machine.observe(send_code, self.new_return_code.encode())
+            return self.new_return_code
+
+    @property
+    def current_mode(self):
+        return self.mode_machine.mode
+
+    async def query_current_mode(self):
+        """
+        向串口发送模式询问指令
+        :return: int 0-询问失败 10-空闲模式 14-调试模式 15-复位模式 12-回零模式 11-文件模式
+        """
+        ack = await self.request(CMD_QUERY_MODE, FRAME_ACK, self.reply_timeout)
+        return MODE_OF_ACK.get(ack.encode(), 0)
+
+    async def enter_mode(self, target_mode):
+        """
+        切换到目标模式：模式未确认时先询问一次，之后只发送需要的切换命令，见 sanxi_core.Sanxi.enter_mode
+        :return: Bool 是否确认处于目标模式
+        """
+        machine = self.mode_machine
+        if not machine.confirmed:
+            machine.resync_count += 1
+            await self.query_current_mode()
+        codes = machine.plan(target_mode)
+        if not codes:
+            machine.skipped_count += 1
+            return True
+        machine.transition_count += 1
+        for code in codes:
+            await self.send_cmd(code, self.reply_timeout)
+        return machine.confirmed and machine.mode == target_mode
+
+    @property
+    def all_return_code(self):
+        """
+        内存中保留的全部串口返回数据
+        :return: str
+        """
+        return self.return_code_history.text()
+
+    async def set_return_data_mode(self, mode=1):
+        """
+        设置返回数据模式，直角坐标模式 或 关节坐标模式，默认前者
+        :param mode: int 1-cartesian space 0-joint space
+        :return: Bool
+        """
+        if mode == 1:
+            await self.send_cmd(CMD_GCM[1], self.reply_timeout)
+            self.return_coord_mode = 1
+            return True
+        elif mode == 0:
+            await self.send_cmd(CMD_GCM[0], self.reply_timeout)
+            self.return_coord_mode = 0
+            return True
+        else:
+            return False
+
+    async def query_coord(self):
+        await self.freeze_motion()
+        await self.enter_mode(14)
+        await self.request(CMD_FREEZE, FRAME_LINE, self.reply_timeout)
+        for record in self.coord_parser.feed(self.new_return_code.encode()):
+            if isinstance(record, JointRecord):
+                self.jn_value.set(record, record.timestamp)
+            else:
+                self.xyz_value.set(record, record.timestamp)
+        if self.return_coord_mode == 1:
+            return self.xyz_value
+        elif self.return_coord_mode == 0:
+            return self.jn_value
+        else:
+            return False
+
+    async def set_motion_para(self, vep, acp, dep):
+        """
+        设置运动参数
+        :param vep: 速度百分比
+        :param acp: 加速度百分比
+        :param dep: 减速度百分比
+        :return: None
+        """
+        await self.enter_mode(14)
+        for send_data in motion_para_codes(vep, acp, dep):
+            await self.send_cmd(send_data, 0.004)
+
+    async def change_to_mode14(self):
+        await self.freeze_motion()
+        await self.request(CMD_IDLE, FRAME_ACK, self.reply_timeout)
+        await self.request(CMD_MODE14, FRAME_ACK, self.reply_timeout)
+        return self.mode_machine.confirmed and self.current_mode == 14
+
+    async def rect_move(self, mode, pose=None, **rect_dict):
+        """
+        直角坐标运动，点对点, 或直线
+        :param mode: mode='p2p' OR mode='line'
+        :param pose: CartesianPose 直角坐标目标值，给出时忽略 rect_dict
+        :param rect_dict: 字典——直角坐标目标值，{'X': float, ...}
+        :return:
+        """
+        send_data = rect_move_code(mode, rect_dict if pose is None else pose)
+        await self.enter_mode(14)
+        await self.send_cmd(send_data, 0.014)
+
+    async def multi_joints_motion(self, pose=None, axes=None, **j_dict):
+        """
+        关节运动，点对点
+        :param pose: JointPose 关节目标值，给出时忽略 j_dict
+        :param axes: tuple of int 与 pose 一起使用，只发送这些轴，None 表示全部六轴
+        :param j_dict: 字典——六轴目标值，{'J*': float, ...}
+        :return:
+        """
+        if pose is None:
+            send_data = joints_motion_code(j_dict)
+        else:
+            send_data = joints_motion_code(pose, axes)
+        await self.enter_mode(14)
+        await self.send_cmd(send_data, 0.014)
+
+    async def freeze_motion(self):
+        await self.request(CMD_FREEZE, FRAME_LINE, self.reply_timeout)
+
+    async def stop_then_into_free_mode(self):
+        """
+        终止运动，并退出当前模式，设置为空闲模式-0x10
+        :return: None
+        """
+        await self.freeze_motion()
+        await self.request(CMD_IDLE, FRAME_ACK, self.reply_timeout)
@@ -1,86 +1,698 @@
-"""
-This communication module includes RS232 communicating with SANXI robot
-Class: RS232 provides fundamental serial operations, including connect, disconnect, send and receive messages
-       Message_control provides high level serial and message operations, including a thread  to monitor the message
-         received from the serial, and other message handling methods such as changing to hex or ASCII.
-Functions: RS232  connect() disconnect() send() receive()
-           Message_control  start_refresh() stop_refresh()
-Author: Mr SoSimple
-"""
-
-import serial
-
-
-class RS232(object):
-    def __init__(self):
-        super(RS232, self).__init__()
-        self.__baud_rate = 115200
-        self.__timeout = 0.05
-        # 串口状态机
-        self.__connect_state = False  # 串口打开状态
-        self.__ser = serial.Serial()
-
-    def set_port(self, port_name):
-        self.__portname = port_name
-
-    def set_baud_rate(self, baud_rate):
-        self.__baud_rate = baud_rate
-
-    def set_timeout(self, timeout):
-        self.__timeout = timeout
-
-    def connect(self):
-        try:
-            # 设置端口、波特率、接收超时
-            self.__ser.port = self.__portname
-            self.__ser.baudrate = self.__baud_rate
-            self.__ser.timeout = self.__timeout
-            self.__ser.open()
-        except Exception as e:
-            print('Connect data error: ', e)
-        else:
-            if self.__ser.isOpen():
-                self.__connect_state = True
-                return True
-            else:
-                self.__connect_state = False
-                return False
-
-    def is_connected(self):
-        if self.__connect_state:
-            return True
-        else:
-            return False
-
-    def disconnect(self):
-        try:
-            self.__ser.close()
-        except Exception as e:
-            print('Close port error:', e)
-        else:
-            if self.__ser.isOpen():
-                self.__connect_state = True
-                return False
-            else:
-                self.__connect_state = False
-                return True
-
-    def _send(self, send_data):
-        try:
-            self.__ser.write(send_data.encode())
-        except Exception as e:
-            print('Send data error: ', e)
-
-    def _receive_line(self):
-        try:
-            receive_data = self.__ser.readline().decode()
-            return receive_data
-        except Exception as e:
-            print('Receive data error: ', e)
-
-    def _receive_all(self):
-        try:
-            receive_data = self.__ser.read_all().decode()
-            return receive_data
-        except Exception as e:
+"""
+This communication module includes RS232 communicating with SANXI robot
+Class: RS232 provides fundamental serial operations, including connect, disconnect, send and receive messages.
+         The bytes go through a pluggable transport from transport.py: serial port, TCP serial server, pty or memory.
+       Message_control provides high level serial and message operations, including a thread  to monitor the message
+         received from the serial, and other message handling methods such as changing to hex or ASCII.
+       ByteRingBuffer provides a bounded byte ring buffer, filled by the RS232 reader thread and drained by
+         the command thread, which can wait on it until the reply arrives.
+       ReplyFrame describes the shape of a reply, fixed length or terminated, so that a request returns as soon
+         as its complete reply is buffered; a terminated frame with markers can be recognised among other replies.
+       SerialHistory keeps a bounded history of everything received, optionally spilling old bytes to disk.
+       WriteJob is one write submitted to the RS232 writer thread, which writes jobs in priority order (stop and
+         freeze first) and matches the replies to the outstanding jobs in wire order. A stop written ahead of jobs
+         still waiting gets its recognisable reply at once, the jobs before it end with what they received.
+Functions: RS232  connect() disconnect() send() receive()
+           Message_control  start_refresh() stop_refresh()
+Author: Mr SoSimple
+"""
+
+import collections
+import heapq
+import itertools
+import threading
+import time
+
+from transport import make_transport
+
+
+PRIORITY_STOP = 0  # 停止、冻结类命令：插队，且不必等待前一条命令的回复即可写出
+PRIORITY_NORMAL = 10
+PRIORITY_BACKGROUND = 20  # 后台查询类命令，队列空闲时才写出
+
+
+class ReplyFrame(object):
+    """
+    回复帧形状：定长（如单字节模式应答）或以终止符结尾（如 \\r\\n 结尾的坐标行）
+    """
+    def __init__(self, length=None, terminator=None, markers=None):
+        """
+        :param length: int 定长帧的字节数
+        :param terminator: bytes 帧的终止符
+        :param markers: tuple of bytes 终止符帧中必含其一的内容，用于在其他命令的回复中认出本帧，None 表示不可识别
+        """
+        super(ReplyFrame, self).__init__()
+        self.length = length
+        self.terminator = terminator
+        self.markers = markers
+
+    def frame_end(self, data):
+        """
+        判断 data 中是否已有一个完整回复帧
+        :param data: bytes 已接收的数据
+        :return: int 完整帧结束位置（不含），不完整时返回 -1
+        """
+        if self.terminator is not None:
+            index = data.find(self.terminator)
+            if index < 0:
+                return -1
+            return index + len(self.terminator)
+        if len(data) >= self.length:
+            return self.length
+        return -1
+
+    def find_marked(self, data):
+        """
+        在 data 中查找第一个含 markers 的完整帧，只用于有 markers 的终止符帧
+        :param data: bytes 已接收的数据
+        :return: (int 开始位置, int 结束位置（不含）)，没有时返回 None
+        """
+        start = 0
+        while True:
+            end = self.frame_end(data[start:])
+            if end < 0:
+                return None
+            end += start
+            frame = data[start:end]
+            for marker in self.markers:
+                if marker in frame:
+                    return start, end
+            start = end
+
+
+class ByteRingBuffer(object):
+    """
+    有界字节环形缓冲区：读线程写入，命令线程读取；写满后覆盖最旧的数据
+    """
+    def __init__(self, capacity=65536):
+        super(ByteRingBuffer, self).__init__()
+        self.__capacity = capacity
+        self.__buffer = bytearray(capacity)
+        self.__head = 0  # 最旧数据所在位置
+        self.__size = 0  # 当前缓存字节数
+        self.__total_written = 0  # 累计写入字节数，用于判断发送命令之后是否有新数据到达
+        self.__dropped = 0  # 因缓冲区满而被覆盖的字节数
+        self.__condition = threading.Condition()
+
+    def __len__(self):
+        return self.__size
+
+    @property
+    def capacity(self):
+        return self.__capacity
+
+    @property
+    def total_written(self):
+        return self.__total_written
+
+    @property
+    def dropped(self):
+        return self.__dropped
+
+    def write(self, data):
+        """
+        写入数据并唤醒等待者，空间不足时丢弃最旧的数据
+        :param data: bytes
+        :return: None
+        """
+        n = len(data)
+        if n == 0:
+            return
+        with self.__condition:
+            if n >= self.__capacity:
+                # 单次数据超过容量，只保留末尾部分
+                self.__dropped += self.__size + n - self.__capacity
+                self.__buffer[:] = data[n - self.__capacity:]
+                self.__head = 0
+                self.__size = self.__capacity
+            else:
+                overflow = self.__size + n - self.__capacity
+                if overflow > 0:
+                    self.__head = (self.__head + overflow) % self.__capacity
+                    self.__size -= overflow
+                    self.__dropped += overflow
+                tail = (self.__head + self.__size) % self.__capacity
+                first = min(n, self.__capacity - tail)
+                self.__buffer[tail:tail + first] = data[:first]
+                if first < n:
+                    self.__buffer[:n - first] = data[first:]
+                self.__size += n
+            self.__total_written += n
+            self.__condition.notify_all()
+
+    def __copy_out(self, n):
+        """
+        复制最旧的 n 个字节（调用者需持有锁）
+        """
+        end = self.__head + n
+        if end <= self.__capacity:
+            return bytes(self.__buffer[self.__head:end])
+        return bytes(self.__buffer[self.__head:]) + bytes(self.__buffer[:end - self.__capacity])
+
+    def read(self, n=-1):
+        """
+        取出最旧的 n 个字节，n<0 时取出全部
+        :return: bytes
+        """
+        with self.__condition:
+            if n < 0 or n > self.__size:
+                n = self.__size
+            data = self.__copy_out(n)
+            self.__head = (self.__head + n) % self.__capacity
+            self.__size -= n
+            if self.__size == 0:
+                self.__head = 0
+            return data
+
+    def peek(self):
+        """
+        查看全部缓存数据但不取出
+        :return: bytes
+        """
+        with self.__condition:
+            return self.__copy_out(self.__size)
+
+    def tail(self, n):
+        """
+        查看最新的 n 个字节但不取出
+        :return: bytes
+        """
+        with self.__condition:
+            n = min(n, self.__size)
+            start = (self.__head + self.__size - n) % self.__capacity
+            end = start + n
+            if end <= self.__capacity:
+                return bytes(self.__buffer[start:end])
+            return bytes(self.__buffer[start:]) + bytes(self.__buffer[:end - self.__capacity])
+
+    def clear(self):
+        with self.__condition:
+            self.__head = 0
+            self.__size = 0
+
+    def wait_for_data(self, mark, timeout):
+        """
+        阻塞等待，直到累计写入字节数超过 mark 或超时
+        :param mark: int 等待开始前的 total_written
+        :param timeout: float 超时时间，单位秒
+        :return: Bool 是否有新数据到达
+        """
+        with self.__condition:
+            return self.__condition.wait_for(lambda: self.__total_written > mark, timeout)
+
+    def wait_for_frame(self, frame, timeout):
+        """
+        阻塞等待，直到缓存数据中出现一个完整回复帧或超时
+        :param frame: ReplyFrame 回复帧形状
+        :param timeout: float 超时时间，单位秒
+        :return: int 完整帧结束位置，超时返回 -1
+        """
+        with self.__condition:
+            end = [-1]
+
+            def frame_complete():
+                end[0] = frame.frame_end(self.__copy_out(self.__size))
+                return end[0] >= 0
+            self.__condition.wait_for(frame_complete, timeout)
+            return end[0]
+
+
+class SerialHistory(object):
+    """
+    有界串口历史记录：追加为 O(1)，只保留最新的 capacity 个字节；设置 spill_path 后被挤出的旧数据追加写入该文件
+    """
+    def __init__(self, capacity=1 << 20, spill_path=None):
+        super(SerialHistory, self).__init__()
+        self.__ring = ByteRingBuffer(capacity)
+        self.__spill_path = None
+        self.__spill_file = None
+        self.set_spill_path(spill_path)
+
+    def __len__(self):
+        return len(self.__ring)
+
+    @property
+    def capacity(self):
+        return self.__ring.capacity
+
+    @property
+    def total_appended(self):
+        return self.__ring.total_written
+
+    def set_spill_path(self, spill_path):
+        """
+        设置溢出文件，None 表示直接丢弃最旧的数据
+        :param spill_path: str 文件路径
+        :return: None
+        """
+        if self.__spill_file is not None:
+            self.__spill_file.close()
+            self.__spill_file = None
+        self.__spill_path = spill_path
+        if spill_path is not None:
+            self.__spill_file = open(spill_path, 'ab')
+
+    def append(self, data):
+        """
+        追加数据
+        :param data: str 或 bytes
+        :return: None
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        if not data:
+            return
+        if self.__spill_file is not None:
+            overflow = len(self.__ring) + len(data) - self.capacity
+            if overflow > 0:
+                self.__spill_file.write(self.__ring.read(overflow))
+                if len(data) > self.capacity:
+                    self.__spill_file.write(data[:len(data) - self.capacity])
+                self.__spill_file.flush()
+        self.__ring.write(data)
+
+    def tail(self, n):
+        """
+        最新的 n 个字节
+        :return: str
+        """
+        return self.__ring.tail(n).decode(errors='replace')
+
+    def since(self, mark):
+        """
+        取出 mark 之后追加的数据，用于界面增量显示
+        :param mark: int 上次调用返回的 total_appended，初次调用传 0
+        :return: tuple (str 新数据，已被挤出的部分不再返回, int 新的 mark)
+        """
+        total = self.__ring.total_written
+        return self.__ring.tail(total - mark).decode(errors='replace'), total
+
+    def text(self):
+        """
+        内存中保留的全部历史
+        :return: str
+        """
+        return self.__ring.peek().decode(errors='replace')
+
+    def clear(self):
+        self.__ring.clear()
+
+    def close(self):
+        self.set_spill_path(None)
+
+
+class WriteJob(object):
+    """
+    提交给写线程的一次写出：data 一次写出，frames 为依次期待的回复帧
+    """
+    def __init__(self, data, frames, priority, guard=None, pipeline_depth=1):
+        """
+        :param data: bytes 要写出的数据
+        :param frames: list of (ReplyFrame, timeout) 依次期待的回复帧与各自的超时保护
+        :param priority: int 优先级，数值越小越先写出
+        :param guard: function() -> Bool 写出前在写线程中调用，返回假时放弃写出，None 表示总是写出
+        :param pipeline_depth: int 等待中的回复少于此数时即可写出，1 表示等前面的回复全部到达后再写出
+        """
+        super(WriteJob, self).__init__()
+        self.data = data
+        self.frames = frames
+        self.priority = priority
+        self.guard = guard
+        self.pipeline_depth = pipeline_depth
+        self.skipped = False  # 是否因 guard 返回假而放弃写出
+        self.replies = []  # 与 frames 一一对应的回复，超时时为已收到的部分
+        self.complete = []  # 与 frames 一一对应，是否收到完整回复帧
+        self.stale = b''  # 写出前接收缓冲区中残留的数据
+        self.queued_time = time.perf_counter()
+        self.send_time = None  # 写出时刻
+        self.first_byte_time = None  # 写出后收到第一个字节的时刻
+        self.reply_times = []  # 各回复完成的时刻
+        self.__done = threading.Event()
+
+    def _add_reply(self, reply, complete, now):
+        self.replies.append(reply)
+        self.complete.append(complete)
+        self.reply_times.append(now)
+        if len(self.replies) >= len(self.frames):
+            self.__done.set()
+
+    def _finish(self):
+        """
+        未收到的回复以空数据补齐并结束
+        """
+        now = time.perf_counter()
+        while len(self.replies) < len(self.frames):
+            self._add_reply(b'', False, now)
+        self.__done.set()
+
+    def done(self):
+        return self.__done.is_set()
+
+    def wait(self, timeout=None):
+        """
+        等待全部回复
+        :return: list of bytes
+        """
+        self.__done.wait(timeout)
+        return self.replies
+
+
+class RS232(object):
+    def __init__(self):
+        super(RS232, self).__init__()
+        self.__baud_rate = 115200
+        self.__timeout = 0.05
+        # 串口状态机
+        self.__connect_state = False  # 串口打开状态
+        self.__portname = None
+        self.__transport = None  # 传输层，connect() 时按端口名称创建，或由 set_transport() 指定
+        # 后台读线程：持续把串口数据读入环形缓冲区
+        self.__rx_buffer = ByteRingBuffer()
+        self.__reader_flag = False  # 读线程运行标志 False: 停止  True: 运行
+        self.__reader_thread = None
+        # 写线程：按优先级写出 WriteJob，并把收到的回复按写出顺序分配给未完成的 WriteJob
+        self.__io_condition = threading.Condition()  # 新任务提交或新数据到达时唤醒写线程
+        self.__job_queue = []  # 优先级队列 [(priority, seq, job), ...]
+        self.__job_seq = itertools.count()
+        self.__outstanding = collections.deque()  # 等待回复的 [job, 帧序号, 截止时刻]，按写出顺序排列
+        self.__writer_flag = False
+        self.__writer_thread = None
+        self.__first_byte_job = None  # 等待首字节的任务
+        # 收发计数
+        self.bytes_written = 0
+        self.bytes_read = 0
+
+    def set_port(self, port_name):
+        self.__portname = port_name
+
+    def set_baud_rate(self, baud_rate):
+        self.__baud_rate = baud_rate
+
+    def set_timeout(self, timeout):
+        self.__timeout = timeout
+
+    def set_transport(self, transport):
+        """
+        指定传输层，例如 transport.TcpTransport 或 transport.MemoryTransport；指定后 connect() 不再按端口名称创建
+        :param transport: 传输层对象
+        :return: None
+        """
+        self.__transport = transport
+        self.__portname = None
+
+    @property
+    def transport(self):
+        return self.__transport
+
+    def connect(self):
+        try:
+            # 按端口、波特率、接收超时创建传输层：端口名称不变时复用已有传输层（keep_connection 时还复用其 TCP 连接）
+            if self.__portname is not None and getattr(self.__transport, 'port_name', None) != self.__portname:
+                self.__transport = make_transport(self.__portname, self.__baud_rate, self.__timeout)
+                self.__transport.port_name = self.__portname
+            self.__transport.open()
+        except Exception as e:
+            print('Connect data error: ', e)
+        else:
+            if self.__transport.is_open():
+                self.__connect_state = True
+                self.__start_reader()
+                self.__start_writer()
+                return True
+            else:
+                self.__connect_state = False
+                return False
+
+    def is_connected(self):
+        if self.__connect_state:
+            return True
+        else:
+            return False
+
+    def disconnect(self):
+        """
+        停止读写线程并关闭传输层。TcpTransport 默认同时关闭 TCP 连接，串口服务器随即可服务其他客户端；
+        keep_connection 为真时连接被保留，直到 close(force=True) 或程序退出
+        :return: Bool 是否已关闭
+        """
+        self.__stop_writer()
+        self.__stop_reader()
+        try:
+            self.__transport.close()
+        except Exception as e:
+            print('Close port error:', e)
+        else:
+            if self.__transport.is_open():
+                self.__connect_state = True
+                return False
+            else:
+                self.__connect_state = False
+                return True
+
+    def _send(self, send_data):
+        """
+        直接写出数据，不经过写线程的优先级队列
+        :param send_data: bytes 或 str
+        :return: None
+        """
+        if isinstance(send_data, str):
+            send_data = send_data.encode()
+        self.bytes_written += len(send_data)
+        try:
+            self.__transport.write(send_data)
+        except Exception as e:
+            print('Send data error: ', e)
+
+    def _submit(self, send_data, frames, priority=PRIORITY_NORMAL, guard=None, pipeline_depth=1):
+        """
+        提交一次写出到写线程
+        :param send_data: bytes 要写出的数据
+        :param frames: list of (ReplyFrame, timeout) 依次期待的回复帧，无回复时为空列表
+        :param priority: int PRIORITY_STOP / PRIORITY_NORMAL / PRIORITY_BACKGROUND
+        :param guard: function() -> Bool 轮到写出时再判断一次是否仍需写出，None 表示总是写出
+        :param pipeline_depth: int 允许在多少个回复未到达时写出，用于连续发送路径点
+        :return: WriteJob
+        """
+        job = WriteJob(send_data, frames, priority, guard, pipeline_depth)
+        with self.__io_condition:
+            if not self.__writer_flag:
+                print('Send data error: ', 'port is not connected')
+                job._finish()
+                return job
+            heapq.heappush(self.__job_queue, (priority, next(self.__job_seq), job))
+            self.__io_condition.notify_all()
+        return job
+
+    def _transact(self, send_data, frames, priority=PRIORITY_NORMAL, guard=None):
+        """
+        提交一次写出并等待全部回复
+        :return: WriteJob
+        """
+        job = self._submit(send_data, frames, priority, guard)
+        job.wait()
+        return job
+
+    def __start_writer(self):
+        self.__writer_flag = True
+        self.__writer_thread = threading.Thread(target=self.__writer_thread_func, name='RS232_Writer_Thread')
+        self.__writer_thread.daemon = True
+        self.__writer_thread.start()
+
+    def __stop_writer(self):
+        """
+        停止写线程，未写出和未收到回复的任务以空回复结束
+        :return: None
+        """
+        with self.__io_condition:
+            self.__writer_flag = False
+            self.__io_condition.notify_all()
+        if self.__writer_thread is not None and self.__writer_thread is not threading.current_thread():
+            self.__writer_thread.join()
+        self.__writer_thread = None
+        with self.__io_condition:
+            for priority, seq, job in self.__job_queue:
+                job._finish()
+            for job, index, deadline in self.__outstanding:
+                job._finish()
+            self.__job_queue = []
+            self.__outstanding.clear()
+
+    # 写线程目标函数
+    def __writer_thread_func(self):
+        while self.__writer_flag:
+            with self.__io_condition:
+                self.__match_replies()
+                job = self.__next_job()
+                if job is None:
+                    self.__io_condition.wait(self.__next_wait())
+                    continue
+                if job.guard is not None and not job.guard():
+                    job.skipped = True
+                    job._finish()
+                    continue
+                if not self.__outstanding:
+                    job.stale = self.__rx_buffer.read()  # 写出前残留的数据
+                job.send_time = time.perf_counter()
+                if job.frames:
+                    self.__first_byte_job = job
+                    for index in range(len(job.frames)):
+                        self.__outstanding.append([job, index, None])  # 截止时刻在成为队首时设定
+            self._send(job.data)
+            if not job.frames:
+                job._finish()
+
+    def __next_job(self):
+        """
+        取出下一个可写出的任务：没有等待回复的任务时按优先级取出；否则只允许 PRIORITY_STOP 任务插队写出，
+        以及等待中的回复数少于其 pipeline_depth 的任务
+        """
+        if not self.__job_queue:
+            return None
+        priority, seq, job = self.__job_queue[0]
+        if priority > PRIORITY_STOP and len(self.__outstanding) >= job.pipeline_depth:
+            return None
+        return heapq.heappop(self.__job_queue)[2]
+
+    def __next_wait(self):
+        if self.__outstanding:
+            return min(max(self.__outstanding[0][2] - time.perf_counter(), 0), self.__timeout)
+        return self.__timeout
+
+    def __match_stop_reply(self):
+        """
+        插队写出的停止命令：控制器按写出顺序回复，排在它前面的命令若有回复，必在它的回复之前到达。
+        停止命令的回复可以识别（帧有 markers）时，一旦到达，它之前的数据按顺序分给前面的任务，
+        分不到完整帧的任务以已收到的部分结束（控制器不回复的命令不会再有回复），停止命令不必等它们超时
+        """
+        for position, entry in enumerate(self.__outstanding):
+            job, index, deadline = entry
+            frame = job.frames[index][0]
+            if position > 0 and job.priority == PRIORITY_STOP and frame.markers:
+                break
+        else:
+            return
+        span = frame.find_marked(self.__rx_buffer.peek())
+        if span is None:
+            return
+        before = self.__rx_buffer.read(span[0])
+        now = time.perf_counter()
+        for i in range(position):
+            job, index, deadline = self.__outstanding.popleft()
+            end = job.frames[index][0].frame_end(before)
+            if end >= 0:
+                job._add_reply(before[:end], True, now)
+                before = before[end:]
+            else:
+                job._add_reply(before, False, now)
+                before = b''
+
+    def __match_replies(self):
+        """
+        按写出顺序把接收缓冲区中的完整回复帧分配给等待回复的任务；队首任务超时则以已收到的部分结束
+        """
+        self.__match_stop_reply()
+        while self.__outstanding:
+            entry = self.__outstanding[0]
+            job, index, deadline = entry
+            frame, timeout = job.frames[index]
+            now = time.perf_counter()
+            if deadline is None:
+                deadline = entry[2] = now + timeout
+            data = self.__rx_buffer.peek()
+            end = frame.frame_end(data)
+            if end >= 0:
+                job._add_reply(self.__rx_buffer.read(end), True, now)
+            elif now >= deadline:
+                # 超时：只有这一个等待者时才取走残缺数据，避免吞掉后面任务的回复
+                partial = self.__rx_buffer.read() if len(self.__outstanding) == 1 else b''
+                job._add_reply(partial, False, now)
+            else:
+                return
+            self.__outstanding.popleft()
+
+    def __start_reader(self):
+        """
+        启动后台读线程
+        :return: None
+        """
+        self.__rx_buffer.clear()
+        self.__reader_flag = True
+        self.__reader_thread = threading.Thread(target=self.__reader_thread_func, name='RS232_Reader_Thread')
+        self.__reader_thread.daemon = True
+        self.__reader_thread.start()
+
+    def __stop_reader(self):
+        """
+        停止后台读线程，最多等待一个接收超时周期
+        :return: None
+        """
+        self.__reader_flag = False
+        if self.__reader_thread is not None and self.__reader_thread is not threading.current_thread():
+            self.__reader_thread.join()
+        self.__reader_thread = None
+
+    # 读线程目标函数
+    def __reader_thread_func(self):
+        while self.__reader_flag:
+            try:
+                # 有数据时一次读完，无数据时阻塞至多 timeout 秒
+                receive_data = self.__transport.read(4096)
+            except Exception as e:
+                print('Reader thread error: ', e)
+                if not hasattr(self.__transport, 'reconnect'):
+                    break
+                # 可重连的传输层（TCP）：稍后重试
+                time.sleep(self.__timeout)
+                try:
+                    self.__transport.reconnect()
+                except Exception as e:
+                    print('Reconnect error: ', e)
+                continue
+            if receive_data:
+                job = self.__first_byte_job
+                if job is not None:
+                    job.first_byte_time = time.perf_counter()
+                    self.__first_byte_job = None
+                self.bytes_read += len(receive_data)
+                self.__rx_buffer.write(receive_data)
+                with self.__io_condition:
+                    self.__io_condition.notify_all()
+
+    def _receive_frame_bytes(self, frame, timeout):
+        """
+        等待并取出一个完整回复帧，帧到达即返回；超时则取出已收到的部分数据
+        :param frame: ReplyFrame 回复帧形状
+        :param timeout: float 超时保护，单位秒
+        :return: bytes
+        """
+        end = self.__rx_buffer.wait_for_frame(frame, timeout)
+        if end < 0:
+            return self.__rx_buffer.read()
+        return self.__rx_buffer.read(end)
+
+    def _receive_frame(self, frame, timeout):
+        try:
+            return self._receive_frame_bytes(frame, timeout).decode()
+        except Exception as e:
+            print('Receive data error: ', e)
+            return ''
+
+    def _receive_line(self, timeout=None):
+        """
+        从接收缓冲区取出一行（以 \\n 结尾），超时则返回已缓存的全部数据
+        :param timeout: float 超时时间，默认使用串口接收超时
+        :return: str
+        """
+        if timeout is None:
+            timeout = self.__timeout
+        return self._receive_frame(ReplyFrame(terminator=b'\n'), timeout)
+
+    def _receive_all_bytes(self):
+        return self.__rx_buffer.read()
+
+    def _receive_all(self):
+        try:
+            receive_data = self.__rx_buffer.read().decode()
+            return receive_data
+        except Exception as e:
             print('Receive data error: ', e)
\ No newline at end of file
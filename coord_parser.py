@@ -0,0 +1,150 @@
+"""
+This module includes an incremental parser for the coordinate replies of SANXI robot
+Class: CoordStreamParser is fed raw byte chunks from the port in any split, and emits a JointRecord
+         ('J1=.. J2=.. ... J6=..') or a CartesianRecord ('X=.. Y=.. ... D=..') as soon as a complete line arrives.
+         Split frames are kept until their line ends, concatenated frames give one record each, and garbage in
+         front of a record (mode acks, a truncated earlier reply) is skipped.
+       PoseSnapshot is an immutable pair of the latest JointRecord and CartesianRecord, replaced as a whole on update
+         so that readers in other threads need no lock.
+Functions: feed() parse_line() benchmark()
+
+Author: Mr SoSimple
+"""
+
+
+import time
+from collections import namedtuple
+
+
+JointRecord = namedtuple('JointRecord', ['j1', 'j2', 'j3', 'j4', 'j5', 'j6', 'timestamp'])
+CartesianRecord = namedtuple('CartesianRecord', ['x', 'y', 'z', 'a', 'b', 'c', 'd', 'timestamp'])
+PoseSnapshot = namedtuple('PoseSnapshot', ['joint', 'cartesian', 'sequence'])  # sequence 每次更新加一
+JOINT_KEYS = (b'J1', b'J2', b'J3', b'J4', b'J5', b'J6')
+CARTESIAN_KEYS = (b'X', b'Y', b'Z', b'A', b'B', b'C', b'D')
+
+
+def _parse_values(segment, keys):
+    """
+    按顺序解析 'K1=v1 K2=v2 ...'
+    :param segment: bytes 从第一个键开始的行内容
+    :param keys: tuple of bytes 期望的键
+    :return: list of float，格式不符时返回 None
+    """
+    tokens = segment.replace(b'=', b' ').split()  # 键与值交替排列
+    n = len(keys) * 2
+    if tuple(tokens[0:n:2]) != keys:
+        return None
+    try:
+        return list(map(float, tokens[1:n:2]))
+    except ValueError:
+        return None
+
+
+class CoordStreamParser(object):
+    def __init__(self, max_line=256):
+        """
+        :param max_line: int 未结束行的最大保留长度，超出部分（最旧的字节）被丢弃
+        """
+        super(CoordStreamParser, self).__init__()
+        self.max_line = max_line
+        self.__pending = bytearray()  # 未结束的行
+        self.joint_count = 0  # 已解析的关节坐标记录数
+        self.cartesian_count = 0  # 已解析的直角坐标记录数
+        self.last_joint = None  # 最新的 JointRecord
+        self.last_cartesian = None  # 最新的 CartesianRecord
+
+    def reset(self):
+        self.__pending = bytearray()
+
+    def feed(self, data, timestamp=None):
+        """
+        输入一段接收数据
+        :param data: bytes 任意切分的接收数据
+        :param timestamp: float 数据到达时刻，默认 time.perf_counter()
+        :return: list of JointRecord / CartesianRecord 本次完整到达的坐标记录
+        """
+        index = data.rfind(b'\n')
+        if index < 0:
+            # 行未结束：只追加，不重复扫描已保留的部分
+            self.__pending += data
+            if len(self.__pending) > self.max_line:
+                del self.__pending[:-self.max_line]
+            return []
+        if timestamp is None:
+            timestamp = time.perf_counter()
+        if self.__pending:
+            self.__pending += data[:index]
+            lines = bytes(self.__pending).split(b'\n')
+        else:
+            lines = data[:index].split(b'\n')
+        self.__pending = bytearray(data[index + 1:][-self.max_line:])
+        records = []
+        for line in lines:
+            record = self.parse_line(line, timestamp)
+            if record is not None:
+                records.append(record)
+        return records
+
+    def parse_line(self, line, timestamp=None):
+        """
+        解析一个完整行，行首的杂项字节被忽略，包括另一种坐标的残缺回复，以最后出现的键为准
+        :param line: bytes 不含 \\n 的一行
+        :param timestamp: float 记录的时间戳
+        :return: JointRecord / CartesianRecord，不是坐标行时返回 None
+        """
+        index = line.rfind(b'J1=')
+        if index >= 0 and index > line.rfind(b'X='):
+            values = _parse_values(line[index:], JOINT_KEYS)
+            if values is None:
+                return None
+            values.append(time.perf_counter() if timestamp is None else timestamp)
+            self.last_joint = JointRecord._make(values)
+            self.joint_count += 1
+            return self.last_joint
+        index = line.rfind(b'X=')
+        if index >= 0:
+            values = _parse_values(line[index:], CARTESIAN_KEYS)
+            if values is None:
+                return None
+            values.append(time.perf_counter() if timestamp is None else timestamp)
+            self.last_cartesian = CartesianRecord._make(values)
+            self.cartesian_count += 1
+            return self.last_cartesian
+        return None
+
+
+def benchmark(n=20000, chunk_size=17):
+    """
+    与 sanxi_core.extract_coord 的正则表达式解析对比，正则表达式按其最好情况（每次一个完整行）计时
+    :param n: int 坐标行数
+    :param chunk_size: int 流式解析时每次输入的字节数，模拟任意切分的串口数据
+    :return: dict {'regex': 每行耗时(秒), 'stream': 每行耗时(秒)}
+    """
+    from sanxi_core import extract_coord
+    lines = []
+    for i in range(n):
+        if i % 2:
+            lines.append('J1={0:.3f} J2=-12.500 J3=30.250 J4=0.000 J5=45.125 J6={0:.3f}\r\n'.format(i * 0.01))
+        else:
+            lines.append('X={0:.3f} Y=120.500 Z=300.000 A=0.000 B=90.000 C=0.000 D=0.000\r\n'.format(i * 0.01))
+    start_time = time.perf_counter()
+    for line in lines:
+        extract_coord(line)
+    regex_time = (time.perf_counter() - start_time) / n
+    stream = ''.join(lines).encode()
+    chunks = [stream[i:i + chunk_size] for i in range(0, len(stream), chunk_size)]
+    parser = CoordStreamParser()
+    count = 0
+    start_time = time.perf_counter()
+    for chunk in chunks:
+        count += len(parser.feed(chunk))
+    stream_time = (time.perf_counter() - start_time) / n
+    assert count == n
+    return {'regex': regex_time, 'stream': stream_time}
+
+
+if __name__ == '__main__':
+    for size in (17, 64, 4096):
+        result = benchmark(chunk_size=size)
+        print('chunk {:>5} bytes   regex {:6.2f} us/line   stream {:6.2f} us/line'.format(
+            size, result['regex'] * 1e6, result['stream'] * 1e6))
@@ -1,201 +1,356 @@
-"""
-This module includes the core functions of Geomagic touch haptic device.
-Class:  GeoTouch
-Methods:    hd_init_device(self, config_name = '')
-            hd_get_current_device(self)
-
-            hd_start_scheduler(self)
-            hd_stop_scheduler(self)
-            hd_schedule_synchronous(self, hd_callback_func)
-            hd_schedule_asynchronous(self, hd_callback_func):
-
-            hd_begin_frame(self, geo_touch_handle)
-            hd_end_frame(self, geo_touch_handle)
-
-            hd_get_current_position_double(self)
-            hd_get_current_gimbal_angles_double(self, mode='deg')
-            hd_get_current_joint_angles_double(self, mode='deg')
-            hd_get_current_buttons(self)
-            hd_get_current_velocity_double(self)  # 该方法尚有bug
-"""
-
-
-import threading
-import time
-from ctypes import *
-
-
-HHD = c_uint
-HDdouble = c_double
-HDint = c_int
-HDushort = c_ushort
-HDboolean = c_ubyte
-HDfloat = c_float
-HDCallbackCode = c_uint
-HDlong = c_long
-HDerror = c_uint
-type_HDdouble_array_3 = HDdouble * 3  # ctypes数组
-type_HDfloat_array_3 = HDfloat * 3
-type_HDdouble_array_10 = HDdouble * 10
-
-
-class GeoTouchLower(object):
-    def __init__(self):
-
-        super(GeoTouchLower, self).__init__()
-
-        self.rad_to_deg = 57.29578
-        self.geo_touch_dll = windll.LoadLibrary('hd.dll')  # 加载 hd.dll动态库
-        self.callback_flag = False  # 回调函数执行标志 False: 不执行  True: 可执行
-        self.schedule_thread = threading.Thread(target=self.__schedule_thread_func, name='Schedule_Thread')
-        # touch设备状态参数
-        self.touch_handle = -1
-        self.touch_current_position = [0, 0, 0]
-        self.touch_current_gimbal_angles = [0, 0, 0]
-        self.touch_current_joint_angles = [0, 0, 0]
-        self.touch_button_state = 0
-        # 约定ctypes函数参数
-        self.geo_touch_dll.hdGetDoublev.argvtypes = [c_uint, POINTER(HDdouble)]
-        self.geo_touch_dll.hdGetIntegerv.argvtypes = [c_uint, POINTER(HDint)]
-        self.geo_touch_dll.hdGetBooleanv.argvtypes = [c_uint, POINTER(HDboolean)]
-
-    def hd_init_device(self, config_name=''):
-        """
-        初始化设备 Geomagic touch
-        :param config_name: string 默认值='Default Device' 或 空字符
-        :return: HHD 设备句柄
-        """
-        self.geo_touch_dll.hdInitDevice.argtype = c_char_p
-        self.geo_touch_dll.hdInitDevice.restype = HHD
-        return self.geo_touch_dll.hdInitDevice(config_name.encode())
-
-    def hd_schedule_synchronous(self, hd_callback_func, params=c_uint(0), priority=50000):
-        """
-        部署一个同步任务，传入一个ctypes回调函数
-        :param hd_callback_func: 回调函数——用装饰器 @CFUNCTYPE(HDCallbackCode)装饰——第一个参数为返回值，后面参数为传入参数
-        :param priority: uint 优先级 默认值30000
-        :return: None
-        """
-        self.geo_touch_dll.hdScheduleSynchronous(hd_callback_func, byref(params), HDushort(priority))
-
-    def hd_schedule_asynchronous(self, hd_callback_func, params=c_uint(0), priority=50000):
-        """
-        部署一个异步任务，传入一个ctypes回调函数
-        :param hd_callback_func: 回调函数——用装饰器 @CFUNCTYPE(HDCallbackCode)装饰——第一个参数为返回值，后面参数为传入参数
-        :param priority: uint 优先级 默认值30000
-        :return: None
-        """
-        self.geo_touch_dll.hdScheduleAsynchronous(hd_callback_func, byref(params), HDushort(priority))
-
-    def hd_start_scheduler(self):
-        """
-        开始一个任务, 及线程
-        :return: None
-        """
-        self.callback_flag = True
-        self.schedule_thread.start()
-
-    #线程目标函数
-    def __schedule_thread_func(self):
-        self.geo_touch_dll.hdStartScheduler()
-        while self.callback_flag:
-            continue
-        self.geo_touch_dll.hdStopScheduler()
-
-    def hd_stop_scheduler(self):
-        """
-        结束一个任务
-        :return: None
-        """
-        self.callback_flag = False
-        self.schedule_thread.join()
-
-    def hd_get_current_device(self):
-        """
-        获取当前设备句柄
-        :return: HHD 设备句柄
-        """
-        self.geo_touch_dll.hdGetCurrentDevice.restype = HHD
-        return self.geo_touch_dll.hdGetCurrentDevice()
-
-    def hd_begin_frame(self, geo_touch_handle):
-        """
-        开始一帧，帧内数据采集、设置等状态相关操作
-        :param geo_touch_handle: 传入要开始一帧的设备句柄
-        :return: None
-        """
-        self.geo_touch_dll.hdBeginFrame.argtype = HHD
-        self.geo_touch_dll.hdBeginFrame(geo_touch_handle)
-
-    def hd_end_frame(self, geo_touch_handle):
-        """
-        结束一帧，该帧状态采集、设置等操作结束
-        :param geo_touch_handle: 传入要关闭一帧的设备句柄
-        :return: None
-        """
-        self.geo_touch_dll.hdEndFrame.argtype = HHD
-        self.geo_touch_dll.hdEndFrame(geo_touch_handle)
-
-    # 笔记：如何给ctypes函数传入数组变量——引用或指针均可
-    def hd_get_current_position(self):
-        """
-        获取当前帧的位置
-        :return: 3 double元素的list=[x, y, z]，单位——毫米
-        """
-        position_array = type_HDdouble_array_3(0, 0, 0)
-        self.geo_touch_dll.hdGetDoublev(0x2050, position_array)
-        return [position_array[0], position_array[1], position_array[2]]
-
-    # def hd_get_current_velocity(self):
-    #     """
-    #     获取当前帧的速度, 该方法尚有bug
-    #     :return: 3 float元素的list=[x, y, z]，单位——mm/s
-    #     """
-    #     velocity_array = type_HDdouble_array_3(0, 0, 0)
-    #     self.geo_touch_dll.hdGetDoublev(0x2051, velocity_array)
-    #     return [velocity_array[0], velocity_array[1], velocity_array[2]]
-
-    def hd_get_current_joint_angles(self, mode='deg'):
-        """
-        获取当前帧的本体关节角度值
-        :param mode: 设定返回值类型弧度或角度（默认deg） mode='deg' or 'rad'
-        :return: 3 float元素的list=[x, y, z]，单位——rad or degree
-        """
-        joint_angles_array = type_HDdouble_array_3(0, 0, 0)
-        self.geo_touch_dll.hdGetDoublev(0x2100, joint_angles_array)
-        if mode == 'rad':
-            return [joint_angles_array[0], joint_angles_array[1], joint_angles_array[2]]
-        elif mode == 'deg':
-            joint_angles = []
-            for i in range(0, 3):
-                joint_angles.append(joint_angles_array[i] * self.rad_to_deg)
-            return joint_angles
-        return None
-
-    def hd_get_current_gimbal_angles(self, mode = 'deg'):
-        """
-        获取当前帧的万向节角度值
-        :param mode: 设定返回值类型弧度或角度（默认deg） mode='deg' or 'rad'
-        :return: 3 float元素的list=[x, y, z]，单位——rad or degree
-        """
-        gimbal_angles_array = type_HDdouble_array_3(0, 0, 0)
-        self.geo_touch_dll.hdGetDoublev(0x2150, gimbal_angles_array)
-        if mode == 'rad':
-            return [gimbal_angles_array[0], gimbal_angles_array[1], gimbal_angles_array[2]]
-        elif mode == 'deg':
-            gimbal_angles = []
-            for i in range(0, 3):
-                gimbal_angles.append(gimbal_angles_array[i] * self.rad_to_deg)
-            return gimbal_angles
-        else:
-            return None
-
-    # 笔记：如何给ctypes函数传入一个指针变量
-    def hd_get_current_buttons(self):
-        """
-        获取当前帧按钮状态
-        :return: int  0-均未被按下   1-深色按钮按下    2-浅色按钮按下    3-均被按下
-        """
-        n_buttons = c_int(0)  # 先创建一个ctypes对象
-        self.geo_touch_dll.hdGetIntegerv(0x2000, byref(n_buttons))  # 然后再将该对象的引用byref 或指针pointer传入ctypes函数
-        return n_buttons.value
\ No newline at end of file
+"""
+This module includes the core functions of Geomagic touch haptic device.
+Class:  GeoTouch
+Methods:    hd_init_device(self, config_name = '')
+            hd_get_current_device(self)
+
+            hd_start_scheduler(self)
+            hd_stop_scheduler(self)
+            hd_schedule_synchronous(self, hd_callback_func)
+            hd_schedule_asynchronous(self, hd_callback_func):
+
+            hd_begin_frame(self, geo_touch_handle)
+            hd_end_frame(self, geo_touch_handle)
+
+            hd_get_current_position_double(self)
+            hd_get_current_gimbal_angles_double(self, mode='deg')
+            hd_get_current_joint_angles_double(self, mode='deg')
+            hd_get_current_buttons(self)
+            hd_get_current_velocity_double(self)  # 该方法尚有bug
+Class:  TouchState
+            ctypes structure of one servo frame shared under a sequence counter (seqlock).
+Class:  TouchSampler
+            An asynchronous servo callback that samples position, gimbal angles, joint angles and buttons on every
+            scheduler tick (1 kHz). hdGetDoublev writes directly into a TouchState, whose frame is then copied into a
+            preallocated NumPy ring buffer; snapshot() copies all fields of the newest frame without locking the
+            servo thread, the ring keeps the history.
+Methods:    start(self)  stop(self)  snapshot(self, out=None)  latest(self, out=None)  since(self, mark)
+"""
+
+
+import threading
+import time
+from ctypes import *
+
+import numpy
+
+
+HHD = c_uint
+HDdouble = c_double
+HDint = c_int
+HDushort = c_ushort
+HDboolean = c_ubyte
+HDfloat = c_float
+HDCallbackCode = c_uint
+HDlong = c_long
+HDerror = c_uint
+type_HDdouble_array_3 = HDdouble * 3  # ctypes数组
+type_HDfloat_array_3 = HDfloat * 3
+type_HDdouble_array_10 = HDdouble * 10
+HD_CALLBACK_DONE = 0  # 回调函数返回值：结束
+HD_CALLBACK_CONTINUE = 1  # 回调函数返回值：下一个伺服周期继续执行
+HD_CURRENT_BUTTONS = 0x2000
+HD_CURRENT_POSITION = 0x2050
+HD_CURRENT_JOINT_ANGLES = 0x2100
+HD_CURRENT_GIMBAL_ANGLES = 0x2150
+# TouchSampler 环形缓冲区每行的列：时刻(time.perf_counter) 位置xyz(mm) 万向节角(rad) 本体关节角(rad) 按钮
+SAMPLE_TIME = 0
+SAMPLE_POSITION = slice(1, 4)
+SAMPLE_GIMBAL = slice(4, 7)
+SAMPLE_JOINT = slice(7, 10)
+SAMPLE_BUTTONS = 10
+SAMPLE_WIDTH = 11
+
+
+class TouchState(Structure):
+    """
+    伺服回调与控制循环共享的触觉设备状态，由 sequence 保护（顺序锁）：
+    写入前 sequence 加一成为奇数，各字段写完后再加一成为偶数；读者复制前后 sequence 相同且为偶数时，复制的各字段属于同一帧
+    timestamp 至 joint_angles 的排列与 TouchSampler 环形缓冲区一行的 SAMPLE_TIME 至 SAMPLE_JOINT 列相同
+    """
+    _fields_ = [('sequence', c_uint64),
+                ('buttons', HDint),
+                ('timestamp', HDdouble),  # time.perf_counter()
+                ('position', type_HDdouble_array_3),  # 单位mm
+                ('gimbal_angles', type_HDdouble_array_3),  # 单位rad
+                ('joint_angles', type_HDdouble_array_3)]  # 单位rad
+
+
+class GeoTouchLower(object):
+    def __init__(self):
+
+        super(GeoTouchLower, self).__init__()
+
+        self.rad_to_deg = 57.29578
+        self.geo_touch_dll = windll.LoadLibrary('hd.dll')  # 加载 hd.dll动态库
+        self.callback_flag = False  # 回调函数执行标志 False: 不执行  True: 可执行
+        self.schedule_thread = threading.Thread(target=self.__schedule_thread_func, name='Schedule_Thread')
+        # touch设备状态参数
+        self.touch_handle = -1
+        self.touch_current_position = [0, 0, 0]
+        self.touch_current_gimbal_angles = [0, 0, 0]
+        self.touch_current_joint_angles = [0, 0, 0]
+        self.touch_button_state = 0
+        # 约定ctypes函数参数
+        self.geo_touch_dll.hdGetDoublev.argvtypes = [c_uint, POINTER(HDdouble)]
+        self.geo_touch_dll.hdGetIntegerv.argvtypes = [c_uint, POINTER(HDint)]
+        self.geo_touch_dll.hdGetBooleanv.argvtypes = [c_uint, POINTER(HDboolean)]
+
+    def hd_init_device(self, config_name=''):
+        """
+        初始化设备 Geomagic touch
+        :param config_name: string 默认值='Default Device' 或 空字符
+        :return: HHD 设备句柄
+        """
+        self.geo_touch_dll.hdInitDevice.argtype = c_char_p
+        self.geo_touch_dll.hdInitDevice.restype = HHD
+        return self.geo_touch_dll.hdInitDevice(config_name.encode())
+
+    def hd_schedule_synchronous(self, hd_callback_func, params=c_uint(0), priority=50000):
+        """
+        部署一个同步任务，传入一个ctypes回调函数
+        :param hd_callback_func: 回调函数——用装饰器 @CFUNCTYPE(HDCallbackCode)装饰——第一个参数为返回值，后面参数为传入参数
+        :param priority: uint 优先级 默认值30000
+        :return: None
+        """
+        self.geo_touch_dll.hdScheduleSynchronous(hd_callback_func, byref(params), HDushort(priority))
+
+    def hd_schedule_asynchronous(self, hd_callback_func, params=c_uint(0), priority=50000):
+        """
+        部署一个异步任务，传入一个ctypes回调函数
+        :param hd_callback_func: 回调函数——用装饰器 @CFUNCTYPE(HDCallbackCode)装饰——第一个参数为返回值，后面参数为传入参数
+        :param priority: uint 优先级 默认值30000
+        :return: None
+        """
+        self.geo_touch_dll.hdScheduleAsynchronous(hd_callback_func, byref(params), HDushort(priority))
+
+    def hd_start_scheduler(self):
+        """
+        开始一个任务, 及线程
+        :return: None
+        """
+        self.callback_flag = True
+        self.schedule_thread.start()
+
+    #线程目标函数
+    def __schedule_thread_func(self):
+        self.geo_touch_dll.hdStartScheduler()
+        while self.callback_flag:
+            continue
+        self.geo_touch_dll.hdStopScheduler()
+
+    def hd_stop_scheduler(self):
+        """
+        结束一个任务
+        :return: None
+        """
+        self.callback_flag = False
+        self.schedule_thread.join()
+
+    def hd_get_current_device(self):
+        """
+        获取当前设备句柄
+        :return: HHD 设备句柄
+        """
+        self.geo_touch_dll.hdGetCurrentDevice.restype = HHD
+        return self.geo_touch_dll.hdGetCurrentDevice()
+
+    def hd_begin_frame(self, geo_touch_handle):
+        """
+        开始一帧，帧内数据采集、设置等状态相关操作
+        :param geo_touch_handle: 传入要开始一帧的设备句柄
+        :return: None
+        """
+        self.geo_touch_dll.hdBeginFrame.argtype = HHD
+        self.geo_touch_dll.hdBeginFrame(geo_touch_handle)
+
+    def hd_end_frame(self, geo_touch_handle):
+        """
+        结束一帧，该帧状态采集、设置等操作结束
+        :param geo_touch_handle: 传入要关闭一帧的设备句柄
+        :return: None
+        """
+        self.geo_touch_dll.hdEndFrame.argtype = HHD
+        self.geo_touch_dll.hdEndFrame(geo_touch_handle)
+
+    # 笔记：如何给ctypes函数传入数组变量——引用或指针均可
+    def hd_get_current_position(self):
+        """
+        获取当前帧的位置
+        :return: 3 double元素的list=[x, y, z]，单位——毫米
+        """
+        position_array = type_HDdouble_array_3(0, 0, 0)
+        self.geo_touch_dll.hdGetDoublev(0x2050, position_array)
+        return [position_array[0], position_array[1], position_array[2]]
+
+    # def hd_get_current_velocity(self):
+    #     """
+    #     获取当前帧的速度, 该方法尚有bug
+    #     :return: 3 float元素的list=[x, y, z]，单位——mm/s
+    #     """
+    #     velocity_array = type_HDdouble_array_3(0, 0, 0)
+    #     self.geo_touch_dll.hdGetDoublev(0x2051, velocity_array)
+    #     return [velocity_array[0], velocity_array[1], velocity_array[2]]
+
+    def hd_get_current_joint_angles(self, mode='deg'):
+        """
+        获取当前帧的本体关节角度值
+        :param mode: 设定返回值类型弧度或角度（默认deg） mode='deg' or 'rad'
+        :return: 3 float元素的list=[x, y, z]，单位——rad or degree
+        """
+        joint_angles_array = type_HDdouble_array_3(0, 0, 0)
+        self.geo_touch_dll.hdGetDoublev(0x2100, joint_angles_array)
+        if mode == 'rad':
+            return [joint_angles_array[0], joint_angles_array[1], joint_angles_array[2]]
+        elif mode == 'deg':
+            joint_angles = []
+            for i in range(0, 3):
+                joint_angles.append(joint_angles_array[i] * self.rad_to_deg)
+            return joint_angles
+        return None
+
+    def hd_get_current_gimbal_angles(self, mode = 'deg'):
+        """
+        获取当前帧的万向节角度值
+        :param mode: 设定返回值类型弧度或角度（默认deg） mode='deg' or 'rad'
+        :return: 3 float元素的list=[x, y, z]，单位——rad or degree
+        """
+        gimbal_angles_array = type_HDdouble_array_3(0, 0, 0)
+        self.geo_touch_dll.hdGetDoublev(0x2150, gimbal_angles_array)
+        if mode == 'rad':
+            return [gimbal_angles_array[0], gimbal_angles_array[1], gimbal_angles_array[2]]
+        elif mode == 'deg':
+            gimbal_angles = []
+            for i in range(0, 3):
+                gimbal_angles.append(gimbal_angles_array[i] * self.rad_to_deg)
+            return gimbal_angles
+        else:
+            return None
+
+    # 笔记：如何给ctypes函数传入一个指针变量
+    def hd_get_current_buttons(self):
+        """
+        获取当前帧按钮状态
+        :return: int  0-均未被按下   1-深色按钮按下    2-浅色按钮按下    3-均被按下
+        """
+        n_buttons = c_int(0)  # 先创建一个ctypes对象
+        self.geo_touch_dll.hdGetIntegerv(0x2000, byref(n_buttons))  # 然后再将该对象的引用byref 或指针pointer传入ctypes函数
+        return n_buttons.value
+
+
+class TouchSampler(object):
+    def __init__(self, geo_touch, capacity=1024):
+        """
+        :param geo_touch: GeoTouchLower
+        :param capacity: int 环形缓冲区的行数，1kHz 下 1024 行约为最近 1 秒
+        """
+        super(TouchSampler, self).__init__()
+        self.__geo_touch = geo_touch
+        self.__dll = geo_touch.geo_touch_dll
+        self.capacity = capacity
+        self.ring = numpy.zeros((capacity, SAMPLE_WIDTH))  # 预分配，只由伺服回调写入
+        self.count = 0  # 已写入的总行数，整行写完后才增加，读者据此判断哪些行已完整
+        self.state = TouchState()  # 最新一帧，以顺序锁保护，见 snapshot()
+        self.__run_flag = False
+        # 预先取好各字段的地址，回调中 hdGetDoublev 直接写入 state，再整段复制到环形缓冲区，不创建新的数组
+        state_address = addressof(self.state)
+        self.__position = cast(state_address + TouchState.position.offset, POINTER(HDdouble))
+        self.__gimbal_angles = cast(state_address + TouchState.gimbal_angles.offset, POINTER(HDdouble))
+        self.__joint_angles = cast(state_address + TouchState.joint_angles.offset, POINTER(HDdouble))
+        self.__buttons = cast(state_address + TouchState.buttons.offset, POINTER(HDint))
+        self.__state_address = state_address
+        self.__frame_address = state_address + TouchState.timestamp.offset
+        self.__frame_size = TouchState.joint_angles.offset + sizeof(type_HDdouble_array_3) - TouchState.timestamp.offset
+        self.__row_addresses = [self.ring.ctypes.data + i * self.ring.strides[0] + SAMPLE_TIME * self.ring.itemsize
+                                for i in range(capacity)]
+        self.callback = CFUNCTYPE(HDCallbackCode)(self.__servo_callback)  # 保持引用，防止被回收
+
+    def start(self):
+        """
+        部署异步伺服回调，调度器运行期间每个伺服周期执行一次，可在 hd_start_scheduler() 之前或之后调用
+        :return: None
+        """
+        if self.__run_flag:
+            return
+        self.__run_flag = True
+        self.__geo_touch.hd_schedule_asynchronous(self.callback)
+
+    def stop(self):
+        """
+        回调在下一个伺服周期返回 HD_CALLBACK_DONE 后不再执行
+        :return: None
+        """
+        self.__run_flag = False
+
+    # 伺服回调函数，在调度器线程中执行
+    def __servo_callback(self):
+        if not self.__run_flag:
+            return HD_CALLBACK_DONE
+        dll = self.__dll
+        state = self.state
+        index = self.count % self.capacity
+        handle = dll.hdGetCurrentDevice()
+        dll.hdBeginFrame(handle)
+        state.sequence += 1  # 奇数：写入中
+        dll.hdGetDoublev(HD_CURRENT_POSITION, self.__position)
+        dll.hdGetDoublev(HD_CURRENT_GIMBAL_ANGLES, self.__gimbal_angles)
+        dll.hdGetDoublev(HD_CURRENT_JOINT_ANGLES, self.__joint_angles)
+        dll.hdGetIntegerv(HD_CURRENT_BUTTONS, self.__buttons)
+        state.timestamp = time.perf_counter()
+        state.sequence += 1  # 偶数：本帧完整
+        dll.hdEndFrame(handle)
+        memmove(self.__row_addresses[index], self.__frame_address, self.__frame_size)
+        self.ring[index, SAMPLE_BUTTONS] = state.buttons
+        self.count += 1  # 发布本行
+        return HD_CALLBACK_CONTINUE
+
+    def snapshot(self, out=None):
+        """
+        不加锁地复制一份一致的最新状态，各字段保证来自同一伺服帧
+        :param out: TouchState 结果写入其中，None 表示新建
+        :return: TouchState，尚无数据时 sequence 为 0
+        """
+        if out is None:
+            out = TouchState()
+        state = self.state
+        out_address = addressof(out)
+        while True:
+            sequence = state.sequence
+            if sequence & 1:
+                time.sleep(0)  # 伺服回调正在写入，让出GIL
+                continue
+            memmove(out_address, self.__state_address, sizeof(TouchState))
+            if state.sequence == sequence:
+                return out
+
+    def latest(self, out=None):
+        """
+        不加锁地读取最新的一行
+        :param out: numpy.ndarray 长度 SAMPLE_WIDTH，结果写入其中，None 表示新建
+        :return: numpy.ndarray 按 SAMPLE_* 列排列的一行，尚无数据时为 None
+        """
+        while True:
+            count = self.count
+            if count == 0:
+                return None
+            if out is None:
+                out = numpy.empty(SAMPLE_WIDTH)
+            out[:] = self.ring[(count - 1) % self.capacity]
+            # 写入者只写第 count 行，复制期间超前不到一圈时本行未被覆盖
+            if self.count - count < self.capacity - 1:
+                return out
+
+    def since(self, mark):
+        """
+        读取 mark 之后写入的全部行，最多 capacity - 1 行，更早的行已被覆盖
+        :param mark: int 上一次返回的 count
+        :return: (numpy.ndarray N×SAMPLE_WIDTH 按时间顺序, int 新的 mark)
+        """
+        count = self.count
+        first = max(mark, count - self.capacity + 1)
+        rows = self.ring[numpy.arange(first, count) % self.capacity]
+        if self.count - first >= self.capacity:
+            # 复制期间最早的行被覆盖，丢弃
+            overwritten = self.count - first - self.capacity + 1
+            rows = rows[overwritten:]
+        return rows, count
@@ -0,0 +1,288 @@
+"""
+This module includes the forward and inverse kinematics of the 6-axis SANXI arm in NumPy
+Class: Kinematics keeps a standard Denavit-Hartenberg table and computes, for a whole batch of poses at once,
+         forward kinematics (N×6 joint angles -> N×6 X Y Z A B C) and damped-least-squares inverse kinematics
+         (N×6 X Y Z A B C -> N×6 joint angles) with the joint limits of limits.JOINT_LIMITS.
+Functions: forward() forward_single() forward_pose() inverse() inverse_pose() residuals() transforms() jacobian()
+Units: X Y Z in mm, joint angles and A B C in degree. A B C are fixed-axis rotations about X, Y, Z (R = Rz(C)·Ry(B)·
+       Rx(A)); D is not a function of J1..J6 and is left unchanged.
+Note: experimental. NOMINAL_DH is an uncalibrated placeholder, not the measured geometry of the SANXI arm, so
+      Kinematics has no default table and Sanxi does not use it; pass dh explicitly, fitted (with the Euler
+      convention) against pose pairs read from the controller with Sanxi.query_pose() and residuals().
+
+Author: Mr SoSimple
+"""
+
+
+import math
+from array import array
+from collections import namedtuple
+
+import numpy
+
+from limits import default_joint_limits
+
+
+# 未标定的示例 DH 参数，每行一个关节：a(mm) alpha(度) d(mm) theta零位偏移(度)，不能当作实物位姿来源
+NOMINAL_DH = ((50.0, -90.0, 280.0, 0.0),
+              (270.0, 0.0, 0.0, -90.0),
+              (70.0, -90.0, 0.0, 0.0),
+              (0.0, 90.0, 300.0, 0.0),
+              (0.0, -90.0, 0.0, 0.0),
+              (0.0, 0.0, 80.0, 0.0))
+# 逆解结果：关节角 N×6，是否收敛，位置误差(mm)，姿态误差(度)，迭代次数
+IKResult = namedtuple('IKResult', ['joints', 'converged', 'position_error', 'orientation_error', 'iterations'])
+
+
+def euler_to_matrix(abc):
+    """
+    :param abc: numpy.ndarray N×3 A B C，单位度
+    :return: numpy.ndarray N×3×3 旋转矩阵 Rz(C)·Ry(B)·Rx(A)
+    """
+    a, b, c = numpy.radians(abc).T
+    ca, sa, cb, sb, cc, sc = numpy.cos(a), numpy.sin(a), numpy.cos(b), numpy.sin(b), numpy.cos(c), numpy.sin(c)
+    rotation = numpy.empty((len(ca), 3, 3))
+    rotation[:, 0, 0] = cc * cb
+    rotation[:, 0, 1] = cc * sb * sa - sc * ca
+    rotation[:, 0, 2] = cc * sb * ca + sc * sa
+    rotation[:, 1, 0] = sc * cb
+    rotation[:, 1, 1] = sc * sb * sa + cc * ca
+    rotation[:, 1, 2] = sc * sb * ca - cc * sa
+    rotation[:, 2, 0] = -sb
+    rotation[:, 2, 1] = cb * sa
+    rotation[:, 2, 2] = cb * ca
+    return rotation
+
+
+def matrix_to_euler(rotation, out):
+    """
+    :param rotation: numpy.ndarray N×3×3
+    :param out: numpy.ndarray N×3 写入 A B C，单位度
+    :return: out
+    """
+    out[:, 0] = numpy.arctan2(rotation[:, 2, 1], rotation[:, 2, 2])
+    out[:, 1] = numpy.arctan2(-rotation[:, 2, 0], numpy.hypot(rotation[:, 0, 0], rotation[:, 1, 0]))
+    out[:, 2] = numpy.arctan2(rotation[:, 1, 0], rotation[:, 0, 0])
+    return numpy.degrees(out, out=out)
+
+
+class Kinematics(object):
+    def __init__(self, dh, limits=None, tool=None):
+        """
+        :param dh: 6×4 DH 参数表，每行 a(mm) alpha(度) d(mm) theta零位偏移(度)，须为按实物标定的参数
+        :param limits: limits.LimitTable 关节限位，逆解结果被截断在限位内，None 表示 limits.JOINT_LIMITS
+        :param tool: numpy.ndarray 4×4 法兰到工具中心点的变换，None 表示单位矩阵
+        """
+        super(Kinematics, self).__init__()
+        dh = numpy.array(dh, dtype=numpy.float64)
+        self.a = dh[:, 0]
+        self.d = dh[:, 2]
+        self.offset = numpy.radians(dh[:, 3])
+        alpha = numpy.radians(dh[:, 1])
+        self.__cos_alpha = numpy.cos(alpha)
+        self.__sin_alpha = numpy.sin(alpha)
+        self.limits = default_joint_limits() if limits is None else limits
+        self.tool = numpy.eye(4) if tool is None else numpy.array(tool, dtype=numpy.float64)
+        # 单个位姿用纯 Python 计算，省去小数组上的 NumPy 调用开销
+        self.__links = [tuple(float(value) for value in link) for link in
+                        zip(self.a, self.d, self.offset, self.__cos_alpha, self.__sin_alpha)]
+        self.__tool_rows = [[float(value) for value in row] for row in self.tool[:3]]
+        self.orientation_weight = 200.0  # 逆解时 1 弧度姿态误差折合的毫米数
+        self.damping = 0.5  # 阻尼系数，奇异位形附近限制步长
+        self.max_step = 10.0  # 每次迭代单个关节的最大步长，单位度
+
+    def transforms(self, joints, frames=False):
+        """
+        :param joints: numpy.ndarray N×6 关节角，单位度
+        :param frames: Bool 是否同时返回各关节轴的位置与方向，供雅可比矩阵使用
+        :return: numpy.ndarray N×4×4 基座到工具的变换；frames 为真时为 (变换, N×6×3 轴原点, N×6×3 轴方向)
+        """
+        theta = numpy.radians(joints) + self.offset
+        cos_theta = numpy.cos(theta)
+        sin_theta = numpy.sin(theta)
+        n = len(theta)
+        # 六个关节的连杆变换一次填好，只有矩阵连乘逐个关节进行
+        links = numpy.empty((n, 6, 4, 4))
+        links[:, :, 0, 0] = cos_theta
+        links[:, :, 0, 1] = -sin_theta * self.__cos_alpha
+        links[:, :, 0, 2] = sin_theta * self.__sin_alpha
+        links[:, :, 0, 3] = self.a * cos_theta
+        links[:, :, 1, 0] = sin_theta
+        links[:, :, 1, 1] = cos_theta * self.__cos_alpha
+        links[:, :, 1, 2] = -cos_theta * self.__sin_alpha
+        links[:, :, 1, 3] = self.a * sin_theta
+        links[:, :, 2, 0] = 0.0
+        links[:, :, 2, 1] = self.__sin_alpha
+        links[:, :, 2, 2] = self.__cos_alpha
+        links[:, :, 2, 3] = self.d
+        links[:, :, 3] = (0.0, 0.0, 0.0, 1.0)
+        transform = links[:, 0]
+        if frames:
+            origins = numpy.zeros((n, 6, 3))
+            axes = numpy.zeros((n, 6, 3))
+            axes[:, 0, 2] = 1.0
+        for i in range(1, 6):
+            if frames:
+                origins[:, i] = transform[:, :3, 3]
+                axes[:, i] = transform[:, :3, 2]
+            transform = numpy.matmul(transform, links[:, i])
+        transform = numpy.matmul(transform, self.tool)
+        if frames:
+            return transform, origins, axes
+        return transform
+
+    def forward(self, joints, out=None):
+        """
+        正解
+        :param joints: array-like N×6（或长度 6 的单点）关节角，单位度
+        :param out: numpy.ndarray N×6 结果写入其中，None 表示新建
+        :return: numpy.ndarray N×6（或长度 6）X Y Z A B C
+        """
+        joints = numpy.asarray(joints, dtype=numpy.float64)
+        single = joints.ndim == 1
+        transform = self.transforms(numpy.atleast_2d(joints))
+        if out is None:
+            out = numpy.empty((len(transform), 6))
+        result = out.reshape(-1, 6)
+        result[:, :3] = transform[:, :3, 3]
+        matrix_to_euler(transform[:, :3, :3], result[:, 3:])
+        return out[0] if single and out.ndim == 2 else out
+
+    def forward_single(self, joints):
+        """
+        单个位姿的正解，结果与 forward() 相同
+        :param joints: 长度 6 的关节角，单位度
+        :return: tuple (X, Y, Z, A, B, C)
+        """
+        r00, r01, r02, px = 1.0, 0.0, 0.0, 0.0
+        r10, r11, r12, py = 0.0, 1.0, 0.0, 0.0
+        r20, r21, r22, pz = 0.0, 0.0, 1.0, 0.0
+        for value, (a, d, offset, ca, sa) in zip(joints, self.__links):
+            theta = math.radians(value) + offset
+            ct = math.cos(theta)
+            st = math.sin(theta)
+            m01, m02, m11, m12, act, ast = -st * ca, st * sa, ct * ca, -ct * sa, a * ct, a * st
+            r00, r01, r02, px = (r00 * ct + r01 * st, r00 * m01 + r01 * m11 + r02 * sa,
+                                 r00 * m02 + r01 * m12 + r02 * ca, r00 * act + r01 * ast + r02 * d + px)
+            r10, r11, r12, py = (r10 * ct + r11 * st, r10 * m01 + r11 * m11 + r12 * sa,
+                                 r10 * m02 + r11 * m12 + r12 * ca, r10 * act + r11 * ast + r12 * d + py)
+            r20, r21, r22, pz = (r20 * ct + r21 * st, r20 * m01 + r21 * m11 + r22 * sa,
+                                 r20 * m02 + r21 * m12 + r22 * ca, r20 * act + r21 * ast + r22 * d + pz)
+        (t00, t01, t02, tx), (t10, t11, t12, ty), (t20, t21, t22, tz) = self.__tool_rows
+        px, py, pz = (r00 * tx + r01 * ty + r02 * tz + px, r10 * tx + r11 * ty + r12 * tz + py,
+                      r20 * tx + r21 * ty + r22 * tz + pz)
+        r00, r10, r20, r21, r22 = (r00 * t00 + r01 * t10 + r02 * t20, r10 * t00 + r11 * t10 + r12 * t20,
+                                   r20 * t00 + r21 * t10 + r22 * t20, r20 * t01 + r21 * t11 + r22 * t21,
+                                   r20 * t02 + r21 * t12 + r22 * t22)
+        return (px, py, pz, math.degrees(math.atan2(r21, r22)),
+                math.degrees(math.atan2(-r20, math.hypot(r00, r10))), math.degrees(math.atan2(r10, r00)))
+
+    def forward_pose(self, joint_pose, out):
+        """
+        由关节坐标计算直角坐标，不访问串口
+        :param joint_pose: pose.JointPose
+        :param out: pose.CartesianPose 原地写入 X..C，D 不变，时间戳与有效标志取自 joint_pose
+        :return: out
+        """
+        out.values[0:6] = array('d', self.forward_single(joint_pose.values))
+        out.timestamp = joint_pose.timestamp
+        out.valid = joint_pose.valid
+        return out
+
+    def jacobian(self, joints):
+        """
+        几何雅可比矩阵
+        :param joints: numpy.ndarray N×6 关节角，单位度
+        :return: (numpy.ndarray N×6×6 前三行线速度 mm/rad、后三行角速度 rad/rad, numpy.ndarray N×4×4 变换)
+        """
+        transform, origins, axes = self.transforms(joints, True)
+        end = transform[:, None, :3, 3]
+        jacobian = numpy.empty((len(joints), 6, 6))
+        jacobian[:, :3] = numpy.cross(axes, end - origins).transpose(0, 2, 1)
+        jacobian[:, 3:] = axes.transpose(0, 2, 1)
+        return jacobian, transform
+
+    def inverse(self, targets, seed=None, max_iter=100, tolerance=0.01, angle_tolerance=0.01):
+        """
+        阻尼最小二乘逆解，整批同时迭代，已收敛的位姿不再更新；每次迭代后截断到关节限位
+        :param targets: array-like N×6（或长度 6 的单点）X Y Z A B C，多余的列（如 D）忽略
+        :param seed: array-like N×6 或长度 6 的初值，一般为当前关节坐标，None 表示全零
+        :param max_iter: int 最大迭代次数
+        :param tolerance: float 位置收敛阈值，单位mm
+        :param angle_tolerance: float 姿态收敛阈值，单位度
+        :return: IKResult 单点输入时各字段也是单点
+        """
+        targets = numpy.asarray(targets, dtype=numpy.float64)
+        single = targets.ndim == 1
+        targets = numpy.atleast_2d(targets)
+        n = len(targets)
+        joints = numpy.zeros((n, 6))
+        if seed is not None:
+            joints[:] = seed
+        target_position = targets[:, :3]
+        target_rotation = euler_to_matrix(targets[:, 3:6])
+        weight = self.orientation_weight
+        damping = numpy.eye(6) * self.damping ** 2
+        active = numpy.arange(n)
+        position_error = numpy.zeros(n)
+        orientation_error = numpy.zeros(n)
+        iterations = 0
+        while True:
+            jacobian, transform = self.jacobian(joints[active])
+            rotation = transform[:, :3, :3]
+            error = numpy.empty((len(active), 6))
+            error[:, :3] = target_position[active] - transform[:, :3, 3]
+            error[:, 3:] = 0.5 * numpy.cross(rotation, target_rotation[active], axis=1).sum(axis=2)
+            position_error[active] = numpy.sqrt((error[:, :3] ** 2).sum(axis=1))
+            orientation_error[active] = numpy.degrees(numpy.sqrt((error[:, 3:] ** 2).sum(axis=1)))
+            done = (position_error[active] <= tolerance) & (orientation_error[active] <= angle_tolerance)
+            keep = ~done
+            active = active[keep]
+            if not len(active) or iterations >= max_iter:
+                break
+            iterations += 1
+            jacobian = jacobian[keep]
+            jacobian[:, 3:] *= weight
+            error = error[keep]
+            error[:, 3:] *= weight
+            # dq = J^T (J J^T + λ²I)^-1 e
+            jacobian_t = jacobian.transpose(0, 2, 1)
+            step = numpy.matmul(jacobian_t, numpy.linalg.solve(numpy.matmul(jacobian, jacobian_t) + damping,
+                                                               error[:, :, None]))[:, :, 0]
+            step = numpy.degrees(step)
+            numpy.clip(step, -self.max_step, self.max_step, out=step)
+            updated = joints[active] + step
+            self.limits.check(updated, out=updated)
+            joints[active] = updated
+        converged = numpy.ones(n, dtype=bool)
+        converged[active] = False
+        if single:
+            return IKResult(joints[0], bool(converged[0]), float(position_error[0]), float(orientation_error[0]),
+                            iterations)
+        return IKResult(joints, converged, position_error, orientation_error, iterations)
+
+    def inverse_pose(self, cartesian_pose, seed_pose, out, **kwargs):
+        """
+        由直角坐标目标计算关节目标，不访问串口
+        :param cartesian_pose: pose.CartesianPose 目标
+        :param seed_pose: pose.JointPose 初值，一般为当前关节坐标
+        :param out: pose.JointPose 原地写入，未收敛时不修改
+        :param kwargs: 传给 inverse() 的收敛参数
+        :return: IKResult
+        """
+        result = self.inverse(cartesian_pose.as_array()[:6], seed_pose.as_array(), **kwargs)
+        if result.converged:
+            out.set(result.joints, cartesian_pose.timestamp)
+        return result
+
+    def residuals(self, joints, rects):
+        """
+        模型与控制器的偏差，用于检查或标定 DH 参数
+        :param joints: array-like N×6 控制器返回的关节坐标
+        :param rects: array-like N×6（或 N×7）同一时刻控制器返回的直角坐标
+        :return: numpy.ndarray N×6 正解结果减去控制器直角坐标，姿态差已折算到 [-180, 180)
+        """
+        rects = numpy.atleast_2d(numpy.asarray(rects, dtype=numpy.float64))
+        difference = numpy.atleast_2d(self.forward(joints)) - rects[:, :6]
+        difference[:, 3:] = (difference[:, 3:] + 180.0) % 360.0 - 180.0
+        return difference
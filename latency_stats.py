@@ -0,0 +1,189 @@
+"""
+This module includes low-overhead latency statistics for the serial command path
+Class: LatencyHistogram is an HDR-style log-linear histogram of durations with about 1.6% relative precision and
+         O(1) recording into a preallocated bucket array.
+       CommandStats keeps per-command-type counters and histograms: bytes written, bytes read, time to first byte,
+         time to full reply, time queued before the write and time spent sleeping, which can be snapshotted or
+         dumped at runtime.
+Functions: LatencyHistogram  record() percentile() snapshot() reset()
+           CommandStats  record_request() record_sleep() snapshot() dump() reset()
+
+Author: Mr SoSimple
+"""
+
+
+import sys
+import threading
+from array import array
+
+
+class LatencyHistogram(object):
+    SUB_BITS = 7  # 每个数量级内的线性子桶数为 2^(SUB_BITS-1)，相对误差 < 1/64
+
+    def __init__(self, max_seconds=60.0):
+        """
+        :param max_seconds: float 可记录的最大时长，超出的值计入最高桶
+        """
+        super(LatencyHistogram, self).__init__()
+        self.__max_us = int(max_seconds * 1e6)
+        self.__counts = array('l', [0] * (self.__index_of(self.__max_us) + 1))
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def __index_of(self, value_us):
+        msb = value_us.bit_length()
+        if msb <= self.SUB_BITS:
+            return value_us
+        shift = msb - self.SUB_BITS
+        return (shift << (self.SUB_BITS - 1)) + (value_us >> shift)
+
+    def __value_of(self, index):
+        """
+        桶的下界，单位微秒
+        """
+        if index < (1 << self.SUB_BITS):
+            return index
+        shift = (index >> (self.SUB_BITS - 1)) - 1
+        return (index - (shift << (self.SUB_BITS - 1))) << shift
+
+    def record(self, seconds):
+        """
+        记录一个时长
+        :param seconds: float 单位秒
+        :return: None
+        """
+        value_us = min(max(int(seconds * 1e6), 0), self.__max_us)
+        self.__counts[self.__index_of(value_us)] += 1
+        self.count += 1
+        self.total += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, p):
+        """
+        :param p: float 百分位，0~100
+        :return: float 单位秒，无数据时返回 None
+        """
+        if self.count == 0:
+            return None
+        target = max(1, int(round(self.count * p / 100.0)))
+        seen = 0
+        for index, n in enumerate(self.__counts):
+            seen += n
+            if seen >= target:
+                return min(self.__value_of(index) / 1e6, self.max)
+        return self.max
+
+    def mean(self):
+        if self.count == 0:
+            return None
+        return self.total / self.count
+
+    def snapshot(self):
+        """
+        :return: dict 统计摘要，时间单位秒
+        """
+        return {'count': self.count, 'min': self.min, 'mean': self.mean(), 'p50': self.percentile(50),
+                'p90': self.percentile(90), 'p99': self.percentile(99), 'max': self.max}
+
+    def reset(self):
+        for i in range(len(self.__counts)):
+            self.__counts[i] = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+
+class CommandStats(object):
+    def __init__(self):
+        super(CommandStats, self).__init__()
+        self.__lock = threading.Lock()
+        self.__entries = {}  # {命令类型: dict}
+
+    def __entry(self, command_type):
+        entry = self.__entries.get(command_type)
+        if entry is None:
+            entry = {'count': 0, 'timeouts': 0, 'bytes_written': 0, 'bytes_read': 0,
+                     'first_byte': LatencyHistogram(), 'full_reply': LatencyHistogram(),
+                     'queue_wait': LatencyHistogram(), 'sleep': LatencyHistogram()}
+            self.__entries[command_type] = entry
+        return entry
+
+    def record_request(self, command_type, bytes_written, bytes_read, first_byte, full_reply, complete=True,
+                       queue_wait=None):
+        """
+        记录一次命令往返
+        :param command_type: str 命令类型，例如 'G21' 'freeze'
+        :param bytes_written: int 写出字节数
+        :param bytes_read: int 读到字节数
+        :param first_byte: float 发送到收到第一个字节的时间，未收到时为 None，单位秒
+        :param full_reply: float 发送到收到完整回复（或超时）的时间，单位秒
+        :param complete: Bool 是否收到完整回复帧，False 表示超时
+        :param queue_wait: float 从提交到写出在队列中等待的时间，单位秒
+        :return: None
+        """
+        with self.__lock:
+            entry = self.__entry(command_type)
+            entry['count'] += 1
+            entry['bytes_written'] += bytes_written
+            entry['bytes_read'] += bytes_read
+            if first_byte is not None:
+                entry['first_byte'].record(first_byte)
+            entry['full_reply'].record(full_reply)
+            if queue_wait is not None:
+                entry['queue_wait'].record(queue_wait)
+            if not complete:
+                entry['timeouts'] += 1
+
+    def record_sleep(self, command_type, seconds):
+        """
+        记录一次固定延时等待（无回复命令的节拍延时等）
+        """
+        with self.__lock:
+            self.__entry(command_type)['sleep'].record(seconds)
+
+    def snapshot(self):
+        """
+        :return: dict {命令类型: {'count', 'timeouts', 'bytes_written', 'bytes_read',
+                                   'first_byte', 'full_reply', 'queue_wait', 'sleep', 'sleep_total'}}
+        """
+        with self.__lock:
+            result = {}
+            for command_type, entry in self.__entries.items():
+                result[command_type] = {'count': entry['count'], 'timeouts': entry['timeouts'],
+                                        'bytes_written': entry['bytes_written'], 'bytes_read': entry['bytes_read'],
+                                        'first_byte': entry['first_byte'].snapshot(),
+                                        'full_reply': entry['full_reply'].snapshot(),
+                                        'queue_wait': entry['queue_wait'].snapshot(),
+                                        'sleep': entry['sleep'].snapshot(),
+                                        'sleep_total': entry['sleep'].total}
+            return result
+
+    def dump(self, file=None):
+        """
+        以表格形式输出统计，时间单位毫秒
+        :param file: 输出文件对象，默认标准输出
+        :return: None
+        """
+        if file is None:
+            file = sys.stdout
+
+        def ms(value):
+            return '-' if value is None else '{:.3f}'.format(value * 1000)
+        file.write('{:<12}{:>7}{:>6}{:>9}{:>9}{:>10}{:>10}{:>10}{:>10}{:>10}{:>10}\n'.format(
+            'command', 'count', 'tmo', 'tx_bytes', 'rx_bytes', 'ttfb_p50', 'full_p50', 'full_p99', 'full_max',
+            'queue_p99', 'sleep'))
+        for command_type, entry in sorted(self.snapshot().items()):
+            file.write('{:<12}{:>7}{:>6}{:>9}{:>9}{:>10}{:>10}{:>10}{:>10}{:>10}{:>10}\n'.format(
+                command_type, entry['count'], entry['timeouts'], entry['bytes_written'], entry['bytes_read'],
+                ms(entry['first_byte']['p50']), ms(entry['full_reply']['p50']), ms(entry['full_reply']['p99']),
+                ms(entry['full_reply']['max']), ms(entry['queue_wait']['p99']), ms(entry['sleep_total'])))
+
+    def reset(self):
+        with self.__lock:
+            self.__entries.clear()
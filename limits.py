@@ -0,0 +1,128 @@
+"""
+This module includes the joint-limit and workspace tables of SANXI robot, and their validation
+Class: LimitTable keeps the lower/upper bound of every axis, clamps a single target in pure Python, and validates
+         a whole N×6 joint or N×7 rectangular trajectory in one NumPy call, clamping or rejecting it.
+Functions: clamp() clamp_pose() check() violations() set_limit()
+           default_joint_limits() default_workspace_limits()
+Note: J6 has no limit in the controller manual; it is bounded to ±360 degrees (one turn either way), the same bound
+      sanxi_simulator.VirtualSanxi enforces. The workspace is not measured yet, its bounds default to ±inf and can be
+      set with set_limit().
+
+Author: Mr SoSimple
+"""
+
+
+from collections import namedtuple
+
+import numpy
+
+
+INF = float('inf')
+JOINT_KEYS = ('J1', 'J2', 'J3', 'J4', 'J5', 'J6')
+RECT_KEYS = ('X', 'Y', 'Z', 'A', 'B', 'C', 'D')
+# 关节限位，单位度；J6 按正反各一圈限位
+JOINT_LIMITS = {'J1': (-160, 160), 'J2': (-130, 118), 'J3': (-180, 15), 'J4': (-140, 140), 'J5': (-130, 90),
+                'J6': (-360, 360)}
+# 直角坐标工作空间，单位mm / 度
+WORKSPACE_LIMITS = dict([(key, (-INF, INF)) for key in RECT_KEYS])
+# valid: 每个点是否没有越限；violations: 与 values 同形的越限标记；values: 截断后（或原样）的点
+LimitReport = namedtuple('LimitReport', ['values', 'violations', 'valid'])
+
+
+class LimitTable(object):
+    def __init__(self, keys, limits):
+        """
+        :param keys: tuple of str 轴名称，决定数组的列顺序
+        :param limits: dict {轴名称: (下限, 上限)}，缺少的轴不限位
+        """
+        super(LimitTable, self).__init__()
+        self.keys = tuple(keys)
+        self.lower = [float(limits.get(key, (-INF, INF))[0]) for key in self.keys]  # 单点截断用
+        self.upper = [float(limits.get(key, (-INF, INF))[1]) for key in self.keys]
+        self.__update_arrays()
+
+    def __update_arrays(self):
+        self.lower_array = numpy.array(self.lower)
+        self.upper_array = numpy.array(self.upper)
+
+    def set_limit(self, key, lower, upper):
+        """
+        :param key: str 轴名称，如 'J6' 'X'
+        :param lower: float 下限，-inf 表示不限
+        :param upper: float 上限，inf 表示不限
+        :return: None
+        """
+        index = self.keys.index(key)
+        self.lower[index] = float(lower)
+        self.upper[index] = float(upper)
+        self.__update_arrays()
+
+    def clamp(self, index, value):
+        """
+        单个轴的截断，越限时输出警告
+        :param index: int 轴序号，从 0 开始
+        :param value: float
+        :return: float
+        """
+        if value > self.upper[index]:
+            print('WARNING: {} is higher than the upper limit!'.format(self.keys[index]))
+            return self.upper[index]
+        if value < self.lower[index]:
+            print('WARNING: {} is lower than the lower limit!'.format(self.keys[index]))
+            return self.lower[index]
+        return value
+
+    def clamp_pose(self, pose, indexes=None):
+        """
+        原地截断一个目标位姿
+        :param pose: JointPose / CartesianPose 或 list，按 keys 顺序
+        :param indexes: 要检查的轴序号，None 表示全部
+        :return: int 越限的轴数
+        """
+        count = 0
+        for index in (range(len(self.keys)) if indexes is None else indexes):
+            value = pose[index]
+            if value > self.upper[index] or value < self.lower[index]:
+                pose[index] = self.clamp(index, value)
+                count += 1
+        return count
+
+    def check(self, points, clamp=True, out=None):
+        """
+        一次检查整条轨迹
+        :param points: array-like N×k（或长度 k 的单点），列顺序同 keys
+        :param clamp: Bool 真-返回截断后的点，假-只标记越限（拒绝），values 为原样
+        :param out: numpy.ndarray 与 points 同形，截断结果写入其中，可与 points 相同以原地截断
+        :return: LimitReport
+        """
+        points = numpy.atleast_2d(numpy.asarray(points, dtype=numpy.float64))
+        violations = (points < self.lower_array) | (points > self.upper_array)
+        valid = ~violations.any(axis=1)
+        values = points
+        if clamp and (out is not None or not valid.all()):
+            values = numpy.clip(points, self.lower_array, self.upper_array, out=out)
+        return LimitReport(values, violations, valid)
+
+    def violations(self, points, report, max_items=None):
+        """
+        列出越限项，便于报告
+        :param points: 传给 check() 的原始点
+        :param report: LimitReport
+        :param max_items: int 最多列出的条数，None 表示全部
+        :return: list of (行号, 轴名称, 值, 下限, 上限)
+        """
+        points = numpy.atleast_2d(numpy.asarray(points, dtype=numpy.float64))
+        rows, columns = numpy.nonzero(report.violations)
+        if max_items is not None:
+            rows = rows[:max_items]
+            columns = columns[:max_items]
+        return [(int(row), self.keys[column], float(points[row, column]), self.lower[column], self.upper[column])
+                for row, column in zip(rows, columns)]
+
+
+def default_joint_limits():
+    return LimitTable(JOINT_KEYS, JOINT_LIMITS)
+
+
+def default_workspace_limits():
+    return LimitTable(RECT_KEYS, WORKSPACE_LIMITS)
@@ -1,121 +1,367 @@
-"""
-This module includes the core functions of Geomagic touch haptic device.
-Class:
-Methods:
-"""
-
-
-from collections import deque
-import threading
-from ctypes import *
-
-from geomagic_touch_core import GeoTouchLower
-from sanxi_core import Sanxi
-
-
-class GeoCtrlSanXi(Sanxi):
-    def __init__(self):
-        super(GeoCtrlSanXi, self).__init__()
-        self.scaling_factor_position = 1
-        self.scaling_factor_angle = 1
-        self.touch_position_queue = deque(maxlen=2)
-        self.touch_gimbal_angles_queue = deque(maxlen=2)
-        # threading Timer
-        self.ctrl_timer = None
-
-    def start_ctrl(self):
-        geo_touch.touch_handle = geo_touch.hd_init_device('Default Device')
-        if geo_touch.touch_handle < 0:
-            return False
-        else:
-            geo_touch.hd_schedule_synchronous(scheduler_call_back_func1)
-            geo_touch.hd_start_scheduler()
-            # threading Timer
-            self.ctrl_timer = threading.Timer(0.08, self.touch_ctrl_sanxi_loop)
-            self.ctrl_timer.start()
-            return True
-
-    def stop_ctrl(self):
-        if geo_touch.touch_handle < 0:
-            return False
-        else:
-            geo_touch.hd_stop_scheduler()
-            self.ctrl_timer.cancel()
-
-    def touch_ctrl_sanxi_loop(self):
-        if geo_touch.touch_button_state == 0:
-            # 空闲时清空差值列表
-            self.touch_position_queue.clear()
-            self.touch_gimbal_angles_queue.clear()
-        elif geo_touch.touch_button_state == 1:
-            self.adjust_orientation2()
-        elif geo_touch.touch_button_state == 2:
-            self.adjust_position()
-        self.ctrl_timer = threading.Timer(0.08, self.touch_ctrl_sanxi_loop)
-        self.ctrl_timer.start()
-
-    def adjust_position(self):
-        self.touch_position_queue.append(geo_touch.touch_current_position)
-        if len(self.touch_position_queue) == 2:
-            touch_delta_position = \
-                [self.touch_position_queue[1][i] - self.touch_position_queue[0][i] for i in range(0, 3)]
-            print('delta position is  ', touch_delta_position[0], touch_delta_position[1], touch_delta_position[2])
-            if self.return_coord_mode != 1:
-                self.set_return_data_mode(1)
-            self.query_coord()
-            sanxi_current_position = self.xyz_value
-            print('Sanxi current position = ', self.xyz_value)
-            if len(sanxi_current_position):
-                sanxi_target_position_dict = \
-                    {'X': sanxi_current_position[0] + touch_delta_position[2] * self.scaling_factor_position,
-                     'Y': sanxi_current_position[1] + touch_delta_position[0] * self.scaling_factor_position,
-                     'Z': sanxi_current_position[2] + touch_delta_position[1] * self.scaling_factor_position,
-                     'A': sanxi_current_position[3],
-                     'B': sanxi_current_position[4],
-                     'C': sanxi_current_position[5],
-                     'D': sanxi_current_position[6]}
-                print('target-position is', sanxi_target_position_dict)
-                self.rect_move(mode='line', **sanxi_target_position_dict)
-                print('\n', '\n')
-
-    def adjust_orientation2(self):
-        self.touch_gimbal_angles_queue.append(geo_touch.touch_current_gimbal_angles)
-        if len(self.touch_gimbal_angles_queue) == 2:
-            touch_delta_gimbal_angles = \
-                [self.touch_gimbal_angles_queue[1][i] - self.touch_gimbal_angles_queue[0][i] for i in range(0, 3)]
-            if self.return_coord_mode != 0:
-                self.set_return_data_mode(0)
-            self.query_coord()
-            sanxi_current_angle = self.jn_value
-            if len(sanxi_current_angle):
-                target_j4 = sanxi_current_angle[3] - touch_delta_gimbal_angles[0] * self.scaling_factor_angle
-                target_j5 = sanxi_current_angle[4] + touch_delta_gimbal_angles[1] * self.scaling_factor_angle
-                sanxi_target_angle_dict = {'J4': target_j4, 'J5': target_j5}
-                self.multi_joints_motion(**sanxi_target_angle_dict)
-
-    def adjust_orientation3(self):
-        pass
-
-
-@CFUNCTYPE(c_uint)
-def scheduler_call_back_func1():
-    """
-
-    :return: None
-    """
-    geo_touch.touch_handle = geo_touch.hd_get_current_device()
-    geo_touch.hd_begin_frame(geo_touch.touch_handle)
-    geo_touch.touch_current_position = geo_touch.hd_get_current_position()
-    geo_touch.touch_current_gimbal_angles = geo_touch.hd_get_current_gimbal_angles()
-    geo_touch.touch_button_state = geo_touch.hd_get_current_buttons()
-    geo_touch.hd_end_frame(geo_touch.touch_handle)
-    return 1
-
-
-geo_touch = GeoTouchLower()
-
-if __name__ == '__main__':
-    geo_ctrl_sanxi = GeoCtrlSanXi()
-    geo_ctrl_sanxi.connect_sanxi(port_name='COM10')
-    geo_ctrl_sanxi.set_motion_para(5, 30, 10)
-    geo_ctrl_sanxi.start_ctrl()
+"""
+This module includes the core functions of Geomagic touch haptic device.
+Class: ControlLoop runs a tick function at a fixed rate in one long-lived thread, with absolute deadlines on
+         time.perf_counter(), overrun detection and frequency / jitter statistics.
+       TouchAccumulator integrates every servo sample of the haptic device between two robot commands, counting only
+         the motion made while the button of that motion is held (clutch). The samples pass a touch_filter
+         FilterPipeline first, re-seeded with the raw sample whenever the clutch engages, and a Deadband holds back
+         motions too small to be worth a command.
+       GeoCtrlSanXi drives SANXI robot from the haptic device in a ControlLoop.
+Methods:
+"""
+
+
+import sys
+import threading
+import time
+
+import numpy
+
+from geomagic_touch_core import GeoTouchLower, TouchSampler, SAMPLE_BUTTONS, SAMPLE_POSITION, SAMPLE_GIMBAL
+from latency_stats import LatencyHistogram
+from pose import JointPose, CartesianPose
+from sanxi_core import Sanxi
+from touch_filter import FilterPipeline, OneEuroFilter, LowPassFilter, Deadband
+
+
+class ControlLoop(object):
+    """
+    固定频率控制循环：第 k 次 tick 的截止时刻为 start + k·period，周期不随 tick 的耗时漂移；
+    tick 超过一个周期时计一次超时（overrun），并跳过已错过的周期，不连续补跑
+    """
+    def __init__(self, tick, rate=12.5, name='Control_Loop_Thread'):
+        """
+        :param tick: function() 每个周期调用一次
+        :param rate: float 频率，单位Hz，运行中修改从下一个周期起生效
+        :param name: str 线程名称
+        """
+        super(ControlLoop, self).__init__()
+        self.tick = tick
+        self.rate = rate
+        self.name = name
+        self.lateness = LatencyHistogram()  # 实际开始时刻相对截止时刻的延迟，即抖动
+        self.tick_time = LatencyHistogram()  # tick 的执行耗时
+        self.tick_count = 0
+        self.overrun_count = 0  # tick 结束时已超过下一个截止时刻的次数
+        self.missed_count = 0  # 因超时跳过的周期数
+        self.error_count = 0  # tick 抛出异常的次数
+        self.__first_tick = None
+        self.__last_tick = None
+        self.__stop_event = threading.Event()
+        self.__thread = None
+
+    def start(self):
+        """
+        启动控制线程，已在运行时不做任何事
+        :return: None
+        """
+        if self.__thread is not None:
+            return
+        self.__stop_event.clear()
+        self.__thread = threading.Thread(target=self.__loop_thread_func, name=self.name)
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """
+        停止控制线程，等待正在执行的 tick 结束后返回，之后不会再调用 tick
+        :return: None
+        """
+        self.__stop_event.set()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        self.__thread = None
+
+    def is_running(self):
+        return self.__thread is not None
+
+    def reset_stats(self):
+        self.lateness.reset()
+        self.tick_time.reset()
+        self.tick_count = 0
+        self.overrun_count = 0
+        self.missed_count = 0
+        self.error_count = 0
+        self.__first_tick = None
+        self.__last_tick = None
+
+    def frequency(self):
+        """
+        :return: float 实际达到的频率，单位Hz，不足两次 tick 时为 None
+        """
+        if self.tick_count < 2 or self.__last_tick <= self.__first_tick:
+            return None
+        return (self.tick_count - 1) / (self.__last_tick - self.__first_tick)
+
+    def snapshot(self):
+        """
+        :return: dict 统计摘要：设定频率，实际频率，tick 数，超时数，跳过周期数，异常数，抖动与 tick 耗时（秒）
+        """
+        return {'rate': self.rate, 'frequency': self.frequency(), 'ticks': self.tick_count,
+                'overruns': self.overrun_count, 'missed': self.missed_count, 'errors': self.error_count,
+                'jitter': self.lateness.snapshot(), 'tick_time': self.tick_time.snapshot()}
+
+    def dump(self, file=None):
+        """
+        输出统计，时间单位毫秒
+        :param file: 输出文件对象，默认标准输出
+        :return: None
+        """
+        if file is None:
+            file = sys.stdout
+
+        def ms(value):
+            return '-' if value is None else '{:.3f}'.format(value * 1000)
+        stats = self.snapshot()
+        frequency = stats['frequency']
+        file.write('{}: rate {:.2f} Hz, achieved {} Hz, ticks {}, overruns {}, missed {}, errors {}\n'.format(
+            self.name, stats['rate'], '-' if frequency is None else '{:.3f}'.format(frequency), stats['ticks'],
+            stats['overruns'], stats['missed'], stats['errors']))
+        for key in ('jitter', 'tick_time'):
+            file.write('  {:<10} p50 {} ms  p99 {} ms  max {} ms\n'.format(
+                key, ms(stats[key]['p50']), ms(stats[key]['p99']), ms(stats[key]['max'])))
+
+    # 控制线程目标函数
+    def __loop_thread_func(self):
+        deadline = time.perf_counter()
+        while True:
+            delay = deadline - time.perf_counter()
+            if delay > 0 and self.__stop_event.wait(delay):
+                break
+            if self.__stop_event.is_set():
+                break
+            start_time = time.perf_counter()
+            self.lateness.record(start_time - deadline)
+            if self.__first_tick is None:
+                self.__first_tick = start_time
+            self.__last_tick = start_time
+            try:
+                self.tick()
+            except Exception as e:
+                self.error_count += 1
+                print('Control loop error: ', e)
+            end_time = time.perf_counter()
+            self.tick_time.record(end_time - start_time)
+            self.tick_count += 1
+            period = 1.0 / self.rate
+            deadline += period
+            if end_time > deadline:
+                # 超时：跳到下一个尚未错过的截止时刻，保持在原来的时间网格上
+                missed = int((end_time - deadline) / period) + 1
+                self.overrun_count += 1
+                self.missed_count += missed
+                deadline += missed * period
+
+
+class TouchAccumulator(object):
+    """
+    触觉设备运动量累加器：读取环形缓冲区中上次以来的全部伺服采样，逐帧求差并累加，直到被取走（发出一次机器人指令）
+    相邻两帧的按钮状态相同时才计入：按钮2 计入位置，按钮1 计入万向节角度；松开按钮（离合器断开）期间的移动不计入
+    """
+    def __init__(self, sampler, pipeline=None):
+        """
+        :param sampler: TouchSampler
+        :param pipeline: touch_filter.FilterPipeline 求差之前对新采样的滤波，None 表示不滤波
+        """
+        super(TouchAccumulator, self).__init__()
+        self.__sampler = sampler
+        self.pipeline = pipeline
+        self.position = numpy.zeros(3)  # 未取走的位置增量，单位mm
+        self.gimbal_angles = numpy.zeros(3)  # 未取走的万向节角度增量，单位rad
+        self.buttons = 0  # 最新一帧的按钮状态
+        self.sample_count = 0  # 已累加的采样数
+        self.__mark = sampler.count
+        self.__last_frame = None  # 上一次读取的最后一帧，与本次的第一帧求差
+
+    def reset(self):
+        """
+        丢弃未取走的增量，从当前帧重新开始累加
+        :return: None
+        """
+        self.clear()
+        self.buttons = 0
+        self.__mark = self.__sampler.count
+        self.__last_frame = None
+        if self.pipeline is not None:
+            self.pipeline.reset()
+
+    def clear(self):
+        self.position[:] = 0
+        self.gimbal_angles[:] = 0
+
+    def update(self):
+        """
+        累加上次以来的全部采样
+        :return: int 最新一帧的按钮状态
+        """
+        frames, self.__mark = self.__sampler.since(self.__mark)
+        if not len(frames):
+            return self.buttons
+        self.sample_count += len(frames)
+        if self.pipeline is not None:
+            self.__filter(frames)
+        if self.__last_frame is not None:
+            frames = numpy.vstack((self.__last_frame, frames))
+        self.__last_frame = frames[-1].copy()
+        self.buttons = int(frames[-1, SAMPLE_BUTTONS])
+        buttons = frames[:, SAMPLE_BUTTONS]
+        held = buttons[1:] == buttons[:-1]
+        steps = numpy.diff(frames, axis=0)
+        self.position += steps[held & (buttons[1:] == 2), SAMPLE_POSITION].sum(axis=0)
+        self.gimbal_angles += steps[held & (buttons[1:] == 1), SAMPLE_GIMBAL].sum(axis=0)
+        return self.buttons
+
+    def __filter(self, frames):
+        """
+        滤波器保存跨周期的状态，只处理新的采样。按下按钮（离合器接合）时，滤波器以该帧的原始值重新播种：
+        松开期间移动手柄，滤波输出滞后于原始值，不重新播种时接合后输出继续向原始值收敛，这段复位运动会被计入
+        :param frames: numpy.ndarray N×SAMPLE_WIDTH 新采样，原地滤波
+        :return: None
+        """
+        buttons = frames[:, SAMPLE_BUTTONS]
+        previous = numpy.concatenate(([self.buttons], buttons[:-1]))
+        engaged = numpy.flatnonzero((buttons != previous) & (buttons != 0)).tolist()
+        bounds = [0] + engaged + [len(frames)]
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            if start == end:
+                continue
+            if start in engaged:
+                self.pipeline.reset(frames[start])
+            self.pipeline.process(frames[start:end])
+
+    def take_position(self):
+        """
+        :return: list 未取走的位置增量 [x, y, z]，单位mm，取走后清零
+        """
+        delta = self.position.tolist()
+        self.position[:] = 0
+        return delta
+
+    def take_gimbal_angles(self):
+        """
+        :return: list 未取走的万向节角度增量 [x, y, z]，单位度，取走后清零
+        """
+        delta = numpy.degrees(self.gimbal_angles).tolist()
+        self.gimbal_angles[:] = 0
+        return delta
+
+
+class GeoCtrlSanXi(Sanxi):
+    def __init__(self):
+        super(GeoCtrlSanXi, self).__init__()
+        self.scaling_factor_position = 1
+        self.scaling_factor_angle = 1
+        # 两次指令之间的全部触觉运动都被累加，控制循环的频率或一次阻塞的查询不会丢失操作者的输入
+        # 滤波：位置用 One-Euro 抑制噪声与手抖，万向节角度低通，增益保持 1:1；各级可按列（轴）替换或增减，
+        # 例如加入 VelocityScaling 按手速调整增益
+        self.touch_filter = FilterPipeline([OneEuroFilter(SAMPLE_POSITION, min_cutoff=1.0, beta=0.05),
+                                            LowPassFilter(SAMPLE_GIMBAL, cutoff=5.0)])
+        self.touch_accumulator = TouchAccumulator(touch_sampler, self.touch_filter)
+        # 死区：累加的增量未超过阈值时继续累加，不发出微小的运动指令
+        self.position_deadband = Deadband(0.2)  # 单位mm
+        self.angle_deadband = Deadband(numpy.radians(0.2))  # 单位rad
+        # 遥测位姿与指令目标：需要起点时从遥测快照取一次，之后在上一次的指令目标上累加，运动中不再冻结查询
+        self.pose_max_age = 0.5  # 遥测位姿的最大可用时长，单位秒
+        self.target_xyz = CartesianPose()  # 预分配，原地更新，无效时表示需要重新取起点
+        self.target_jn = JointPose()
+        # 控制循环，默认 12.5Hz（周期 80ms）
+        self.ctrl_loop = ControlLoop(self.touch_ctrl_sanxi_loop, 12.5, 'GeoCtrlSanXi_Loop_Thread')
+
+    def start_ctrl(self):
+        geo_touch.touch_handle = geo_touch.hd_init_device('Default Device')
+        if geo_touch.touch_handle < 0:
+            return False
+        else:
+            touch_sampler.start()  # 伺服回调每个伺服周期（1kHz）采样一次，控制循环累加上次以来的全部采样
+            geo_touch.hd_start_scheduler()
+            self.touch_accumulator.reset()
+            self.target_xyz.invalidate()
+            self.target_jn.invalidate()
+            self.ctrl_loop.reset_stats()
+            self.touch_filter.reset_stats()
+            self.ctrl_loop.start()
+            return True
+
+    def stop_ctrl(self):
+        if geo_touch.touch_handle < 0:
+            return False
+        else:
+            self.ctrl_loop.stop()  # 先停止控制循环，之后不再读取触觉设备的状态
+            touch_sampler.stop()
+            geo_touch.hd_stop_scheduler()
+            self.ctrl_loop.dump()
+            self.touch_filter.dump()
+
+    def touch_ctrl_sanxi_loop(self):
+        buttons = self.touch_accumulator.update()
+        # 先发出累加的运动，包括本周期内已松开或切换的按钮之前的部分
+        self.adjust_position()
+        self.adjust_orientation2()
+        if buttons == 0:
+            # 离合器断开：丢弃未能发出的增量；指令目标保留，下次按下时从机器人正在前往的位置继续
+            self.touch_accumulator.clear()
+        elif buttons == 1:
+            self.target_xyz.invalidate()
+        elif buttons == 2:
+            self.target_jn.invalidate()
+
+    def load_telemetry_pose(self, pose):
+        """
+        从遥测快照读取位姿写入 pose，两个空间的坐标一次取得，不切换返回坐标模式。
+        只在需要新的起点时调用：开始控制后第一次按下按钮，或在位置与姿态控制之间切换（另一空间的运动使本空间的
+        指令目标失效）。快照早于最近的运动命令时坐标已过时，只有这时才冻结查询，停止正在进行的运动
+        :param pose: CartesianPose 或 JointPose 原地写入
+        :return: Bool 是否取得位姿
+        """
+        snapshot = self.query_pose(self.pose_max_age)
+        record = snapshot.cartesian if isinstance(pose, CartesianPose) else snapshot.joint
+        if record is None or record.timestamp < self.last_motion_time:
+            snapshot = self.query_pose(0, True)
+            record = snapshot.cartesian if isinstance(pose, CartesianPose) else snapshot.joint
+        if record is None or record.timestamp < self.last_motion_time:
+            return False
+        pose.set(record, record.timestamp)
+        return True
+
+    def adjust_position(self):
+        if not self.position_deadband.passes(self.touch_accumulator.position):
+            return
+        target = self.target_xyz
+        if not target:
+            self.load_telemetry_pose(target)
+        print('Sanxi current position = ', target)
+        if target:
+            touch_delta_position = self.touch_accumulator.take_position()
+            print('delta position is  ', touch_delta_position[0], touch_delta_position[1], touch_delta_position[2])
+            # 在上一次的指令目标上原地累加，A B C D 保持不变
+            target.x += touch_delta_position[2] * self.scaling_factor_position
+            target.y += touch_delta_position[0] * self.scaling_factor_position
+            target.z += touch_delta_position[1] * self.scaling_factor_position
+            print('target-position is', target)
+            self.rect_move('line', target)
+            print('\n', '\n')
+
+    def adjust_orientation2(self):
+        if not self.angle_deadband.passes(self.touch_accumulator.gimbal_angles):
+            return
+        target = self.target_jn
+        if not target:
+            self.load_telemetry_pose(target)
+        if target:
+            touch_delta_gimbal_angles = self.touch_accumulator.take_gimbal_angles()
+            target.j4 -= touch_delta_gimbal_angles[0] * self.scaling_factor_angle
+            target.j5 += touch_delta_gimbal_angles[1] * self.scaling_factor_angle
+            self.multi_joints_motion(target, (4, 5))  # 超限的值被截断并写回 target
+
+    def adjust_orientation3(self):
+        pass
+
+
+geo_touch = GeoTouchLower()
+touch_sampler = TouchSampler(geo_touch)
+
+if __name__ == '__main__':
+    geo_ctrl_sanxi = GeoCtrlSanXi()
+    geo_ctrl_sanxi.connect_sanxi(port_name='COM10')
+    geo_ctrl_sanxi.set_motion_para(5, 30, 10)
+    geo_ctrl_sanxi.start_ctrl()
@@ -0,0 +1,314 @@
+"""
+This module includes the completion tracking of SANXI robot motions
+Class: MotionMonitor gives every tracked motion command a concurrent.futures.Future that resolves when the move has
+         finished. The controller reports its position only through \x30, which also freezes the arm, so the monitor
+         predicts the end of each move from its length and a learned speed and polls once at that time:
+           reached      -> the future resolves, the speed estimate is raised a little, never above the measured one;
+           not reached  -> the speed is measured from the progress, the estimate drops below it, and the move is
+                           sent again and polled again when the rest of it should be done.
+         Moves queued behind each other are polled only at the end of the last one, earlier ones resolve at their
+         predicted end unmeasured (reached=None, verified=False), so a script can pipeline moves and compute while
+         the arm moves; reached=True always means a measured pose.
+         The search of origin is tracked by \x05 polling at growing intervals, which does not disturb the motion.
+       MotionResult is the result of every future.
+Functions: submit_move() submit_mode_wait() interrupt() cancel() stop()
+Note: asyncio code can await a future with asyncio.wrap_future(future).
+
+Author: Mr SoSimple
+"""
+
+
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import Future
+
+from pose import JointPose, CartesianPose
+
+
+# reached: 是否到达目标（或离开忙碌模式），None 表示未测量（流水线中按预测时间结束）；verified: 是否由控制器的回复确认，假表示按预测时间结束或被取消；
+# pose: 确认时读到的 JointPose / CartesianPose；seconds: 从提交到结束的时间；polls: 轮询次数
+MotionResult = namedtuple('MotionResult', ['reached', 'verified', 'pose', 'seconds', 'polls'])
+SPACE_KEYS = {'joint': JointPose.KEYS, 'rect': CartesianPose.KEYS}
+
+
+def motion_target(send_code, keys):
+    """
+    从运动命令中取出目标值，例如 b'G00 J4=10.00 J5=-3.00 \\n' -> [(3, 10.0), (4, -3.0)]
+    :param send_code: bytes 运动命令
+    :param keys: tuple of str 坐标键，决定序号
+    :return: list of (int 序号, float 目标值)
+    """
+    target = []
+    for token in send_code.split()[1:]:
+        key, _, value = token.decode().partition('=')
+        if key in keys:
+            target.append((keys.index(key), float(value)))
+    return target
+
+
+class _Motion(object):
+    __slots__ = ('future', 'space', 'send_code', 'target', 'tolerance', 'start', 'begin', 'due', 'deadline',
+                 'submit_time', 'polls', 'interval', 'interrupt_count')
+
+    def __init__(self, future, space, send_code, target, tolerance, submit_time, deadline):
+        self.future = future
+        self.space = space  # 'joint' 'rect'，或 'mode' 表示等待离开忙碌模式
+        self.send_code = send_code
+        self.target = target  # 运动：[(序号, 目标值)]；'mode'：忙碌模式
+        self.tolerance = tolerance
+        self.start = None  # 本段运动的起点 {序号: 值}，未知时为 None
+        self.begin = submit_time  # 本段运动预计开始的时刻
+        self.due = submit_time  # 下一次轮询的时刻
+        self.deadline = deadline
+        self.submit_time = submit_time
+        self.polls = 0
+        self.interval = 0.0  # 'mode' 的轮询间隔
+        self.interrupt_count = 0  # 提交时 MotionMonitor.interrupt() 的次数，之后再有 interrupt() 时不再轮询或重发
+
+
+class MotionMonitor(object):
+    def __init__(self, sanxi):
+        """
+        :param sanxi: Sanxi
+        """
+        super(MotionMonitor, self).__init__()
+        self.__sanxi = sanxi
+        self.speeds = {'joint': 20.0, 'rect': 50.0}  # 预测用的速度估计，度/秒 或 mm/秒，按轮询结果自动修正
+        self.measured_speeds = {'joint': None, 'rect': None}  # 未到达时由实测进度得到的速度
+        self.speed_up = 1.2  # 第一次轮询即到达时速度估计的放大倍数，使下一次预测更紧，不超过实测速度的 0.95 倍
+        self.tolerances = {'joint': 0.05, 'rect': 0.1}  # 默认到达判据，度 或 mm
+        self.settle_time = 0.05  # 预测的运动结束后到轮询的余量，单位秒
+        self.min_interval = 0.02  # 两次轮询的最小间隔，单位秒
+        self.unknown_duration = 1.0  # 起点未知时第一次轮询的延时，单位秒
+        self.mode_poll_interval = (0.1, 2.0)  # \x05 轮询间隔的初值与上限，单位秒，每次加倍
+        self.timeout = 30.0  # 默认超时，单位秒
+        self.poll_count = 0  # 冻结轮询的总次数
+        self.resend_count = 0  # 轮询时未到达而重发的总次数
+        self.__condition = threading.Condition(threading.RLock())
+        self.__interrupt_lock = threading.Lock()
+        self.__interrupt_count = 0  # interrupt() 的次数
+        self.__pending = deque()
+        self.__run_flag = False
+        self.__thread = None
+
+    def __start(self):
+        if self.__thread is not None:
+            return
+        self.__run_flag = True
+        self.__thread = threading.Thread(target=self.__monitor_thread_func, name='Sanxi_Motion_Monitor_Thread')
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        """
+        取消全部未结束的运动并停止监视线程
+        """
+        self.cancel()
+        with self.__condition:
+            self.__run_flag = False
+            self.__condition.notify_all()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+        self.__thread = None
+
+    def interrupt(self):
+        """
+        在冻结命令写出之前调用，不等待监视线程：之前提交的运动不再轮询，之后才轮到写出的重发命令被写线程丢弃。
+        轮询期间监视线程持有锁，cancel() 要等轮询结束，只靠 cancel() 时重发可能在冻结之后写出
+        """
+        with self.__interrupt_lock:
+            self.__interrupt_count += 1
+
+    def __not_interrupted(self, motion):
+        """
+        :param motion: _Motion
+        :return: function() -> Bool 写线程在写出前调用的检查，运动提交后有过 interrupt() 时为假
+        """
+        return lambda: self.__interrupt_count == motion.interrupt_count
+
+    def cancel(self):
+        """
+        运动被冻结或中止：未结束的 future 以 reached=False 结束
+        """
+        with self.__condition:
+            while self.__pending:
+                self.__resolve(self.__pending.popleft(), False, False, None)
+
+    def __resolve(self, motion, reached, verified, pose):
+        if not motion.future.done():
+            motion.future.set_result(MotionResult(reached, verified, pose, time.perf_counter() - motion.submit_time,
+                                                  motion.polls))
+
+    def __current_values(self, space):
+        """
+        :return: dict {序号: 值} 新运动的起点：排队中同一空间最后一个运动的目标，否则为缓存的坐标，未知时 None
+        """
+        for motion in reversed(self.__pending):
+            if motion.space == space:
+                values = dict(motion.start or {})
+                values.update(motion.target)
+                return values
+            if motion.space != 'mode':
+                break
+        pose = self.__sanxi.jn_value if space == 'joint' else self.__sanxi.xyz_value
+        return dict(enumerate(pose)) if pose else None
+
+    def __duration(self, space, start, target):
+        if start is None:
+            return self.unknown_duration
+        distance = max([abs(value - start.get(index, value)) for index, value in target] or [0.0])
+        return distance / self.speeds[space] + self.settle_time
+
+    def submit_move(self, space, send_code, tolerance=None, timeout=None):
+        """
+        发送一条运动命令并返回跟踪它的 future
+        :param space: 'joint' G00 关节运动，'rect' G20 / G21 直角坐标运动
+        :param send_code: bytes 运动命令，见 sanxi_core.joints_motion_code / rect_move_code
+        :param tolerance: float 各目标坐标的最大允许误差，度 或 mm，None 表示 tolerances[space]
+        :param timeout: float 超时，单位秒，None 表示 timeout
+        :return: concurrent.futures.Future，结果为 MotionResult
+        """
+        sanxi = self.__sanxi
+        future = Future()
+        with self.__condition:
+            self.__start()
+            now = time.perf_counter()
+            motion = _Motion(future, space, send_code, motion_target(send_code, SPACE_KEYS[space]),
+                             self.tolerances[space] if tolerance is None else tolerance, now,
+                             now + (self.timeout if timeout is None else timeout))
+            motion.start = self.__current_values(space)
+            motion.interrupt_count = self.__interrupt_count
+            if self.__pending:
+                motion.begin = max(now, self.__pending[-1].due - self.settle_time)  # 控制器执行完前一个再开始
+            motion.due = motion.begin + self.__duration(space, motion.start, motion.target)
+            sanxi.enter_mode(14)
+            sanxi._mark_motion(float('inf'), True)  # 由本监视器轮询确认结束，之前不主动采样
+            sanxi.send_cmd(send_code, 0.014)
+            self.__pending.append(motion)
+            self.__condition.notify_all()
+        return future
+
+    def submit_mode_wait(self, busy_mode, timeout=None):
+        """
+        跟踪一个由控制器自行结束的过程，例如回零（模式12），以 \x05 询问，控制器离开 busy_mode 时结束
+        :param busy_mode: int 过程进行中的模式
+        :param timeout: float 超时，单位秒，None 表示 timeout
+        :return: concurrent.futures.Future，结果为 MotionResult，pose 为 None
+        """
+        future = Future()
+        with self.__condition:
+            self.__start()
+            now = time.perf_counter()
+            motion = _Motion(future, 'mode', None, busy_mode, None, now,
+                             now + (self.timeout if timeout is None else timeout))
+            motion.interval = self.mode_poll_interval[0]
+            motion.interrupt_count = self.__interrupt_count
+            motion.due = now + motion.interval
+            self.__pending.append(motion)
+            self.__condition.notify_all()
+        return future
+
+    def __poll_mode(self, motion, now):
+        sanxi = self.__sanxi
+        mode = sanxi.query_current_mode()
+        motion.polls += 1
+        if mode != 0 and mode != motion.target:
+            self.__pending.popleft()
+            sanxi._mark_stopped()
+            self.__resolve(motion, True, True, None)
+        elif now >= motion.deadline:
+            self.__pending.popleft()
+            self.__resolve(motion, False, True, None)
+        else:
+            motion.interval = min(motion.interval * 2, self.mode_poll_interval[1])
+            motion.due = time.perf_counter() + motion.interval
+
+    def __poll_move(self, motion):
+        """
+        冻结并读取位姿：到达则结束，否则按实测进度修正速度估计并重发剩余的运动
+        """
+        sanxi = self.__sanxi
+        space = motion.space
+        poll_time = time.perf_counter()
+        snapshot = sanxi.query_pose(0, True)
+        self.poll_count += 1
+        motion.polls += 1
+        record = snapshot.joint if space == 'joint' else snapshot.cartesian
+        now = time.perf_counter()
+        if record is None or record.timestamp < poll_time:
+            # 没有读到坐标：稍后再试
+            if now >= motion.deadline:
+                self.__pending.popleft()
+                self.__resolve(motion, False, False, None)
+            else:
+                motion.due = now + self.min_interval
+            return
+        pose = JointPose(record, record.timestamp) if space == 'joint' else CartesianPose(record, record.timestamp)
+        error = max([abs(record[index] - value) for index, value in motion.target] or [0.0])
+        if error <= motion.tolerance:
+            if motion.polls == 1:
+                speed = self.speeds[space] * self.speed_up
+                if self.measured_speeds[space] is not None:
+                    speed = min(speed, 0.95 * self.measured_speeds[space])
+                self.speeds[space] = max(speed, self.speeds[space])
+            self.__pending.popleft()
+            sanxi._mark_stopped()  # 已冻结并到达，之后可以主动采样
+            self.__resolve(motion, True, True, pose)
+            return
+        if motion.start is not None:
+            moved = max([abs(record[index] - motion.start.get(index, record[index])) for index, value in
+                         motion.target])
+            elapsed = poll_time - motion.begin
+            if moved > 0 and elapsed > 0:
+                self.measured_speeds[space] = moved / elapsed
+                self.speeds[space] = 0.9 * self.measured_speeds[space]
+        if now >= motion.deadline:
+            self.__pending.popleft()
+            self.__resolve(motion, False, True, pose)
+            return
+        if self.__interrupt_count != motion.interrupt_count:
+            return  # 轮询期间运动被冻结或中止，由监视线程结束
+        # 冻结已停止运动，重发，剩余部分走完时再轮询
+        motion.start = dict(enumerate(pose))
+        motion.begin = now
+        motion.due = now + max(self.__duration(space, motion.start, motion.target), self.min_interval)
+        sanxi._mark_motion(float('inf'), True)
+        sanxi.send_cmd(motion.send_code, 0.014, guard=self.__not_interrupted(motion))
+        self.resend_count += 1
+
+    # 监视线程目标函数
+    def __monitor_thread_func(self):
+        sanxi = self.__sanxi
+        with self.__condition:
+            while self.__run_flag:
+                if not self.__pending:
+                    self.__condition.wait()
+                    continue
+                motion = self.__pending[0]
+                if motion.interrupt_count != self.__interrupt_count:
+                    # 提交后运动被冻结或中止：不等 cancel()，以免再次轮询并重发
+                    self.__pending.popleft()
+                    self.__resolve(motion, False, False, None)
+                    continue
+                now = time.perf_counter()
+                if motion.due > now:
+                    self.__condition.wait(motion.due - now)
+                    continue
+                if motion.space == 'mode':
+                    self.__poll_mode(motion, now)
+                elif len(self.__pending) > 1 and self.__pending[1].space != 'mode':
+                    # 后面还有排队的运动，冻结会打断它们：按预测时间结束，未测量是否到达
+                    self.__pending.popleft()
+                    self.__resolve(motion, None, False, None)
+                elif not sanxi.is_connected():
+                    self.cancel()
+                elif sanxi._untracked_motion():
+                    # 有未跟踪的运动或点动在进行，冻结会打断它：推迟轮询，直到超时
+                    if now >= motion.deadline:
+                        self.__pending.popleft()
+                        self.__resolve(motion, False, False, None)
+                    else:
+                        motion.due = now + self.min_interval
+                else:
+                    self.__poll_move(motion)
@@ -0,0 +1,123 @@
+"""
+This module includes compact pose types of SANXI robot
+Class: JointPose      joint angles J1..J6, unit degree
+       CartesianPose  rectangular coordinates X Y Z A B C D
+         Both keep their values in a preallocated array('d') and are updated in place by set() / copy_from(), so a
+         control loop can reuse the same objects every tick. as_array() gives a NumPy view sharing that memory.
+Functions: set() copy_from() copy() invalidate() as_array() to_dict()
+
+Author: Mr SoSimple
+"""
+
+
+from array import array
+
+
+def _axis_property(index):
+    def getter(self):
+        return self.values[index]
+
+    def setter(self, value):
+        self.values[index] = value
+    return property(getter, setter)
+
+
+class _Pose(object):
+    __slots__ = ('values', 'timestamp', 'valid')
+    KEYS = ()
+
+    def __init__(self, values=None, timestamp=0.0):
+        """
+        :param values: 可迭代的坐标值，None 表示全零且无效
+        :param timestamp: float 坐标的时刻，time.perf_counter()
+        """
+        self.values = array('d', bytes(8 * len(self.KEYS)))
+        self.timestamp = timestamp
+        self.valid = False  # 是否已写入过坐标，未写入时布尔值为假
+        if values is not None:
+            self.set(values, timestamp)
+
+    def set(self, values, timestamp=0.0):
+        """
+        原地写入坐标值
+        :param values: 按 KEYS 顺序的坐标值，可以比 KEYS 长（如带时间戳的 JointRecord），多余部分忽略
+        :param timestamp: float 坐标的时刻
+        :return: self
+        """
+        target = self.values
+        for i in range(len(target)):
+            target[i] = values[i]
+        self.timestamp = timestamp
+        self.valid = True
+        return self
+
+    def copy_from(self, other):
+        """
+        原地复制另一个同类位姿
+        :return: self
+        """
+        self.values[:] = other.values
+        self.timestamp = other.timestamp
+        self.valid = other.valid
+        return self
+
+    def copy(self):
+        return type(self)().copy_from(self)
+
+    def invalidate(self):
+        self.valid = False
+
+    def as_array(self):
+        """
+        :return: numpy.ndarray 与 values 共享内存的视图，修改视图即修改位姿
+        """
+        import numpy
+        return numpy.frombuffer(self.values, dtype=numpy.float64)
+
+    def to_dict(self):
+        """
+        :return: dict {'X': float, ...} 或 {'J1': float, ...}，供以字典为参数的旧接口使用
+        """
+        return dict(zip(self.KEYS, self.values))
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __setitem__(self, index, value):
+        self.values[index] = value
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __bool__(self):
+        return self.valid
+
+    def __repr__(self):
+        return '{}({})'.format(type(self).__name__,
+                               ', '.join(['{}={:.3f}'.format(key, value) for key, value in zip(self.KEYS, self.values)]))
+
+
+class JointPose(_Pose):
+    __slots__ = ()
+    KEYS = ('J1', 'J2', 'J3', 'J4', 'J5', 'J6')
+    j1 = _axis_property(0)
+    j2 = _axis_property(1)
+    j3 = _axis_property(2)
+    j4 = _axis_property(3)
+    j5 = _axis_property(4)
+    j6 = _axis_property(5)
+
+
+class CartesianPose(_Pose):
+    __slots__ = ()
+    KEYS = ('X', 'Y', 'Z', 'A', 'B', 'C', 'D')
+    x = _axis_property(0)
+    y = _axis_property(1)
+    z = _axis_property(2)
+    a = _axis_property(3)
+    b = _axis_property(4)
+    c = _axis_property(5)
+    d = _axis_property(6)
@@ -0,0 +1,205 @@
+"""
+This module includes the file-mode (mode 11) program upload of SANXI robot
+Class: ProgramUploader enters file mode, transfers a G-code program in large chunks and starts it on the controller,
+         so a long job is one bulk transfer instead of one round trip per line.
+         Every chunk carries its index and CRC32, the controller answers each chunk with the CRC it computed, and
+         the whole program is checked again by CRC when the file is closed. Up to `window` chunks are in flight at
+         once; a rejected or lost chunk is sent again by index.
+         After upload() the controller is back in debug mode (14), unless the program was started: a started program
+         runs in file mode (11), and the caller must call Sanxi.enter_mode(14) once it has finished.
+Functions: split_program() upload() file_reply()
+Protocol (UNVERIFIED: assumed, not taken from SANXI documentation nor tested on a real controller; only
+          sanxi_simulator.VirtualSanxi implements it. One command per line, replies end with \\r\\n):
+    FILE OPEN S=<bytes> L=<lines>\\n                      -> OK
+    FILE DATA I=<index> S=<bytes> CRC=<crc32>\\n<payload> -> OK I=<index> CRC=<crc32> | ERR I=<index>
+    FILE CLOSE CRC=<crc32 of the whole program>\\n        -> OK L=<lines> CRC=<crc32> | ERR ...
+    FILE RUN\\n                                           -> OK
+Note: the command templates are kept in the FILE_*_CODE constants below, so they can be corrected in one place once
+      the real file-mode protocol is known. Do not run upload() against a real controller before that.
+
+Author: Mr SoSimple
+"""
+
+
+import time
+import zlib
+from collections import deque, namedtuple
+
+from communication import ReplyFrame, PRIORITY_NORMAL
+
+
+FILE_OPEN_CODE = b'FILE OPEN S=%d L=%d\n'
+FILE_DATA_CODE = b'FILE DATA I=%d S=%d CRC=%d\n'  # 其后紧跟 S 字节的程序内容
+FILE_CLOSE_CODE = b'FILE CLOSE CRC=%d\n'
+FILE_RUN_CODE = b'FILE RUN\n'
+FILE_REPLY = ReplyFrame(terminator=b'\r\n')  # 文件命令的回复行
+# 上传结果：程序字节数，行数，块数，重发次数，耗时（秒），整个程序是否校验通过，程序是否已启动
+UploadReport = namedtuple('UploadReport', ['bytes', 'lines', 'chunks', 'retries', 'seconds', 'verified', 'started'])
+
+
+def crc32(data):
+    return zlib.crc32(data) & 0xffffffff
+
+
+def file_reply(reply):
+    """
+    解析文件命令的回复，例如 b'OK I=3 CRC=305419896\\r\\n'
+    :param reply: bytes
+    :return: (Bool 是否为 OK, dict {b'I': int, ...})
+    """
+    tokens = reply.split()
+    if not tokens:
+        return False, {}
+    values = {}
+    for token in tokens[1:]:
+        key, _, value = token.partition(b'=')
+        try:
+            values[key] = int(value)
+        except ValueError:
+            pass
+    return tokens[0] == b'OK', values
+
+
+def split_program(program, chunk_size):
+    """
+    整理程序文本并按行边界分块
+    :param program: str / bytes 程序文本，或可迭代的程序行；空行被去掉，每行以 \\n 结尾
+    :param chunk_size: int 每块的最大字节数，超过此长度的单行自成一块
+    :return: (bytes 整理后的程序, int 行数, list of bytes 各块)
+    """
+    if isinstance(program, (str, bytes)):
+        program = program.splitlines()
+    lines = []
+    for line in program:
+        if isinstance(line, str):
+            line = line.encode()
+        line = line.strip()
+        if line:
+            lines.append(line + b'\n')
+    chunks = []
+    chunk = []
+    size = 0
+    for line in lines:
+        if chunk and size + len(line) > chunk_size:
+            chunks.append(b''.join(chunk))
+            chunk = []
+            size = 0
+        chunk.append(line)
+        size += len(line)
+    if chunk:
+        chunks.append(b''.join(chunk))
+    return b''.join(lines), len(lines), chunks
+
+
+class ProgramUploader(object):
+    """
+    文件模式程序上传，用法：report = sanxi.upload_program(text, run=True)
+    """
+    def __init__(self, sanxi, chunk_size=1024, window=2, retries=3, baud_rate=115200):
+        """
+        :param sanxi: Sanxi
+        :param chunk_size: int 每块的最大字节数
+        :param window: int 在途（已写出、回复未到）的块数上限，即占用控制器接收缓冲的块数
+        :param retries: int 每块最多重发的次数
+        :param baud_rate: int 串口波特率，用于按块长估算回复的超时保护
+        """
+        super(ProgramUploader, self).__init__()
+        self.__sanxi = sanxi
+        self.chunk_size = chunk_size
+        self.window = window
+        self.retries = retries
+        self.baud_rate = baud_rate
+        self.last_error = ''  # 最近一次上传失败的原因
+
+    def __timeout(self, size):
+        """
+        回复按写出顺序匹配，前一块的回复到达时本块可能还在线路上，按整个窗口的传输时间估算
+        :return: float 写出 size 字节并收到回复的超时保护，单位秒
+        """
+        return self.__sanxi.reply_timeout + self.window * size * 10.0 / self.baud_rate
+
+    def __request(self, send_code, timeout=None):
+        """
+        发送一条文件命令并等待回复行
+        :return: (Bool 是否为 OK, dict 回复中的值)
+        """
+        if timeout is None:
+            timeout = self.__timeout(len(send_code))
+        return file_reply(self.__sanxi.request(send_code, FILE_REPLY, timeout))
+
+    def __submit_chunk(self, index, chunk):
+        send_code = FILE_DATA_CODE % (index, len(chunk), crc32(chunk)) + chunk
+        timeout = self.__timeout(len(send_code))
+        job = self.__sanxi._submit(send_code, [(FILE_REPLY, timeout)], PRIORITY_NORMAL, None, self.window)
+        return job, index, send_code, timeout
+
+    def __chunk_verified(self, job, index, send_code, timeout):
+        """
+        等待一块的回复，并核对块号与控制器计算的 CRC
+        :return: Bool
+        """
+        job.wait()
+        reply = self.__sanxi._collect_replies(job, [(send_code, FILE_REPLY, timeout)])[0]
+        ok, values = file_reply(reply)
+        header_end = send_code.index(b'\n') + 1
+        return ok and values.get(b'I') == index and values.get(b'CRC') == crc32(send_code[header_end:])
+
+    def __fail(self, reason, program, lines, chunks, retries, start_time):
+        self.last_error = reason
+        print('Program upload error: ', reason)
+        self.__sanxi._mark_stopped()
+        self.__sanxi.enter_mode(14)  # 退出文件模式
+        return UploadReport(len(program), lines, chunks, retries, time.perf_counter() - start_time, False, False)
+
+    def upload(self, program, run=False):
+        """
+        进入文件模式，分块上传程序并校验，可选地启动程序。协议未经实物验证，见模块说明。
+        未启动程序时结束后回到调试模式（14）；程序已启动时停留在文件模式（11），程序结束后由调用者 enter_mode(14)
+        :param program: str / bytes 程序文本，或可迭代的程序行
+        :param run: Bool 校验通过后是否立即启动程序
+        :return: UploadReport
+        """
+        sanxi = self.__sanxi
+        start_time = time.perf_counter()
+        self.last_error = ''
+        program, lines, chunks = split_program(program, self.chunk_size)
+        if not sanxi.enter_mode(11):
+            return self.__fail('file mode is not confirmed', program, lines, 0, 0, start_time)
+        sanxi._mark_motion(float('inf'))  # 文件模式下不主动采样，直到下一次冻结运动
+        ok, values = self.__request(FILE_OPEN_CODE % (len(program), lines))
+        if not ok:
+            return self.__fail('FILE OPEN is rejected', program, lines, 0, 0, start_time)
+        in_flight = deque()
+        failed = []
+        for index, chunk in enumerate(chunks):
+            while len(in_flight) >= self.window:
+                entry = in_flight.popleft()
+                if not self.__chunk_verified(*entry):
+                    failed.append(entry[1])  # 窗口中后面的块照常发送，失败的块最后按块号重发
+            in_flight.append(self.__submit_chunk(index, chunk))
+        while in_flight:
+            entry = in_flight.popleft()
+            if not self.__chunk_verified(*entry):
+                failed.append(entry[1])
+        retries = 0
+        for index in failed:
+            for attempt in range(self.retries):
+                retries += 1
+                if self.__chunk_verified(*self.__submit_chunk(index, chunks[index])):
+                    break
+            else:
+                return self.__fail('chunk {} failed after {} retries'.format(index, self.retries),
+                                   program, lines, len(chunks), retries, start_time)
+        ok, values = self.__request(FILE_CLOSE_CODE % crc32(program))
+        if not ok or values.get(b'CRC') != crc32(program) or values.get(b'L') != lines:
+            return self.__fail('program verification failed', program, lines, len(chunks), retries, start_time)
+        started = False
+        if run:
+            started = self.__request(FILE_RUN_CODE)[0]
+            if not started:
+                self.last_error = 'FILE RUN is rejected'
+        if not started:
+            sanxi._mark_stopped()
+            sanxi.enter_mode(14)
+        return UploadReport(len(program), lines, len(chunks), retries, time.perf_counter() - start_time, True,
+                            started)
@@ -1,327 +1,1052 @@
-"""
-This module includes the core functions of SANXI robot
-Class: Sanxi, whose base class is RS232 in communication.py module
-Functions: search_origin()
-
-Author: Mr SoSimple
-"""
-
-
-import time
-import re
-
-from communication import RS232
-
-
-class Sanxi(RS232):
-    __VE_MAX = 250000  # 最大速度
-    __AC_MAX = 250000  # 最大加速度
-    __DE_MAX = 250000  # 最大减速度
-
-    def __init__(self):
-        super(Sanxi, self).__init__()
-        self.current_mode = 10
-        self.all_return_code = ''  # Sanxi串口的所有返回數據
-        self.new_return_code = ''  # Sanxi串口新添的返回数据
-        self.return_coord_mode = 1  # 返回坐标值模式：1-cartesian space 0-joint space
-        self.jn_value = []  # 伪实时关节空间坐标值
-        self.xyz_value = []  # 伪实时笛卡尔空间坐标值
-        # 正则表达式预编译
-        # self.G_detect_pattern = re.compile(r'.*G.*')  # 检测 G字符 与下面表达式联合抽取返回的坐标值
-        self.jn_pattern = re.compile('.*J1=(.*) J2=(.*) J3=(.*) J4=(.*) J5=(.*) J6=(.*)\r\s')
-        self.xyz_pattern = re.compile('.*X=(.*) Y=(.*) Z=(.*) A=(.*) B=(.*) C=(.*) D=(.*)\r\s')
-
-    def connect_sanxi(self, port_name):
-        """
-        连接三喜机器人
-        :param port_name: string，串口名称 example：port_name='COM3'
-        :return: Bool
-        """
-        self.set_port(port_name)
-        self.set_baud_rate(115200)
-        self.set_timeout(0.05)
-        if self.connect() is True:
-            self.change_to_mode14()  # 初始化为模式14
-            self.set_return_data_mode()  # 初始化返回坐标模式为 cartesian space
-            return True
-        else:
-            return False
-
-    def query_current_mode(self):
-        """
-        向串口发送模式询问指令
-        :return: int 0-询问失败 10-空闲模式 14-调试模式 15-复位模式 12-回零模式 11-文件模式
-        """
-        self.send_cmd('\x05', 0.001)
-        if self.new_return_code == '\x10':
-            # 空闲模式
-            self.current_mode = 10
-            return 10
-        elif self.new_return_code == '\x14':
-            # 调试模式
-            self.current_mode = 14
-            return 14
-        elif self.new_return_code == '\x15':
-            # 复位模式
-            self.current_mode = 15
-            return 15
-        elif self.new_return_code == '\x12':
-            # 回零模式
-            self.current_mode = 12
-            return 12
-        elif self.new_return_code == '\x11':
-            # 文件模式
-            self.current_mode = 11
-            return 11
-        else:
-            return 0
-
-    def send_cmd(self, send_code, delay_time, has_return_code=True):
-        """
-        统一管理命令发送，延迟delay_time之后更新串口消息
-        :param send_code: str  要发送的字符串
-        :param delay_time: int 延迟接收串口返回的时间
-        :param has_return_code: Bool 是否更新串口返回的数据，一般只在串口无返回消息时设为假
-        :return:
-        """
-        self._send(send_code)
-        time.sleep(delay_time)
-        if has_return_code is True:
-            self._update_return_code()
-
-    def _update_return_code(self):
-        """
-        更新串口消息
-        :return:
-        """
-        self.new_return_code = self._receive_all()
-        self.all_return_code = self.all_return_code + self.new_return_code
-
-    def set_return_data_mode(self, mode=1):
-        """
-        设置返回数据模式，直角坐标模式 或 关节坐标模式，默认前者
-        :param mode: int 1-cartesian space 0-joint space
-        :return: Bool
-        """
-        if mode == 1:
-            if self.return_coord_mode == 0:
-                self.jn_value.clear()
-            self.send_cmd('G07 GCM=1\n', 0.003)
-            self.return_coord_mode = 1
-            return True
-        elif mode == 0:
-            if self.return_coord_mode == 1:
-                self.xyz_value.clear()
-            self.send_cmd('G07 GCM=0\n', 0.003)
-            self.return_coord_mode = 0
-            return True
-        else:
-            return False
-
-    def query_coord(self):
-        print('into query coord func!')
-        self.freeze_motion()
-        if self.current_mode != 14:
-            self.change_to_mode14()
-        self.send_cmd('\x30', 0.014)
-        self._extract_output_info()
-        if self.return_coord_mode == 1:
-            return self.xyz_value
-        elif self.return_coord_mode == 0:
-            return self.jn_value
-        else:
-            return False
-
-    def disconnect_sanxi(self):
-        """
-        停止运动，转为空闲模式，断开三喜机器人串口连接
-        :return: Bool
-        """
-        self.stop_then_into_free_mode()
-        self.new_return_code = ''
-        self.all_return_code = ''
-        if self.disconnect():
-            return True
-        else:
-            return False
-
-    def set_motion_para(self, vep, acp, dep):
-        """
-        设置运动参数
-        :param vep: 速度百分比
-        :param acp: 加速度百分比
-        :param dep: 减速度百分比
-        :return: None
-        """
-        if self.current_mode != 14:
-            self.change_to_mode14()
-        ve = vep * self.__VE_MAX / 100
-        ac = acp * self.__AC_MAX / 100
-        de = dep * self.__DE_MAX / 100
-        self.send_cmd('G07 VE={}\n'.format(str(ve)), 0.004)
-        self.send_cmd('G07 AC={}\n'.format(str(ac)), 0.004)
-        self.send_cmd('G07 DE={}\n'.format(str(de)), 0.004)
-
-    def _extract_output_info(self):
-        """
-        接收返回消息并抽取返回消息中的坐标信息
-        :return: None
-        """
-        print('into extract func')
-        print(self.new_return_code)
-        jn_match = self.jn_pattern.match(str(self.new_return_code))  # 正则表达式匹配
-        xyz_match = self.xyz_pattern.match(str(self.new_return_code))
-        if jn_match:
-            self.jn_value.clear()
-            for i in range(1, 7):
-                self.jn_value.append(float(jn_match.group(i)))
-        if xyz_match:
-            self.xyz_value.clear()
-            for i in range(1, 8):
-                self.xyz_value.append(float(xyz_match.group(i)))
-            print('extracted xyz', self.xyz_value[0], self.xyz_value[1], '...')
-
-    def change_to_mode14(self):
-        self.freeze_motion()
-        self.send_cmd('\x10', 0.002)
-        self.send_cmd('\x14', 0.002)
-        self.current_mode = 14
-
-    def search_origin(self):
-        """
-        启动搜寻原点内置程序，原理：限位光电开关
-        :return: None
-        """
-        self.freeze_motion()
-        self.send_cmd('\x10', 0.002)
-        self.send_cmd('\x12', 0.001)
-        self.current_mode = 10
-
-    def back2origin(self):
-        """
-        复位：回到原点
-        :return: None
-        """
-        self.freeze_motion()
-        self.send_cmd('\x10', 0.002)
-        self.send_cmd('\x15', 0.002)
-        self.current_mode = 15
-
-    def rect_move(self, mode, **rect_dict):
-        """
-        直角坐标运动，点对点, 或直线
-        :param mode: mode='p2p' OR mode='line'
-        :param rect_dict: 字典——直角坐标目标值，{'X': float, ...}
-        :return:
-        """
-        send_data = ''
-        if mode == 'p2p':
-            send_data += 'G20 '
-        if mode == 'line':
-            send_data += 'G21 '
-        all_keys = ['X', 'Y', 'Z', 'A', 'B', 'C', 'D']
-        for key in all_keys:
-            if rect_dict[key] and (rect_dict[key] != ' '):
-                send_data += '{0}={1} '.format(key, str(round(rect_dict[key], 2)))
-        send_data += '\n'
-        if self.current_mode != 14:
-            self.change_to_mode14()
-        self.send_cmd(send_data, 0.014)
-
-    def multi_joints_motion(self, **j_dict):
-        """
-        关节运动，点对点
-        :param j_dict: 字典——六轴目标值，{'J*': float, ...}
-        :return:
-        """
-        send_data = 'G00 '
-        for key in j_dict.keys():
-            if key == 'J1':
-                if j_dict[key] > 160:
-                    j_dict[key] = 160
-                    print('WARNING: Joint 1 is higher than the upper limit!')
-                elif j_dict[key] < -160:
-                    j_dict[key] = -160
-                    print('WARNING: Joint 1 is lower than the lower limit!')
-            elif key == 'J2':
-                if j_dict[key] > 118:
-                    j_dict[key] = 118
-                    print('WARNING: Joint 2 is higher than the upper limit!')
-                elif j_dict[key] < -130:
-                    j_dict[key] = -130
-                    print('WARNING: Joint 2 is lower than the lower limit!')
-            elif key == 'J3':
-                if j_dict[key] > 15:
-                    j_dict[key] = 15
-                    print('WARNING: Joint 3 is higher than the upper limit!')
-                elif j_dict[key] < -180:
-                    j_dict[key] = -180
-                    print('WARNING: Joint 3 is lower than the lower limit!')
-            elif key == 'J4':
-                if j_dict[key] > 140:
-                    j_dict[key] = 140
-                    print('WARNING: Joint 4 is higher than the upper limit!')
-                elif j_dict[key] < -140:
-                    j_dict[key] = -140
-                    print('WARNING: Joint 4 is lower than the lower limit!')
-            elif key == 'J5':
-                if j_dict[key] > 90:
-                    j_dict[key] = 90
-                    print('WARNING: Joint 5 is higher than the upper limit!')
-                elif j_dict[key] < -130:
-                    j_dict[key] = -130
-                    print('WARNING: Joint 5 is lower than the lower limit!')
-            send_data += '{0}={1} '.format(key, str(round(j_dict[key], 2)))
-        send_data += '\n'
-        if self.current_mode != 14:
-            self.change_to_mode14()
-        self.send_cmd(send_data, 0.014)
-
-    def single_joint_motion_start(self, n, is_positive):
-        """
-        第n轴单轴运动
-        :param n: 第n轴单动，eg 1   代表第一轴
-        :param is_positive: True-顺时针或 向上, False-逆时针或向下
-        :return:
-        """
-        if n in [2, 3, 5]:
-            if is_positive:
-                send_data = 'J{}+\n'.format(str(n))
-            else:
-                send_data = 'J{}-\n'.format(str(n))
-        else:
-            if is_positive:
-                send_data = 'J{}-\n'.format(str(n))
-            else:
-                send_data = 'J{}+\n'.format(str(n))
-        if self.current_mode != 14:
-            self.change_to_mode14()
-        self.send_cmd(send_data, 0.001, False)
-
-    def single_joint_motion_stop(self, n):
-        """
-        第n轴停止单轴运动
-        :param n: 第n轴停止单动，eg 1   代表第一轴
-        :return:
-        """
-        send_data = 'J{}0\n'.format(str(n))
-        self._send(send_data)
-        time.sleep(0.002)
-        self.send_cmd(send_data, 0.001, False)
-
-    def freeze_motion(self):
-        self.send_cmd('\x30', 0.014)
-
-    def stop_then_into_free_mode(self):
-        """
-        终止运动，并退出当前模式，设置为空闲模式-0x10
-        :return: None
-        """
-        self.freeze_motion()
-        self.send_cmd('\x10', 0.002)
-        self.current_mode = 10
-
-
-if __name__ == '__main__':
-    sanxi = Sanxi()
-    sanxi.connect_sanxi('COM10')
+"""
+This module includes the core functions of SANXI robot
+Class: Sanxi, whose base class is RS232 in communication.py module
+       ModeStateMachine tracks the controller mode confirmed by acks and plans the minimal mode transitions
+Joint limits and the workspace are limits.LimitTable objects, Sanxi.validate_joints() / validate_rect() check whole
+  trajectories before they are sent.
+submit_rect_move() / submit_joints_motion() / submit_search_origin() return futures resolved by
+  motion_monitor.MotionMonitor when the move has finished.
+Long G-code programs are uploaded in file mode by program_upload.ProgramUploader, see Sanxi.upload_program(); its
+  protocol is assumed and only implemented by sanxi_simulator.VirtualSanxi.
+Functions: search_origin()
+
+Author: Mr SoSimple
+"""
+
+
+import time
+import re
+import threading
+from collections import deque, namedtuple
+
+from communication import RS232, ReplyFrame, SerialHistory, PRIORITY_STOP, PRIORITY_NORMAL, PRIORITY_BACKGROUND
+from coord_parser import CoordStreamParser, JointRecord, PoseSnapshot
+from pose import JointPose, CartesianPose
+from limits import default_joint_limits, default_workspace_limits
+from latency_stats import CommandStats
+from program_upload import ProgramUploader
+from motion_monitor import MotionMonitor
+
+
+VE_MAX = 250000  # 最大速度
+AC_MAX = 250000  # 最大加速度
+DE_MAX = 250000  # 最大减速度
+# 预编码的常量命令
+CMD_FREEZE = b'\x30'  # 冻结运动，并返回当前坐标
+CMD_QUERY_MODE = b'\x05'  # 询问当前模式
+CMD_IDLE = b'\x10'  # 空闲模式
+CMD_FILE = b'\x11'  # 文件模式
+CMD_SEARCH_ORIGIN = b'\x12'  # 回零模式
+CMD_MODE14 = b'\x14'  # 调试模式
+CMD_RESET = b'\x15'  # 复位模式
+CMD_GCM = {0: b'G07 GCM=0\n', 1: b'G07 GCM=1\n'}  # 返回坐标模式：1-cartesian space 0-joint space
+JOG_PLUS_CODES = dict([(n, b'J%d+\n' % n) for n in range(1, 7)])  # 单轴正向点动
+JOG_MINUS_CODES = dict([(n, b'J%d-\n' % n) for n in range(1, 7)])  # 单轴负向点动
+JOG_STOP_CODES = dict([(n, b'J%d0\n' % n) for n in range(1, 7)])  # 单轴停止点动
+MODE_CODES = (CMD_IDLE, CMD_FILE, CMD_SEARCH_ORIGIN, CMD_MODE14, CMD_RESET)  # 模式切换字节，控制器以单字节应答
+COMMAND_TYPES = {CMD_FREEZE: 'freeze', CMD_QUERY_MODE: 'query_mode', CMD_IDLE: 'mode10', CMD_FILE: 'mode11',
+                 CMD_SEARCH_ORIGIN: 'mode12', CMD_MODE14: 'mode14', CMD_RESET: 'mode15'}  # 统计用的命令类型名
+MODE_OF_ACK = {CMD_IDLE: 10, CMD_FILE: 11, CMD_SEARCH_ORIGIN: 12, CMD_MODE14: 14, CMD_RESET: 15}
+MODE_COMMANDS = {10: CMD_IDLE, 11: CMD_FILE, 12: CMD_SEARCH_ORIGIN, 14: CMD_MODE14, 15: CMD_RESET}
+RECT_KEYS = ('X', 'Y', 'Z', 'A', 'B', 'C', 'D')
+RECT_MOVE_HEADS = {'p2p': b'G20 ', 'line': b'G21 '}
+DEFAULT_JOINT_LIMITS = default_joint_limits()  # 关节限位表，限位值见 limits.JOINT_LIMITS
+DEFAULT_WORKSPACE_LIMITS = default_workspace_limits()  # 直角坐标工作空间，默认不限
+_code_templates = {}  # 运动命令的字节格式模板缓存
+FRAME_ACK = ReplyFrame(length=1)  # 单字节模式应答，如 \x10 \x14
+FRAME_LINE = ReplyFrame(terminator=b'\r\n')  # \r\n 结尾的回复行，如 J1=.. 或 X=.. 坐标行
+FRAME_COORD = ReplyFrame(terminator=b'\r\n', markers=(b'J1=', b'X='))  # 冻结命令的坐标行，插队写出时可从其他回复中认出
+# 路径流式发送的结果：发送点数，耗时（秒），每秒点数，回复超时数，发送前被截断的点数
+StreamReport = namedtuple('StreamReport', ['points', 'seconds', 'points_per_second', 'timeouts', 'clamped'])
+# 正则表达式预编译
+JN_PATTERN = re.compile('.*J1=(.*) J2=(.*) J3=(.*) J4=(.*) J5=(.*) J6=(.*)\r\s')
+XYZ_PATTERN = re.compile('.*X=(.*) Y=(.*) Z=(.*) A=(.*) B=(.*) C=(.*) D=(.*)\r\s')
+
+
+def reply_frame_of(send_code):
+    """
+    根据命令推断回复帧形状
+    :param send_code: bytes 要发送的命令
+    :return: ReplyFrame
+    """
+    if send_code in MODE_CODES or send_code == CMD_QUERY_MODE:
+        return FRAME_ACK
+    if send_code == CMD_FREEZE:
+        return FRAME_COORD
+    return FRAME_LINE
+
+
+def command_type(send_code):
+    """
+    命令类型，用于往返时间统计，例如 'freeze' 'G21' 'G07 VE' 'jog'
+    :param send_code: bytes 要发送的命令
+    :return: str
+    """
+    name = COMMAND_TYPES.get(send_code)
+    if name is not None:
+        return name
+    head = send_code.split(b' ', 2)
+    if head[0] == b'G07' and len(head) > 1:
+        return 'G07 ' + head[1].split(b'=', 1)[0].decode(errors='replace')
+    if head[0] == b'FILE' and len(head) > 1:
+        return 'FILE ' + head[1].strip().decode(errors='replace')
+    head = head[0].strip()
+    if len(head) == 3 and head[:1] == b'J':
+        return 'jog_stop' if head[2:] == b'0' else 'jog'
+    return head.decode(errors='replace')
+
+
+def motion_para_codes(vep, acp, dep):
+    """
+    生成设置运动参数的三条命令
+    :param vep: 速度百分比
+    :param acp: 加速度百分比
+    :param dep: 减速度百分比
+    :return: list of bytes
+    """
+    ve = vep * VE_MAX / 100
+    ac = acp * AC_MAX / 100
+    de = dep * DE_MAX / 100
+    return [b'G07 VE=%r\n' % ve, b'G07 AC=%r\n' % ac, b'G07 DE=%r\n' % de]
+
+
+def _code_template(head, keys):
+    """
+    按命令头和坐标键生成字节格式模板并缓存，例如 b'G21 X=%.2f Y=%.2f \\n'
+    """
+    template = _code_templates.get((head, keys))
+    if template is None:
+        template = head + b''.join([key.encode() + b'=%.2f ' for key in keys]) + b'\n'
+        _code_templates[(head, keys)] = template
+    return template
+
+
+def rect_move_code(mode, rect, limits=None):
+    """
+    生成直角坐标运动命令，超出工作空间的坐标被截断，值为 0 或 ' ' 的坐标不发送
+    :param mode: mode='p2p' OR mode='line'
+    :param rect: CartesianPose，或字典——直角坐标目标值，{'X': float, ...}
+    :param limits: limits.LimitTable 工作空间，None 表示 DEFAULT_WORKSPACE_LIMITS
+    :return: bytes
+    """
+    if limits is None:
+        limits = DEFAULT_WORKSPACE_LIMITS
+    keys = []
+    values = []
+    for index, key in enumerate(RECT_KEYS):
+        value = rect[index] if isinstance(rect, CartesianPose) else rect[key]
+        if value and (value != ' '):
+            keys.append(key)
+            values.append(limits.clamp(index, float(value)))
+    return _code_template(RECT_MOVE_HEADS.get(mode, b''), tuple(keys)) % tuple(values)
+
+
+def joints_motion_code(joints, axes=None, limits=None):
+    """
+    生成关节运动命令，超出限位的关节值被截断到限位，截断后的值写回参数
+    :param joints: JointPose，或字典——六轴目标值，{'J*': float, ...}
+    :param axes: tuple of int 只对 JointPose 有效，要发送的轴号，例如 (4, 5)，None 表示全部六轴
+    :param limits: limits.LimitTable 关节限位，None 表示 DEFAULT_JOINT_LIMITS
+    :return: bytes
+    """
+    if limits is None:
+        limits = DEFAULT_JOINT_LIMITS
+    if isinstance(joints, JointPose):
+        if axes is None:
+            axes = (1, 2, 3, 4, 5, 6)
+            keys = JointPose.KEYS
+        else:
+            keys = tuple([JointPose.KEYS[n - 1] for n in axes])
+        values = []
+        for n in axes:
+            value = joints[n - 1] = limits.clamp(n - 1, joints[n - 1])
+            values.append(value)
+        return _code_template(b'G00 ', keys) % tuple(values)
+    values = []
+    for key in joints.keys():
+        value = joints[key] = limits.clamp(int(key[1:]) - 1, float(joints[key]))
+        values.append(value)
+    return _code_template(b'G00 ', tuple(joints.keys())) % tuple(values)
+
+
+def extract_coord(return_code):
+    """
+    抽取返回消息中的坐标信息
+    :param return_code: str 串口返回消息
+    :return: tuple (关节坐标 list 或 None, 直角坐标 list 或 None)
+    """
+    jn_match = JN_PATTERN.match(str(return_code))  # 正则表达式匹配
+    xyz_match = XYZ_PATTERN.match(str(return_code))
+    jn_value = None
+    xyz_value = None
+    if jn_match:
+        jn_value = [float(jn_match.group(i)) for i in range(1, 7)]
+    if xyz_match:
+        xyz_value = [float(xyz_match.group(i)) for i in range(1, 8)]
+    return jn_value, xyz_value
+
+
+class ModeStateMachine(object):
+    """
+    控制器模式状态机：只以控制器的应答（模式切换字节的回显、\x05 询问的回复）确认当前模式，
+    并计算切换到目标模式所需的最少命令。应答缺失或不符时状态变为未确认，下次切换前用一次 \x05 询问重新同步
+    模式：10-空闲 11-文件 12-回零 14-调试 15-复位
+    """
+    def __init__(self):
+        super(ModeStateMachine, self).__init__()
+        self.mode = 10  # 最近一次确认（或假定）的模式
+        self.confirmed = False  # mode 是否已由应答确认
+        self.transition_count = 0  # 发送了切换命令的次数
+        self.skipped_count = 0  # 已处于目标模式而省去切换的次数
+        self.resync_count = 0  # 用 \x05 询问重新同步的次数
+
+    def observe(self, send_code, reply):
+        """
+        根据一条模式命令及其回复更新状态
+        :param send_code: bytes 模式切换字节或 \x05
+        :param reply: bytes 控制器的回复，超时时为已收到的部分
+        :return: Bool 回复是否确认了模式
+        """
+        mode = MODE_OF_ACK.get(reply)
+        if mode is None or (send_code != CMD_QUERY_MODE and reply != send_code):
+            self.confirmed = False
+            return False
+        self.mode = mode
+        self.confirmed = True
+        return True
+
+    def invalidate(self):
+        """
+        控制器可能自行改变了模式（回零、复位结束后），下次切换前重新询问
+        """
+        self.confirmed = False
+
+    def plan(self, target_mode):
+        """
+        :param target_mode: int 目标模式
+        :return: list of bytes 从当前模式切换到目标模式要发送的命令，已确认处于目标模式时为空列表
+        """
+        if self.confirmed and self.mode == target_mode:
+            return []
+        if self.confirmed and self.mode == 10:
+            return [MODE_COMMANDS[target_mode]]  # 空闲模式下直接进入目标模式
+        codes = [CMD_FREEZE, CMD_IDLE]  # 冻结运动，退出当前模式
+        if target_mode != 10:
+            codes.append(MODE_COMMANDS[target_mode])
+        return codes
+
+
+class CommandBatch(object):
+    """
+    命令批处理：收集多条命令，预先拼接成一个缓冲区一次写出，之后再按顺序匹配各条命令的回复
+    设置 max_lines 时每次最多写出 max_lines 条，收到这些回复（或超时）后再写下一段，避免长脚本一次灌满控制器的接收缓冲
+    用法：with sanxi.batch() as batch: batch.add(...)，退出 with 语句时发送，回复保存在 batch.replies
+    """
+    def __init__(self, sanxi, priority=PRIORITY_NORMAL, max_lines=None):
+        """
+        :param sanxi: Sanxi
+        :param priority: int 写出优先级
+        :param max_lines: int 每次写出的命令条数上限，None 表示全部一次写出
+        """
+        super(CommandBatch, self).__init__()
+        self.__sanxi = sanxi
+        self.__priority = priority
+        self.max_lines = max_lines
+        self.__requests = []  # [(send_code, frame, timeout), ...]
+        self.replies = []
+
+    def __len__(self):
+        return len(self.__requests)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.send()
+        return False
+
+    def add(self, send_code, timeout=None, has_return_code=True):
+        """
+        添加一条命令
+        :param send_code: bytes 或 str  要发送的命令
+        :param timeout: float 该命令回复的超时保护，默认为 reply_timeout
+        :param has_return_code: Bool 该命令是否有回复
+        :return: CommandBatch 便于链式调用
+        """
+        if isinstance(send_code, str):
+            send_code = send_code.encode()
+        if timeout is None:
+            timeout = self.__sanxi.reply_timeout
+        if has_return_code is True:
+            frame = reply_frame_of(send_code)
+        else:
+            frame = None
+        self.__requests.append((send_code, frame, timeout))
+        return self
+
+    def send(self):
+        """
+        写出全部命令并匹配回复，设置 max_lines 时分段写出，每段的回复到齐后再写下一段
+        :return: list of bytes 每条命令的回复
+        """
+        if self.__requests:
+            requests = self.__requests
+            size = self.max_lines or len(requests)
+            self.replies = []
+            for start in range(0, len(requests), size):
+                self.replies.extend(self.__sanxi.request_many(requests[start:start + size], self.__priority))
+            self.__requests = []
+        return self.replies
+
+
+class TrajectoryStreamer(object):
+    """
+    路径点流式发送：最多保持 look_ahead 条运动命令在途（已写出、回复未到），每收到一条回复再补发一条，
+    按控制器的实际处理速度而不是固定延时发送整条路径。
+    控制器是否对运动命令回复一行没有文档，line_ack 为 None 时第一个点单独发送并等待 probe_timeout 探测：
+    有回复则按回复流控，没有回复则与逐条 rect_move 相同，每条命令之后等待 line_interval，不会比逐条发送慢
+    用法：report = sanxi.stream_trajectory(points, 'joint')，另一个线程可调用 sanxi.streamer.stop() 中止
+    """
+    def __init__(self, sanxi, look_ahead=4, reply_timeout=0.5, line_ack=None, line_interval=0.014,
+                 probe_timeout=0.05):
+        """
+        :param sanxi: Sanxi
+        :param look_ahead: int 在途命令数上限，即占用控制器命令缓冲的条数
+        :param reply_timeout: float 单条命令回复的超时保护，单位秒
+        :param line_ack: Bool 控制器是否对每条运动命令回复一行，None 表示未知，第一次发送时探测
+        :param line_interval: float 控制器不回复时每条命令之后的等待时间，单位秒
+        :param probe_timeout: float 探测时等待回复的时间，单位秒
+        """
+        super(TrajectoryStreamer, self).__init__()
+        self.__sanxi = sanxi
+        self.look_ahead = look_ahead
+        self.reply_timeout = reply_timeout
+        self.line_ack = line_ack
+        self.line_interval = line_interval
+        self.probe_timeout = probe_timeout
+        self.sent = 0  # 本次已发送的点数
+        self.__stop_flag = False
+        self.__joint_pose = JointPose()  # 编码用的预分配位姿
+        self.__rect_pose = CartesianPose()
+
+    def stop(self):
+        """
+        停止补发，已在途的命令仍会执行完，需要立即停止时再调用 freeze_motion()
+        """
+        self.__stop_flag = True
+
+    def __encode(self, point, space, axes):
+        sanxi = self.__sanxi
+        if space == 'joint':
+            pose = point if isinstance(point, JointPose) else self.__joint_pose.set(point)
+            return joints_motion_code(pose, axes, sanxi.joint_limits)
+        pose = point if isinstance(point, CartesianPose) else self.__rect_pose.set(point)
+        return rect_move_code(space, pose, sanxi.workspace_limits)
+
+    def __retire(self, job, send_code):
+        """
+        等待最早的在途命令的回复
+        :return: int 1-回复超时 0-正常
+        """
+        job.wait()
+        self.__sanxi._collect_replies(job, [(send_code, FRAME_LINE, self.reply_timeout)])
+        return 0 if job.complete[0] else 1
+
+    def __probe(self, send_code):
+        """
+        单独发送一条运动命令并等待回复，确定 line_ack
+        """
+        sanxi = self.__sanxi
+        sanxi._mark_motion()
+        self.line_ack = bool(sanxi.request(send_code, FRAME_LINE, self.probe_timeout))
+
+    def __send_paced(self, send_code):
+        """
+        控制器不回复时：写出后等待 line_interval
+        """
+        sanxi = self.__sanxi
+        sanxi._mark_motion()
+        sanxi.request(send_code, None, 0)
+        sanxi._sleep(command_type(send_code), self.line_interval)
+
+    def stream(self, waypoints, space='joint', axes=None):
+        """
+        发送整条路径，返回时全部命令都已收到回复（或超时）
+        :param waypoints: numpy 数组或可迭代的路径点；'joint': 每点 6 个关节值，'line'/'p2p': 每点 7 个直角坐标值。
+                          numpy 数组先整体做限位检查与截断，其他可迭代对象逐点截断，可边生成边发送
+        :param space: 'joint' 关节运动 G00，'line' 直线运动 G21，'p2p' 点对点运动 G20
+        :param axes: tuple of int 关节路径只发送这些轴，None 表示全部六轴
+        :return: StreamReport
+        """
+        sanxi = self.__sanxi
+        self.__stop_flag = False
+        self.sent = 0
+        clamped = 0
+        if hasattr(waypoints, 'shape'):
+            limits = sanxi.joint_limits if space == 'joint' else sanxi.workspace_limits
+            report = limits.check(waypoints)
+            clamped = int(len(report.valid) - report.valid.sum())
+            waypoints = report.values
+        sanxi.enter_mode(14)
+        in_flight = deque()
+        timeouts = 0
+        start_time = time.perf_counter()
+        for point in waypoints:
+            if self.__stop_flag:
+                break
+            send_code = self.__encode(point, space, axes)
+            self.sent += 1
+            if self.line_ack is None:
+                self.__probe(send_code)
+                continue
+            if not self.line_ack:
+                self.__send_paced(send_code)
+                continue
+            while len(in_flight) >= self.look_ahead:
+                timeouts += self.__retire(*in_flight.popleft())  # 缓冲已满：等最早的回复
+            sanxi._mark_motion()
+            job = sanxi._submit(send_code, [(FRAME_LINE, self.reply_timeout)], PRIORITY_NORMAL, None,
+                                self.look_ahead)
+            in_flight.append((job, send_code))
+        while in_flight:
+            timeouts += self.__retire(*in_flight.popleft())
+        seconds = time.perf_counter() - start_time
+        return StreamReport(self.sent, seconds, self.sent / seconds if seconds > 0 else 0.0, timeouts, clamped)
+
+
+class Sanxi(RS232):
+    def __init__(self):
+        super(Sanxi, self).__init__()
+        self.mode_machine = ModeStateMachine()  # 由应答确认的控制器模式
+        self.joint_limits = default_joint_limits()  # 本机器人的关节限位，可用 set_limit() 修改
+        self.workspace_limits = default_workspace_limits()  # 本机器人的直角坐标工作空间
+        self.streamer = TrajectoryStreamer(self)  # 路径点流式发送
+        self.uploader = ProgramUploader(self)  # 文件模式程序上传
+        self.motion_monitor = MotionMonitor(self)  # 跟踪运动是否完成
+        self.reply_timeout = 0.05  # 有确定回复的命令（模式应答、坐标行）的超时保护，单位秒
+        self.return_code_history = SerialHistory()  # Sanxi串口的所有返回數據，有界，默认保留最新 1MB
+        self.command_stats = CommandStats()  # 按命令类型统计的往返时间直方图
+        self.new_return_bytes = b''  # Sanxi串口新添的返回数据
+        self.return_coord_mode = 1  # 返回坐标值模式：1-cartesian space 0-joint space
+        self.jn_value = JointPose()  # 伪实时关节空间坐标值，原地更新
+        self.xyz_value = CartesianPose()  # 伪实时笛卡尔空间坐标值，原地更新
+        self.coord_parser = CoordStreamParser()  # 接收数据的流式坐标解析器
+        self.__coord_lock = threading.Lock()  # 多个线程的回复都经过解析器
+        # 位姿遥测：pose_snapshot 整体替换，任何线程可直接读取
+        self.pose_snapshot = PoseSnapshot(None, None, 0)
+        self.telemetry_rate = 10.0  # 主动采样频率，单位Hz
+        # 运动命令发出后暂停主动采样的时间，单位秒；None 表示直到下一次冻结（运动何时结束未知，不能冒险打断）
+        self.telemetry_motion_hold = None
+        self.__motion_until = 0.0  # 在此时刻之前视为仍在运动
+        self.__untracked_until = 0.0  # 在此时刻之前有 motion_monitor 未跟踪的运动
+        self.last_motion_time = 0.0  # 最近一次发出运动命令的时刻，早于它的坐标记录可能已过时
+        self.__jog_axes = set()  # 正在点动的轴
+        self.__telemetry_thread = None
+        self.__telemetry_stop = threading.Event()
+        self.pose_cache_window = 0.02  # query_pose() 结果的默认有效期，同一控制周期内的多个调用共用一次查询，单位秒
+        self.__pose_query_lock = threading.Lock()
+        # 正则表达式预编译
+        # self.G_detect_pattern = re.compile(r'.*G.*')  # 检测 G字符 与下面表达式联合抽取返回的坐标值
+        self.jn_pattern = JN_PATTERN
+        self.xyz_pattern = XYZ_PATTERN
+
+    def connect_sanxi(self, port_name):
+        """
+        连接三喜机器人
+        :param port_name: string，串口名称 example：port_name='COM3'
+        :return: Bool
+        """
+        self.set_port(port_name)
+        self.set_baud_rate(115200)
+        self.set_timeout(0.05)
+        if self.connect() is True:
+            self.change_to_mode14()  # 初始化为模式14
+            self.set_return_data_mode()  # 初始化返回坐标模式为 cartesian space
+            return True
+        else:
+            return False
+
+    @property
+    def current_mode(self):
+        """
+        :return: int 控制器模式，是否已确认见 mode_machine.confirmed
+        """
+        return self.mode_machine.mode
+
+    def query_current_mode(self):
+        """
+        向串口发送模式询问指令
+        :return: int 0-询问失败 10-空闲模式 14-调试模式 15-复位模式 12-回零模式 11-文件模式
+        """
+        ack = self.request(CMD_QUERY_MODE, FRAME_ACK, self.reply_timeout)
+        return MODE_OF_ACK.get(ack, 0)
+
+    def enter_mode(self, target_mode):
+        """
+        切换到目标模式：模式未确认时先发送一次 \x05 询问重新同步，之后只发送需要的切换命令，并以应答确认
+        :param target_mode: int 10-空闲模式 11-文件模式 12-回零模式 14-调试模式 15-复位模式
+        :return: Bool 是否确认处于目标模式
+        """
+        machine = self.mode_machine
+        if not machine.confirmed:
+            machine.resync_count += 1
+            self.query_current_mode()
+        codes = machine.plan(target_mode)
+        if not codes:
+            machine.skipped_count += 1
+            return True
+        machine.transition_count += 1
+        with self.batch() as batch:
+            for code in codes:
+                batch.add(code)
+        if codes[0] == CMD_FREEZE:
+            self._mark_stopped()
+        return machine.confirmed and machine.mode == target_mode
+
+    def send_cmd(self, send_code, delay_time, has_return_code=True, priority=PRIORITY_NORMAL, guard=None):
+        """
+        统一管理命令发送，按命令推断回复帧形状，回复到达后立即更新串口消息
+        :param send_code: bytes 或 str  要发送的命令
+        :param delay_time: float 等待串口返回的最长时间，单位秒
+        :param has_return_code: Bool 是否更新串口返回的数据，一般只在串口无返回消息时设为假
+        :param priority: int 写出优先级，PRIORITY_STOP 的命令插队写出
+        :param guard: function() -> Bool 轮到写出时返回假则放弃写出，None 表示总是写出
+        :return:
+        """
+        if isinstance(send_code, str):
+            send_code = send_code.encode()
+        if has_return_code is True:
+            self.request(send_code, reply_frame_of(send_code), delay_time, priority, guard)
+        else:
+            self.request(send_code, None, delay_time, priority, guard)
+            self._sleep(command_type(send_code), delay_time)
+
+    def request(self, send_code, frame, timeout, priority=PRIORITY_NORMAL, guard=None):
+        """
+        发送命令并等待完整回复帧，回复到达即返回，timeout 仅为超时保护
+        :param send_code: bytes  要发送的命令
+        :param frame: ReplyFrame 回复帧形状，None 表示该命令无回复
+        :param timeout: float 超时保护，单位秒
+        :param priority: int 写出优先级，PRIORITY_STOP 的命令插队写出
+        :param guard: function() -> Bool 轮到写出时返回假则放弃写出，回复为 b''
+        :return: bytes 回复数据，超时时为已收到的部分
+        """
+        return self.request_many([(send_code, frame, timeout)], priority, guard)[0]
+
+    def request_many(self, requests, priority=PRIORITY_NORMAL, guard=None):
+        """
+        批量发送：所有命令拼接后由写线程一次写出，之后按发送顺序逐条匹配回复帧
+        :param requests: list of (bytes send_code, frame, timeout)，frame 为 None 表示该命令无回复
+        :param priority: int 写出优先级，PRIORITY_STOP 的命令插队写出
+        :param guard: function() -> Bool 轮到写出时返回假则整批放弃写出
+        :return: list of bytes 每条命令的回复，无回复的命令为 b''
+        """
+        frames = [(frame, timeout) for send_code, frame, timeout in requests if frame is not None]
+        job = self._transact(b''.join([send_code for send_code, frame, timeout in requests]), frames, priority,
+                             guard)
+        return self._collect_replies(job, requests)
+
+    def _collect_replies(self, job, requests):
+        """
+        处理已完成的写出任务：更新串口消息、坐标、模式状态与统计
+        :param job: WriteJob 已完成的写出任务
+        :param requests: list of (bytes send_code, frame, timeout) 任务中的命令
+        :return: list of bytes 每条命令的回复，无回复的命令为 b''
+        """
+        self.return_code_history.append(job.stale)  # 写出前残留的数据只记入历史，不当作本次回复
+        self._parse_coord(job.stale)
+        replies = []
+        index = 0
+        for send_code, frame, timeout in requests:
+            if frame is None:
+                self._record_request(job, send_code, -1)
+                replies.append(b'')
+                continue
+            self._update_return_code(job.replies[index])
+            self._record_request(job, send_code, index)
+            if frame is FRAME_ACK:
+                self.mode_machine.observe(send_code, job.replies[index])
+            replies.append(job.replies[index])
+            index += 1
+        return replies
+
+    def _record_request(self, job, send_code, index):
+        """
+        记录一次命令往返的统计数据
+        :param job: WriteJob 命令所在的写出任务
+        :param send_code: bytes 发送的命令
+        :param index: int 该命令的回复在 job.replies 中的序号，-1 表示无回复
+        :return: None
+        """
+        if job.send_time is None:
+            return  # 未写出（串口未连接）
+        queue_wait = job.send_time - job.queued_time
+        if index < 0:
+            self.command_stats.record_request(command_type(send_code), len(send_code), 0, None, 0.0, True,
+                                              queue_wait)
+            return
+        first_byte = None
+        if index == 0 and job.first_byte_time is not None:
+            first_byte = job.first_byte_time - job.send_time
+        self.command_stats.record_request(command_type(send_code), len(send_code), len(job.replies[index]),
+                                          first_byte, job.reply_times[index] - job.send_time,
+                                          job.complete[index], queue_wait)
+
+    def _sleep(self, cmd_type, delay_time):
+        """
+        固定延时等待，并计入统计
+        :param cmd_type: str 命令类型
+        :param delay_time: float 单位秒
+        :return: None
+        """
+        start_time = time.perf_counter()
+        time.sleep(delay_time)
+        self.command_stats.record_sleep(cmd_type, time.perf_counter() - start_time)
+
+    def batch(self, priority=PRIORITY_NORMAL, max_lines=None):
+        """
+        创建命令批处理
+        :param priority: int 写出优先级
+        :param max_lines: int 每次写出的命令条数上限，None 表示全部一次写出
+        :return: CommandBatch
+        """
+        return CommandBatch(self, priority, max_lines)
+
+    def _update_return_code(self, receive_data=None):
+        """
+        更新串口消息
+        :param receive_data: bytes 新收到的数据，默认取出接收缓冲区中的全部数据
+        :return:
+        """
+        if receive_data is None:
+            receive_data = self._receive_all_bytes()
+        self.new_return_bytes = receive_data
+        self.return_code_history.append(receive_data)
+        self._parse_coord(receive_data)
+
+    def _parse_coord(self, receive_data):
+        """
+        流式解析接收数据中的坐标行，跨次到达的半行由解析器保留，每得到一条完整记录即更新坐标值
+        :param receive_data: bytes 新收到的数据
+        :return: None
+        """
+        if not receive_data:
+            return
+        with self.__coord_lock:
+            records = self.coord_parser.feed(receive_data)
+            if not records:
+                return
+            joint, cartesian, sequence = self.pose_snapshot
+            for record in records:
+                if isinstance(record, JointRecord):
+                    self.jn_value.set(record, record.timestamp)
+                    joint = record
+                else:
+                    self.xyz_value.set(record, record.timestamp)
+                    cartesian = record
+            self.pose_snapshot = PoseSnapshot(joint, cartesian, sequence + 1)
+
+    def _mark_motion(self, hold=None, tracked=False):
+        """
+        记录发出了运动命令，hold 秒内不主动采样位姿
+        :param hold: float 单位秒，默认 telemetry_motion_hold，两者为 None 时直到下一次冻结
+        :param tracked: Bool 是否为 motion_monitor 跟踪的运动，由它轮询确认结束
+        :return: None
+        """
+        if hold is None:
+            hold = self.telemetry_motion_hold
+        if hold is None:
+            hold = float('inf')
+        self.last_motion_time = time.perf_counter()
+        until = self.last_motion_time + hold
+        self.__motion_until = max(self.__motion_until, until)
+        if not tracked:
+            self.__untracked_until = max(self.__untracked_until, until)
+
+    def _mark_stopped(self):
+        """
+        记录运动已被冻结
+        """
+        self.__jog_axes.clear()
+        self.__motion_until = 0.0
+        self.__untracked_until = 0.0
+
+    def _telemetry_idle(self):
+        """
+        :return: Bool 机器人是否静止，静止时发送 \x30 采样不会打断运动
+        """
+        return not self.__jog_axes and time.perf_counter() >= self.__motion_until
+
+    def _untracked_motion(self):
+        """
+        :return: Bool 是否可能有 motion_monitor 未跟踪的运动或点动在进行
+        """
+        return bool(self.__jog_axes) or time.perf_counter() < self.__untracked_until
+
+    def start_telemetry(self, rate=None):
+        """
+        启动位姿遥测。控制器只能通过 \x30（冻结运动并返回坐标）读取位姿，因此：
+        线路上出现的每一条坐标行（冻结、查询的回复）都被动地更新 pose_snapshot；
+        只有在确知机器人静止时，才以 rate 的频率用后台优先级主动发送 \x30 采样：运动命令发出后直到被冻结
+        （或 telemetry_motion_hold 秒内）都不发送，不会打断运动。不调用本方法时只有被动更新。
+        :param rate: float 主动采样频率，单位Hz，None 表示使用 telemetry_rate
+        :return: None
+        """
+        if rate is not None:
+            self.telemetry_rate = rate
+        if self.__telemetry_thread is not None:
+            return
+        self.__telemetry_stop.clear()
+        self.__telemetry_thread = threading.Thread(target=self.__telemetry_thread_func,
+                                                   name='Sanxi_Telemetry_Thread')
+        self.__telemetry_thread.daemon = True
+        self.__telemetry_thread.start()
+
+    def stop_telemetry(self):
+        self.__telemetry_stop.set()
+        if self.__telemetry_thread is not None and self.__telemetry_thread is not threading.current_thread():
+            self.__telemetry_thread.join()
+        self.__telemetry_thread = None
+
+    # 遥测线程目标函数
+    def __telemetry_thread_func(self):
+        next_time = time.perf_counter()
+        while not self.__telemetry_stop.is_set():
+            if self.is_connected() and self._telemetry_idle():
+                # 排队期间若有运动命令发出，写线程调用 guard 时放弃本次采样
+                self.request(CMD_FREEZE, FRAME_COORD, self.reply_timeout, PRIORITY_BACKGROUND, self._telemetry_idle)
+            next_time += 1.0 / self.telemetry_rate
+            delay = next_time - time.perf_counter()
+            if delay < 0:
+                next_time = time.perf_counter()
+                delay = 0
+            self.__telemetry_stop.wait(delay)
+
+    @property
+    def new_return_code(self):
+        """
+        串口新添的返回数据，按需解码
+        :return: str
+        """
+        return self.new_return_bytes.decode(errors='replace')
+
+    @property
+    def all_return_code(self):
+        """
+        内存中保留的全部串口返回数据
+        :return: str
+        """
+        return self.return_code_history.text()
+
+    def set_history_limit(self, capacity, spill_path=None):
+        """
+        设置串口历史记录的容量上限，以及可选的溢出文件
+        :param capacity: int 内存中保留的最大字节数
+        :param spill_path: str 被挤出的旧数据追加写入的文件，None 表示丢弃
+        :return: None
+        """
+        self.return_code_history.close()
+        self.return_code_history = SerialHistory(capacity, spill_path)
+
+    def set_return_data_mode(self, mode=1):
+        """
+        设置返回数据模式，直角坐标模式 或 关节坐标模式，默认前者
+        :param mode: int 1-cartesian space 0-joint space
+        :return: Bool
+        """
+        if mode == 1:
+            self.send_cmd(CMD_GCM[1], self.reply_timeout)
+            self.return_coord_mode = 1
+            return True
+        elif mode == 0:
+            self.send_cmd(CMD_GCM[0], self.reply_timeout)
+            self.return_coord_mode = 0
+            return True
+        else:
+            return False
+
+    def query_coord(self):
+        print('into query coord func!')
+        self.freeze_motion()
+        self.enter_mode(14)
+        self.request(CMD_FREEZE, FRAME_COORD, self.reply_timeout)
+        self._extract_output_info()
+        if self.return_coord_mode == 1:
+            return self.xyz_value
+        elif self.return_coord_mode == 0:
+            return self.jn_value
+        else:
+            return False
+
+    def _pose_fresh(self, max_age):
+        """
+        :return: Bool pose_snapshot 中的关节坐标与直角坐标是否都在 max_age 秒内更新过
+        """
+        joint, cartesian, sequence = self.pose_snapshot
+        if joint is None or cartesian is None:
+            return False
+        oldest = min(joint.timestamp, cartesian.timestamp)
+        return time.perf_counter() - oldest <= max_age
+
+    def query_pose(self, max_age=None, freeze=False):
+        """
+        同时读取关节坐标与直角坐标。两者都在有效期内时直接返回缓存，不访问串口；
+        否则在机器人确知静止时一次写出 \x30、切换 GCM、\x30、切回 GCM，一个往返得到两个空间的坐标，
+        返回坐标模式保持不变。机器人可能在运动时不发送 \x30（会停止运动），只返回被动更新的最新快照
+        :param max_age: float 缓存有效期，单位秒，None 表示使用 pose_cache_window
+        :param freeze: Bool 机器人可能在运动时也冻结查询，运动被停止，由调用者负责重新发出
+        :return: PoseSnapshot 查询失败的空间为 None 或保留旧记录，可由记录的 timestamp 判断
+        """
+        if max_age is None:
+            max_age = self.pose_cache_window
+        if self._pose_fresh(max_age):
+            return self.pose_snapshot
+        if not freeze and not self._telemetry_idle():
+            return self.pose_snapshot
+        with self.__pose_query_lock:
+            if self._pose_fresh(max_age):
+                return self.pose_snapshot  # 等锁期间已被其他调用者刷新
+            self.enter_mode(14)
+            mode = self.return_coord_mode
+            with self.batch() as batch:
+                batch.add(CMD_FREEZE).add(CMD_GCM[1 - mode]).add(CMD_FREEZE).add(CMD_GCM[mode])
+            return self.pose_snapshot
+
+    def validate_joints(self, points, clamp=True, out=None):
+        """
+        发送前一次检查整条关节轨迹
+        :param points: array-like N×6 关节坐标，单位度
+        :param clamp: Bool 真-截断越限值，假-只报告越限（拒绝）
+        :param out: numpy.ndarray 截断结果写入的数组，可与 points 相同
+        :return: limits.LimitReport
+        """
+        return self.joint_limits.check(points, clamp, out)
+
+    def validate_rect(self, points, clamp=True, out=None):
+        """
+        发送前一次检查整条直角坐标轨迹
+        :param points: array-like N×7 直角坐标 X Y Z A B C D
+        :return: limits.LimitReport
+        """
+        return self.workspace_limits.check(points, clamp, out)
+
+    def stream_trajectory(self, waypoints, space='joint', look_ahead=None, axes=None):
+        """
+        流式发送整条路径，见 TrajectoryStreamer.stream
+        :param waypoints: numpy 数组或可迭代的路径点，'joint' 每点 6 个值，'line'/'p2p' 每点 7 个值
+        :param space: 'joint' 'line' 'p2p'
+        :param look_ahead: int 在途命令数上限，None 表示沿用 streamer.look_ahead
+        :param axes: tuple of int 关节路径只发送这些轴
+        :return: StreamReport 发送点数、耗时与每秒点数
+        """
+        if look_ahead is not None:
+            self.streamer.look_ahead = look_ahead
+        return self.streamer.stream(waypoints, space, axes)
+
+    def upload_program(self, program, run=False):
+        """
+        在文件模式下分块上传程序并校验，见 program_upload.ProgramUploader.upload。
+        文件模式的协议是假定的，只在 sanxi_simulator.VirtualSanxi 上测试过，不要用于实物控制器。
+        未启动程序时结束后回到调试模式（14）；run 为真且程序已启动时停留在文件模式（11），程序结束后须调用 enter_mode(14)
+        :param program: str / bytes 程序文本，或可迭代的程序行
+        :param run: Bool 校验通过后是否立即启动程序
+        :return: UploadReport 失败原因见 uploader.last_error
+        """
+        return self.uploader.upload(program, run)
+
+    def disconnect_sanxi(self):
+        """
+        停止运动，转为空闲模式，断开三喜机器人串口连接
+        :return: Bool
+        """
+        self.stop_telemetry()
+        self.motion_monitor.stop()
+        self.stop_then_into_free_mode()
+        self.new_return_bytes = b''
+        self.return_code_history.clear()
+        if self.disconnect():
+            return True
+        else:
+            return False
+
+    def set_motion_para(self, vep, acp, dep):
+        """
+        设置运动参数
+        :param vep: 速度百分比
+        :param acp: 加速度百分比
+        :param dep: 减速度百分比
+        :return: None
+        """
+        self.enter_mode(14)
+        with self.batch() as batch:
+            for send_data in motion_para_codes(vep, acp, dep):
+                batch.add(send_data, 0.004)
+
+    def _extract_output_info(self, return_bytes=None):
+        """
+        抽取返回消息中的坐标信息；经 _update_return_code 收到的数据已由 coord_parser 流式解析
+        :param return_bytes: bytes 额外要解析的返回消息，None 表示只输出当前坐标
+        :return: None
+        """
+        if return_bytes is not None:
+            self._parse_coord(return_bytes)
+        print('into extract func')
+        print(self.new_return_code)
+        if self.xyz_value:
+            print('extracted xyz', self.xyz_value[0], self.xyz_value[1], '...')
+
+    def change_to_mode14(self):
+        """
+        无条件执行完整的切换：冻结运动，退出当前模式，进入模式14，模式由应答确认
+        :return: Bool 是否确认进入模式14
+        """
+        with self.batch() as batch:
+            batch.add(CMD_FREEZE).add(CMD_IDLE).add(CMD_MODE14)
+        self._mark_stopped()
+        return self.mode_machine.confirmed and self.current_mode == 14
+
+    def search_origin(self):
+        """
+        启动搜寻原点内置程序，原理：限位光电开关
+        :return: None
+        """
+        self.freeze_motion()
+        self._mark_motion(float('inf'))  # 回零过程中不主动采样，直到下一次冻结运动
+        self.request(CMD_IDLE, FRAME_ACK, self.reply_timeout)
+        self.request(CMD_SEARCH_ORIGIN, FRAME_ACK, self.reply_timeout)
+        self.mode_machine.invalidate()  # 回零结束后控制器自行离开模式12
+
+    def back2origin(self):
+        """
+        复位：回到原点
+        :return: None
+        """
+        self.freeze_motion()
+        self._mark_motion(float('inf'))
+        self.request(CMD_IDLE, FRAME_ACK, self.reply_timeout)
+        self.request(CMD_RESET, FRAME_ACK, self.reply_timeout)
+        self.mode_machine.invalidate()
+
+    def rect_move(self, mode, pose=None, **rect_dict):
+        """
+        直角坐标运动，点对点, 或直线
+        :param mode: mode='p2p' OR mode='line'
+        :param pose: CartesianPose 直角坐标目标值，给出时忽略 rect_dict
+        :param rect_dict: 字典——直角坐标目标值，{'X': float, ...}
+        :return:
+        """
+        send_data = rect_move_code(mode, rect_dict if pose is None else pose, self.workspace_limits)
+        self.enter_mode(14)
+        self._mark_motion()
+        self.send_cmd(send_data, 0.014)
+
+    def multi_joints_motion(self, pose=None, axes=None, **j_dict):
+        """
+        关节运动，点对点
+        :param pose: JointPose 关节目标值，给出时忽略 j_dict
+        :param axes: tuple of int 与 pose 一起使用，只发送这些轴，例如 (4, 5)，None 表示全部六轴
+        :param j_dict: 字典——六轴目标值，{'J*': float, ...}
+        :return:
+        """
+        if pose is None:
+            send_data = joints_motion_code(j_dict, limits=self.joint_limits)
+        else:
+            send_data = joints_motion_code(pose, axes, self.joint_limits)
+        self.enter_mode(14)
+        self._mark_motion()
+        self.send_cmd(send_data, 0.014)
+
+    def submit_rect_move(self, mode, pose=None, tolerance=None, timeout=None, **rect_dict):
+        """
+        直角坐标运动，立即返回，运动完成时 future 结束；可连续提交多个运动，在等待期间做其他计算
+        :param mode: mode='p2p' OR mode='line'
+        :param pose: CartesianPose 直角坐标目标值，给出时忽略 rect_dict
+        :param tolerance: float 到达判据，单位mm / 度，None 表示 motion_monitor.tolerances['rect']
+        :param timeout: float 超时，单位秒
+        :param rect_dict: 字典——直角坐标目标值，{'X': float, ...}
+        :return: concurrent.futures.Future，结果为 motion_monitor.MotionResult
+        """
+        send_data = rect_move_code(mode, rect_dict if pose is None else pose, self.workspace_limits)
+        return self.motion_monitor.submit_move('rect', send_data, tolerance, timeout)
+
+    def submit_joints_motion(self, pose=None, axes=None, tolerance=None, timeout=None, **j_dict):
+        """
+        关节运动，立即返回，运动完成时 future 结束，用法：sanxi.submit_joints_motion(J1=10).result()
+        :param pose: JointPose 关节目标值，给出时忽略 j_dict
+        :param axes: tuple of int 与 pose 一起使用，只发送这些轴
+        :param tolerance: float 到达判据，单位度，None 表示 motion_monitor.tolerances['joint']
+        :param timeout: float 超时，单位秒
+        :param j_dict: 字典——六轴目标值，{'J*': float, ...}
+        :return: concurrent.futures.Future，结果为 motion_monitor.MotionResult
+        """
+        if pose is None:
+            send_data = joints_motion_code(j_dict, limits=self.joint_limits)
+        else:
+            send_data = joints_motion_code(pose, axes, self.joint_limits)
+        return self.motion_monitor.submit_move('joint', send_data, tolerance, timeout)
+
+    def submit_search_origin(self, timeout=None):
+        """
+        搜寻原点，立即返回，控制器离开回零模式时 future 结束
+        :param timeout: float 超时，单位秒
+        :return: concurrent.futures.Future，结果为 motion_monitor.MotionResult
+        """
+        self.search_origin()
+        return self.motion_monitor.submit_mode_wait(12, timeout)
+
+    def single_joint_motion_start(self, n, is_positive):
+        """
+        第n轴单轴运动
+        :param n: 第n轴单动，eg 1   代表第一轴
+        :param is_positive: True-顺时针或 向上, False-逆时针或向下
+        :return:
+        """
+        if n in [2, 3, 5]:
+            if is_positive:
+                send_data = JOG_PLUS_CODES[n]
+            else:
+                send_data = JOG_MINUS_CODES[n]
+        else:
+            if is_positive:
+                send_data = JOG_MINUS_CODES[n]
+            else:
+                send_data = JOG_PLUS_CODES[n]
+        self.enter_mode(14)
+        self.__jog_axes.add(n)
+        self.send_cmd(send_data, 0.001, False)
+
+    def single_joint_motion_stop(self, n):
+        """
+        第n轴停止单轴运动
+        :param n: 第n轴停止单动，eg 1   代表第一轴
+        :return:
+        """
+        send_data = JOG_STOP_CODES[n]
+        self.request(send_data, None, 0, PRIORITY_STOP)
+        self._sleep('jog_stop', 0.002)
+        self.send_cmd(send_data, 0.001, False, PRIORITY_STOP)
+        self.__jog_axes.discard(n)
+        self._mark_motion()  # 减速停止
+
+    def freeze_motion(self):
+        self.motion_monitor.interrupt()  # 先于冻结命令：尚未写出的重发被丢弃，不会在冻结之后重新启动运动
+        self.request(CMD_FREEZE, FRAME_COORD, self.reply_timeout, PRIORITY_STOP)
+        self._mark_stopped()
+        self.motion_monitor.cancel()
+
+    def stop_then_into_free_mode(self):
+        """
+        终止运动，并退出当前模式，设置为空闲模式-0x10
+        :return: None
+        """
+        self.motion_monitor.interrupt()
+        with self.batch(PRIORITY_STOP) as batch:
+            batch.add(CMD_FREEZE).add(CMD_IDLE)
+        self._mark_stopped()
+        self.motion_monitor.cancel()
+
+
+if __name__ == '__main__':
+    sanxi = Sanxi()
+    sanxi.connect_sanxi('COM10')
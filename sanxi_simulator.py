@@ -0,0 +1,443 @@
+"""
+This module includes a virtual SANXI controller for hardware-free testing and benchmarking
+Class: VirtualSanxi opens a Linux pty (or a local TCP port, like a serial-to-Ethernet bridge) and speaks the SANXI
+         serial protocol used by sanxi_core.py, with configurable reply latency and baud-rate throttling.
+         Point Sanxi.connect_sanxi() at VirtualSanxi.port_name.
+         In file mode (0x11) it accepts the chunked program upload of program_upload.py, verifies every chunk by CRC32
+         and runs the stored program on FILE RUN.
+         With joint_speed / linear_speed set, moves take time and queue up like on the real controller, \x30 freezes
+         the arm where it is; with homing_time set, the search of origin leaves mode 0x12 by itself.
+Functions: start() start_tcp() stop() drop_connection() benchmark()
+Note: pty is only available on POSIX systems.
+
+Author: Mr SoSimple
+"""
+
+
+import os
+import re
+import select
+import socket
+import threading
+import time
+import zlib
+from collections import deque
+
+from limits import JOINT_LIMITS
+
+
+class VirtualSanxi(object):
+    JOINT_LIMITS = dict([(n, JOINT_LIMITS['J{}'.format(n)]) for n in range(1, 7)])  # 与 Sanxi 的默认限位相同
+    JOG_SPEED = 10.0  # 单轴点动速度，度/秒
+
+    def __init__(self, reply_latency=0.0005, baud_rate=115200, throttle=True, line_reply=b'OK\r\n'):
+        """
+        :param reply_latency: float 控制器处理一条命令到开始回复的延迟，单位秒
+        :param baud_rate: int 模拟的波特率，throttle 为真时按 10 bit/字节 限制收发速度
+        :param throttle: Bool 是否按波特率限速
+        :param line_reply: bytes G代码行命令的回复，None 表示不回复
+        """
+        super(VirtualSanxi, self).__init__()
+        self.reply_latency = reply_latency
+        self.baud_rate = baud_rate
+        self.throttle = throttle
+        self.line_reply = line_reply
+        # 控制器状态
+        self.mode = 0x10  # 当前模式字节：0x10-空闲 0x11-文件 0x12-回零 0x14-调试 0x15-复位
+        self.gcm = 1  # 返回坐标模式：1-cartesian space 0-joint space
+        self.ve = 0
+        self.ac = 0
+        self.de = 0
+        self.jn_value = [0.0] * 6
+        self.xyz_value = [0.0] * 7
+        self.jog = {}  # {轴号: (方向, 开始时间)}
+        # 运动时间模型，None 表示运动命令瞬间到达
+        self.joint_speed = None  # G00 关节运动速度，度/秒
+        self.linear_speed = None  # G20 / G21 运动速度，mm/秒
+        self.homing_time = None  # 回零耗时，之后自行回到空闲模式，单位秒；None 表示一直停留在模式 0x12
+        self.motion_queue = deque()  # 等待执行的运动 (坐标列表, {序号: 目标值}, 速度)
+        self.__motion = None  # 正在执行的运动 (坐标列表, 起点, 终点, 开始时刻, 耗时)
+        self.__homing_until = None
+        self.received_commands = []  # 收到的全部命令，便于测试检查
+        # 文件模式
+        self.file_chunks = {}  # 正在上传的程序 {块号: bytes}
+        self.file_size = 0  # FILE OPEN 声明的程序字节数
+        self.program = []  # 校验通过的程序行
+        self.program_runs = 0  # 执行程序的次数
+        self.reject_chunks = set()  # 模拟传输错误：这些块号第一次到达时回复 ERR
+        # pty / TCP 与线程
+        self.port_name = None
+        self.connection_count = 0  # TCP 模式下已接受的连接数
+        self.__master_fd = -1
+        self.__slave_fd = -1
+        self.__listen_sock = None
+        self.__client_sock = None
+        self.__write = None  # 写回复数据的函数
+        self.__rx_pending = b''
+        self.__run_flag = False
+        self.__thread = None
+        self.__value_pattern = re.compile(r'([A-Z]+\d?)=(-?[\d.]+(?:[eE][-+]?\d+)?)')
+
+    def start(self):
+        """
+        打开 pty 并启动控制器线程
+        :return: str 供 Sanxi 连接的串口名称
+        """
+        import tty
+        self.__master_fd, self.__slave_fd = os.openpty()
+        tty.setraw(self.__master_fd)
+        tty.setraw(self.__slave_fd)
+        self.port_name = os.ttyname(self.__slave_fd)
+        self.__write = lambda data: os.write(self.__master_fd, data)
+        self.__start_thread(self.__controller_thread_func)
+        return self.port_name
+
+    def start_tcp(self, host='127.0.0.1', port=0):
+        """
+        监听本地 TCP 端口，模拟串口服务器，同一时刻服务一个连接，连接断开后可重新连接
+        :param host: str 监听地址
+        :param port: int 监听端口，0 表示自动分配
+        :return: str 供 Sanxi 连接的端口名称，例如 'tcp://127.0.0.1:40001'
+        """
+        self.__listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__listen_sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.__listen_sock.bind((host, port))
+        self.__listen_sock.listen(1)
+        self.port_name = 'tcp://{}:{}'.format(host, self.__listen_sock.getsockname()[1])
+        self.__write = lambda data: self.__client_sock.sendall(data)
+        self.__start_thread(self.__tcp_thread_func)
+        return self.port_name
+
+    def __start_thread(self, target):
+        self.__run_flag = True
+        self.__thread = threading.Thread(target=target, name='VirtualSanxi_Thread')
+        self.__thread.daemon = True
+        self.__thread.start()
+
+    def stop(self):
+        self.__run_flag = False
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+        for fd in (self.__master_fd, self.__slave_fd):
+            if fd >= 0:
+                os.close(fd)
+        self.__master_fd = -1
+        self.__slave_fd = -1
+        self.drop_connection()
+        if self.__listen_sock is not None:
+            self.__listen_sock.close()
+            self.__listen_sock = None
+
+    def drop_connection(self):
+        """
+        TCP 模式下断开当前连接，模拟网络中断
+        :return: None
+        """
+        if self.__client_sock is not None:
+            self.__client_sock.close()
+            self.__client_sock = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+        return False
+
+    # 控制器线程目标函数
+    def __controller_thread_func(self):
+        while self.__run_flag:
+            readable, _, _ = select.select([self.__master_fd], [], [], 0.05)
+            if not readable:
+                continue
+            try:
+                receive_data = os.read(self.__master_fd, 4096)
+            except OSError:
+                break
+            self.__wire_delay(len(receive_data))
+            self.__rx_pending += receive_data
+            self.__process_pending()
+
+    # TCP 模式下的控制器线程目标函数
+    def __tcp_thread_func(self):
+        while self.__run_flag:
+            client_sock = self.__client_sock
+            watch = [self.__listen_sock] if client_sock is None else [self.__listen_sock, client_sock]
+            try:
+                readable, _, _ = select.select(watch, [], [], 0.05)
+            except (OSError, ValueError):
+                continue
+            if self.__listen_sock in readable:
+                new_sock, _ = self.__listen_sock.accept()
+                new_sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.drop_connection()
+                self.__client_sock = new_sock
+                self.__rx_pending = b''
+                self.connection_count += 1
+                continue
+            if client_sock is None or client_sock not in readable:
+                continue
+            try:
+                receive_data = client_sock.recv(4096)
+            except OSError:
+                receive_data = b''
+            if not receive_data:
+                self.drop_connection()
+                continue
+            self.__wire_delay(len(receive_data))
+            self.__rx_pending += receive_data
+            try:
+                self.__process_pending()
+            except (OSError, AttributeError):
+                self.drop_connection()
+
+    def __wire_delay(self, n):
+        if self.throttle and self.baud_rate:
+            time.sleep(n * 10.0 / self.baud_rate)
+
+    def __reply(self, data):
+        if data is None:
+            return
+        if self.reply_latency:
+            time.sleep(self.reply_latency)
+        self.__wire_delay(len(data))
+        self.__write(data)
+
+    def __process_pending(self):
+        """
+        从接收数据中逐条取出命令：单字节控制命令立即处理，G代码等行命令以 \\n 结尾
+        """
+        while self.__rx_pending:
+            first = self.__rx_pending[:1]
+            if first in (b'\x05', b'\x10', b'\x11', b'\x12', b'\x14', b'\x15', b'\x30'):
+                self.__rx_pending = self.__rx_pending[1:]
+                self.received_commands.append(first)
+                self.__reply(self.handle_byte(first))
+                continue
+            index = self.__rx_pending.find(b'\n')
+            if index < 0:
+                return
+            line = self.__rx_pending[:index + 1]
+            if line.startswith(b'FILE DATA '):
+                # 块头之后紧跟 S 字节的程序内容，收齐后一起处理
+                size = int(line.split(b' S=', 1)[1].split()[0])
+                if len(self.__rx_pending) < index + 1 + size:
+                    return
+                payload = self.__rx_pending[index + 1:index + 1 + size]
+                self.__rx_pending = self.__rx_pending[index + 1 + size:]
+                self.received_commands.append(line)
+                self.__reply(self.handle_file_data(line.strip().decode(errors='replace'), payload))
+                continue
+            self.__rx_pending = self.__rx_pending[index + 1:]
+            self.received_commands.append(line)
+            self.__reply(self.handle_line(line.strip().decode(errors='replace')))
+
+    def handle_byte(self, code):
+        """
+        处理单字节控制命令
+        :param code: bytes
+        :return: bytes 回复
+        """
+        self.__update_jog()
+        self.__update_motion()
+        if code == b'\x05':
+            return bytes([self.mode])
+        if code == b'\x30':
+            # 冻结运动并返回当前坐标
+            self.jog.clear()
+            self.motion_queue.clear()
+            self.__motion = None
+            return self.coord_line()
+        self.mode = code[0]
+        self.__homing_until = None
+        if code == b'\x12' or code == b'\x15':
+            # 回零 / 复位：回到原点
+            self.jn_value = [0.0] * 6
+            if code == b'\x12' and self.homing_time is not None:
+                self.__homing_until = time.perf_counter() + self.homing_time
+        return code
+
+    def handle_line(self, line):
+        """
+        处理行命令
+        :param line: str 去掉行尾的命令
+        :return: bytes 回复
+        """
+        self.__update_jog()
+        self.__update_motion()
+        values = dict([(key, float(value)) for key, value in self.__value_pattern.findall(line)])
+        if line.startswith('G07'):
+            if 'GCM' in values:
+                self.gcm = int(values['GCM'])
+            self.ve = values.get('VE', self.ve)
+            self.ac = values.get('AC', self.ac)
+            self.de = values.get('DE', self.de)
+        elif line.startswith('FILE '):
+            return self.handle_file_line(line, values)
+        elif self.mode == 0x14:
+            # 只有调试模式下执行运动命令
+            self.execute_line(line, values)
+        return self.line_reply
+
+    def execute_line(self, line, values):
+        """
+        执行一条运动命令
+        :param line: str 去掉行尾的命令
+        :param values: dict {键: float} 命令中的坐标值
+        :return: None
+        """
+        if line.startswith('G00'):
+            target = {}
+            for n in range(1, 7):
+                key = 'J{}'.format(n)
+                if key in values:
+                    lower, upper = self.JOINT_LIMITS[n]
+                    target[n - 1] = min(max(values[key], lower), upper)
+            self.__queue_motion(self.jn_value, target, self.joint_speed)
+        elif line.startswith('G20') or line.startswith('G21'):
+            target = {}
+            for i, key in enumerate(('X', 'Y', 'Z', 'A', 'B', 'C', 'D')):
+                if key in values:
+                    target[i] = values[key]
+            self.__queue_motion(self.xyz_value, target, self.linear_speed)
+        elif len(line) == 3 and line[0] == 'J' and line[2] in '+-0':
+            n = int(line[1])
+            if line[2] == '0':
+                self.jog.pop(n, None)
+            else:
+                self.jog[n] = (1 if line[2] == '+' else -1, time.perf_counter())
+
+    def handle_file_line(self, line, values):
+        """
+        处理文件模式的 FILE OPEN / CLOSE / RUN 命令
+        :return: bytes 回复
+        """
+        if self.mode != 0x11:
+            return b'ERR MODE\r\n'
+        if line.startswith('FILE OPEN'):
+            self.file_chunks = {}
+            self.file_size = int(values.get('S', 0))
+            return b'OK\r\n'
+        if line.startswith('FILE CLOSE'):
+            data = b''.join([self.file_chunks[index] for index in sorted(self.file_chunks)])
+            crc = zlib.crc32(data) & 0xffffffff
+            if len(data) != self.file_size or crc != int(values.get('CRC', -1)):
+                return ('ERR S={} CRC={}\r\n'.format(len(data), crc)).encode()
+            self.program = data.decode(errors='replace').splitlines()
+            self.file_chunks = {}
+            return ('OK L={} CRC={}\r\n'.format(len(self.program), crc)).encode()
+        if line.startswith('FILE RUN'):
+            # 程序瞬间执行完毕，执行后的坐标可用 \x30 读取
+            self.program_runs += 1
+            for program_line in self.program:
+                program_line = program_line.strip()
+                self.execute_line(program_line, dict([(key, float(value)) for key, value in
+                                                      self.__value_pattern.findall(program_line)]))
+            return b'OK\r\n'
+        return b'ERR\r\n'
+
+    def handle_file_data(self, line, payload):
+        """
+        处理一个程序块，按块号保存，CRC 不符时回复 ERR
+        :param line: str 块头 'FILE DATA I=.. S=.. CRC=..'
+        :param payload: bytes 块内容
+        :return: bytes 回复
+        """
+        values = dict([(key, int(float(value))) for key, value in self.__value_pattern.findall(line)])
+        index = values.get('I', -1)
+        crc = zlib.crc32(payload) & 0xffffffff
+        if self.mode != 0x11 or crc != values.get('CRC') or index in self.reject_chunks:
+            self.reject_chunks.discard(index)
+            return ('ERR I={}\r\n'.format(index)).encode()
+        self.file_chunks[index] = payload
+        return ('OK I={} CRC={}\r\n'.format(index, crc)).encode()
+
+    def __queue_motion(self, coords, target, speed):
+        if speed is None and self.__motion is None and not self.motion_queue:
+            for i, value in target.items():
+                coords[i] = value
+            return
+        self.motion_queue.append((coords, target, speed))
+        self.__update_motion()
+
+    def __update_motion(self):
+        """
+        推进运动队列：逐个执行排队的运动，每个运动按最大坐标差 / 速度计时，线性插值
+        """
+        now = time.perf_counter()
+        if self.__homing_until is not None and now >= self.__homing_until:
+            self.mode = 0x10
+            self.__homing_until = None
+        start_at = now  # 下一个运动的开始时刻，紧接上一个运动的结束
+        while True:
+            if self.__motion is None:
+                if not self.motion_queue:
+                    return
+                coords, target, speed = self.motion_queue.popleft()
+                start = list(coords)
+                end = list(coords)
+                for i, value in target.items():
+                    end[i] = value
+                distance = max([abs(b - a) for a, b in zip(start, end)])
+                duration = distance / speed if speed else 0.0
+                self.__motion = (coords, start, end, start_at, duration)
+            coords, start, end, start_time, duration = self.__motion
+            if now - start_time >= duration:
+                coords[:] = end
+                self.__motion = None
+                start_at = start_time + duration
+                continue
+            ratio = (now - start_time) / duration
+            coords[:] = [a + (b - a) * ratio for a, b in zip(start, end)]
+            return
+
+    def __update_jog(self):
+        now = time.perf_counter()
+        for n, (direction, start_time) in list(self.jog.items()):
+            lower, upper = self.JOINT_LIMITS[n]
+            value = self.jn_value[n - 1] + direction * self.JOG_SPEED * (now - start_time)
+            self.jn_value[n - 1] = min(max(value, lower), upper)
+            self.jog[n] = (direction, now)
+
+    def coord_line(self):
+        """
+        按 GCM 模式生成坐标回复行
+        :return: bytes
+        """
+        if self.gcm == 0:
+            return ('J1={:.3f} J2={:.3f} J3={:.3f} J4={:.3f} J5={:.3f} J6={:.3f}\r\n'
+                    .format(*self.jn_value)).encode()
+        return ('X={:.3f} Y={:.3f} Z={:.3f} A={:.3f} B={:.3f} C={:.3f} D={:.3f}\r\n'
+                .format(*self.xyz_value)).encode()
+
+
+def benchmark(n=200, reply_latency=0.0005, baud_rate=115200):
+    """
+    在虚拟控制器上测量 Sanxi 常用命令的往返时间
+    :param n: int 每种命令的重复次数
+    :return: dict {命令: 平均往返时间(秒)}
+    """
+    from sanxi_core import Sanxi
+    result = {}
+    with VirtualSanxi(reply_latency=reply_latency, baud_rate=baud_rate) as virtual_sanxi:
+        sanxi = Sanxi()
+        sanxi.connect_sanxi(virtual_sanxi.port_name)
+        cases = [('query_current_mode', sanxi.query_current_mode),
+                 ('freeze_motion', sanxi.freeze_motion),
+                 ('rect_move', lambda: sanxi.rect_move('line', X=100, Y=20, Z=300, A=1, B=2, C=3, D=' ')),
+                 ('multi_joints_motion', lambda: sanxi.multi_joints_motion(J1=10, J2=20, J3=-30)),
+                 ('set_motion_para', lambda: sanxi.set_motion_para(5, 30, 10))]
+        for name, func in cases:
+            start_time = time.perf_counter()
+            for i in range(n):
+                func()
+            result[name] = (time.perf_counter() - start_time) / n
+        sanxi.disconnect()
+    return result
+
+
+if __name__ == '__main__':
+    for cmd_name, seconds in benchmark().items():
+        print('{:<22}{:8.3f} ms'.format(cmd_name, seconds * 1000))
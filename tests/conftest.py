@@ -0,0 +1,28 @@
+import os
+import sys
+
+import pytest
+
+# 被测模块位于仓库根目录
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sanxi_core import Sanxi  # noqa: E402
+from sanxi_simulator import VirtualSanxi  # noqa: E402
+
+
+@pytest.fixture
+def sanxi_pair(request):
+    """
+    已连接的 (Sanxi, VirtualSanxi)，连接过程中的命令已从 received_commands 清除；
+    间接参数化时 param 为 VirtualSanxi 的子类
+    """
+    virtual_sanxi = getattr(request, 'param', VirtualSanxi)(reply_latency=0.0002)
+    virtual_sanxi.start()
+    sanxi = Sanxi()
+    assert sanxi.connect_sanxi(virtual_sanxi.port_name)
+    del virtual_sanxi.received_commands[:]
+    yield sanxi, virtual_sanxi
+    sanxi.stop_telemetry()
+    sanxi.motion_monitor.stop()
+    sanxi.disconnect()
+    virtual_sanxi.stop()
@@ -0,0 +1,64 @@
+import asyncio
+import random
+
+from async_sanxi_core import AsyncSanxi
+from sanxi_core import CMD_FREEZE, CMD_GCM, CMD_QUERY_MODE, FRAME_ACK, FRAME_LINE
+from sanxi_simulator import VirtualSanxi
+
+
+def test_concurrent_requests_get_their_own_replies():
+    async def run(port_name):
+        sanxi = AsyncSanxi()
+        assert await sanxi.connect_sanxi(port_name)
+
+        async def request(i):
+            await asyncio.sleep(delays[i])  # 请求在其他请求的回复途中开始
+            if i % 2:
+                return await sanxi.request(CMD_QUERY_MODE, FRAME_ACK, 0.5)
+            return await sanxi.request(CMD_FREEZE, FRAME_LINE, 0.5)
+        replies = await asyncio.gather(*[request(i) for i in range(60)])
+        sanxi.disconnect()
+        return replies
+
+    generator = random.Random(7)
+    delays = [generator.uniform(0, 0.02) for i in range(60)]
+    with VirtualSanxi(reply_latency=0.0002) as virtual_sanxi:
+        replies = asyncio.new_event_loop().run_until_complete(run(virtual_sanxi.port_name))
+    for i, reply in enumerate(replies):
+        if i % 2:
+            assert reply == '\x14'
+        else:
+            assert reply.startswith('X=') and reply.endswith('\r\n')
+
+
+def test_corrupted_reply_is_decoded_with_replacement():
+    async def run(virtual_sanxi):
+        sanxi = AsyncSanxi()
+        assert await sanxi.connect_sanxi(virtual_sanxi.port_name)
+        virtual_sanxi.mode = 0xff  # 不是合法的 utf-8 字节
+        reply = await sanxi.request(CMD_QUERY_MODE, FRAME_ACK, 0.5)
+        sanxi.disconnect()
+        return reply
+
+    with VirtualSanxi(reply_latency=0.0002) as virtual_sanxi:
+        reply = asyncio.new_event_loop().run_until_complete(run(virtual_sanxi))
+    assert reply == '\ufffd'
+
+
+def test_late_reply_is_not_taken_by_the_next_request():
+    async def run(virtual_sanxi):
+        sanxi = AsyncSanxi()
+        assert await sanxi.connect_sanxi(virtual_sanxi.port_name)
+        virtual_sanxi.reply_latency = 0.006
+        await sanxi.request(CMD_GCM[1], FRAME_LINE, 0.003)  # 3ms 超时，回复 OK 在超时之后才到达
+        await asyncio.sleep(0.02)
+        mode = await sanxi.query_current_mode()
+        coord = await sanxi.request(CMD_FREEZE, FRAME_LINE, 0.5)
+        sanxi.disconnect()
+        return mode, coord, sanxi.all_return_code
+
+    with VirtualSanxi(reply_latency=0.0002) as virtual_sanxi:
+        mode, coord, history = asyncio.new_event_loop().run_until_complete(run(virtual_sanxi))
+    assert mode == 14
+    assert coord.startswith('X=') and coord.endswith('\r\n')
+    assert 'OK\r\n' in history  # 迟到的回复只记入历史
@@ -0,0 +1,64 @@
+import threading
+
+from communication import ByteRingBuffer, ReplyFrame
+
+
+def test_write_and_read_across_the_wrap():
+    ring = ByteRingBuffer(8)
+    ring.write(b'abcdef')
+    assert ring.read(4) == b'abcd'
+    ring.write(b'ghijk')  # 尾部写到缓冲区末尾后回绕到开头
+    assert len(ring) == 7
+    assert ring.peek() == b'efghijk'
+    assert ring.tail(3) == b'ijk'
+    assert ring.tail(6) == b'fghijk'
+    assert ring.read() == b'efghijk'
+    assert len(ring) == 0
+
+
+def test_overflow_drops_the_oldest_bytes():
+    ring = ByteRingBuffer(8)
+    ring.write(b'abcdef')
+    ring.write(b'ghij')
+    assert ring.peek() == b'cdefghij'
+    assert ring.dropped == 2
+    assert ring.total_written == 10
+
+
+def test_write_larger_than_capacity_keeps_the_end():
+    ring = ByteRingBuffer(4)
+    ring.write(b'ab')
+    ring.write(b'cdefgh')
+    assert ring.peek() == b'efgh'
+    assert ring.dropped == 4
+    assert ring.total_written == 8
+
+
+def test_tail_is_clamped_to_the_buffered_size():
+    ring = ByteRingBuffer(8)
+    ring.write(b'abc')
+    assert ring.tail(100) == b'abc'
+    ring.clear()
+    assert ring.tail(1) == b''
+    assert ring.total_written == 3
+
+
+def test_wait_for_frame_sees_a_frame_split_across_the_wrap():
+    ring = ByteRingBuffer(8)
+    ring.write(b'xxxxxx')
+    ring.read(6)
+    frame = ReplyFrame(terminator=b'\r\n')
+    writer = threading.Timer(0.01, ring.write, args=(b'ok\r\n',))
+    ring.write(b'abc')
+    writer.start()
+    end = ring.wait_for_frame(frame, 1.0)
+    writer.join()
+    assert ring.read(end) == b'abcok\r\n'
+
+
+def test_wait_for_data_times_out_without_new_bytes():
+    ring = ByteRingBuffer(8)
+    ring.write(b'a')
+    assert not ring.wait_for_data(ring.total_written, 0.01)
+    ring.write(b'b')
+    assert ring.wait_for_data(1, 0.01)
@@ -0,0 +1,78 @@
+import ctypes
+import threading
+import time
+from unittest import mock
+
+if not hasattr(ctypes, 'windll'):
+    ctypes.windll = mock.MagicMock()  # hd.dll 只在 Windows 上存在，这里只测试控制循环的调度
+
+from master_slave import ControlLoop
+
+
+def _wait_for(predicate, timeout=2.0):
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        assert time.perf_counter() < deadline, 'timed out'
+        time.sleep(0.001)
+
+
+def test_slow_tick_counts_overruns_and_missed_periods():
+    # 周期 10ms，每次 tick 耗时 25ms：每次都超时，并且至少跳过 2 个周期
+    loop = ControlLoop(lambda: time.sleep(0.025), rate=100.0)
+    loop.start()
+    _wait_for(lambda: loop.tick_count >= 5)
+    loop.stop()
+    assert loop.overrun_count == loop.tick_count
+    assert loop.missed_count >= 2 * loop.overrun_count
+    assert loop.snapshot()['overruns'] == loop.overrun_count
+
+
+def test_single_slow_tick_is_one_overrun():
+    calls = []
+
+    def tick():
+        calls.append(time.perf_counter())
+        if len(calls) == 3:
+            time.sleep(0.05)  # 周期 20ms，这一次超过 2 个周期
+
+    loop = ControlLoop(tick, rate=50.0)
+    loop.start()
+    _wait_for(lambda: len(calls) >= 6)
+    loop.stop()
+    assert loop.overrun_count == 1
+    assert loop.missed_count >= 2
+    # 超时之后回到原来的时间网格，不连续补跑
+    assert calls[3] - calls[2] >= 0.05
+
+
+def test_no_tick_runs_after_stop_returns():
+    state = {'ticks': 0, 'in_tick': False}
+
+    def tick():
+        state['in_tick'] = True
+        time.sleep(0.005)
+        state['ticks'] += 1
+        state['in_tick'] = False
+
+    loop = ControlLoop(tick, rate=200.0)
+    loop.start()
+    _wait_for(lambda: state['ticks'] >= 3)
+    loop.stop()
+    assert not state['in_tick']  # 正在执行的 tick 已结束
+    assert not loop.is_running()
+    ticks = state['ticks']
+    time.sleep(0.05)  # 10 个周期
+    assert state['ticks'] == ticks
+    assert loop.tick_count == ticks
+    assert not any(thread.name == loop.name for thread in threading.enumerate())
+
+
+def test_tick_exception_is_counted_and_the_loop_keeps_running():
+    def tick():
+        raise ValueError('boom')
+
+    loop = ControlLoop(tick, rate=200.0)
+    loop.start()
+    _wait_for(lambda: loop.tick_count >= 3)
+    loop.stop()
+    assert loop.error_count == loop.tick_count
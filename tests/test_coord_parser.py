@@ -0,0 +1,45 @@
+import pytest
+
+from coord_parser import CoordStreamParser, JointRecord, CartesianRecord
+
+JOINT_LINE = b'J1=1.000 J2=-12.500 J3=30.250 J4=0.000 J5=45.125 J6=-90.000\r\n'
+CARTESIAN_LINE = b'X=430.000 Y=0.500 Z=620.000 A=-135.000 B=-90.000 C=-45.000 D=0.000\r\n'
+JOINT = (1.0, -12.5, 30.25, 0.0, 45.125, -90.0)
+CARTESIAN = (430.0, 0.5, 620.0, -135.0, -90.0, -45.0, 0.0)
+
+
+def test_byte_by_byte_feed_gives_each_record_once():
+    parser = CoordStreamParser()
+    records = []
+    for byte in JOINT_LINE + CARTESIAN_LINE:
+        records.extend(parser.feed(bytes([byte]), 1.0))
+    assert records == [JointRecord(*JOINT, timestamp=1.0), CartesianRecord(*CARTESIAN, timestamp=1.0)]
+    assert parser.joint_count == 1 and parser.cartesian_count == 1
+
+
+def test_two_replies_in_one_chunk():
+    parser = CoordStreamParser()
+    records = parser.feed(CARTESIAN_LINE + JOINT_LINE[:20], 1.0)
+    assert records == [CartesianRecord(*CARTESIAN, timestamp=1.0)]
+    records = parser.feed(JOINT_LINE[20:] + CARTESIAN_LINE, 2.0)
+    assert records == [JointRecord(*JOINT, timestamp=2.0), CartesianRecord(*CARTESIAN, timestamp=2.0)]
+    assert parser.last_joint[:6] == JOINT and parser.last_cartesian[:7] == CARTESIAN
+
+
+@pytest.mark.parametrize('prefix', [b'\x14', b'\x10\x14OK', b'X=430.000 Y=0.', b'J1=1.000 J2=-12.5'])
+def test_garbage_in_front_of_a_record_is_skipped(prefix):
+    parser = CoordStreamParser()
+    records = parser.feed(prefix + JOINT_LINE + prefix + CARTESIAN_LINE)
+    assert [record[:-1] for record in records] == [JOINT, CARTESIAN]
+
+
+def test_truncated_line_alone_is_not_a_record():
+    parser = CoordStreamParser()
+    assert parser.feed(b'X=430.000 Y=0.500\r\nJ1=1.000 J2=\r\n\x14') == []
+    assert parser.last_joint is None and parser.last_cartesian is None
+
+
+def test_unterminated_garbage_is_bounded():
+    parser = CoordStreamParser(max_line=64)
+    parser.feed(b'\x00' * 1000)
+    assert parser.feed(JOINT_LINE)[0][:6] == JOINT
@@ -0,0 +1,74 @@
+import numpy
+
+from kinematics import Kinematics, euler_to_matrix, matrix_to_euler
+from pose import JointPose, CartesianPose
+
+# 测试用的 DH 参数，与 NOMINAL_DH 无关：a(mm) alpha(度) d(mm) theta零位偏移(度)
+DH = ((40.0, -90.0, 300.0, 0.0),
+      (250.0, 0.0, 0.0, -90.0),
+      (60.0, -90.0, 0.0, 0.0),
+      (0.0, 90.0, 280.0, 0.0),
+      (0.0, -90.0, 0.0, 0.0),
+      (0.0, 0.0, 70.0, 0.0))
+
+
+def _joints(n, seed=0):
+    # 限位内、远离奇异位形的关节角：J5 不接近 0（手腕），J3 不接近 -77.9 度（60mm 与 280mm 连成直线，手臂伸直）
+    rng = numpy.random.RandomState(seed)
+    joints = rng.uniform([-120, -60, -50, -100, 20, -180], [120, 60, 0, 100, 80, 180], (n, 6))
+    joints[::2, 4] *= -1
+    return joints
+
+
+def test_zero_pose_matches_the_dh_table():
+    # 零位时 J2 偏移 -90 度使大臂竖直向上，小臂（d4）与法兰（d6）沿 x 方向水平伸出
+    x, y, z, a, b, c = Kinematics(DH).forward(numpy.zeros(6))
+    assert numpy.allclose((x, y, z), (40.0 + 280.0 + 70.0, 0.0, 300.0 + 250.0 + 60.0))
+
+
+def test_forward_single_matches_forward():
+    kinematics = Kinematics(DH)
+    joints = _joints(20)
+    batch = kinematics.forward(joints)
+    for row, expected in zip(joints, batch):
+        assert numpy.allclose(kinematics.forward_single(row), expected, atol=1e-9)
+
+
+def test_euler_round_trip():
+    abc = numpy.array([[10.0, 20.0, 30.0], [-170.0, 45.0, 90.0], [0.0, -80.0, -135.0]])
+    out = numpy.empty_like(abc)
+    assert numpy.allclose(matrix_to_euler(euler_to_matrix(abc), out), abc)
+
+
+def test_forward_inverse_round_trip():
+    kinematics = Kinematics(DH)
+    joints = _joints(50)
+    targets = kinematics.forward(joints)
+    seed = joints + numpy.random.RandomState(1).uniform(-5.0, 5.0, joints.shape)
+    result = kinematics.inverse(targets, seed)
+    assert result.converged.all()
+    assert (result.position_error <= 0.01).all()
+    assert (result.orientation_error <= 0.01).all()
+    # 接近奇异位形时关节角可以与原值不同，只要求正解回到同一位姿
+    residuals = kinematics.residuals(result.joints, targets)
+    assert numpy.abs(residuals[:, :3]).max() <= 0.01
+    assert numpy.abs(residuals[:, 3:]).max() <= 0.02
+
+
+def test_inverse_pose_writes_only_a_converged_result():
+    kinematics = Kinematics(DH)
+    joints = JointPose(_joints(1, seed=2)[0], 1.0)
+    target = kinematics.forward_pose(joints, CartesianPose())
+    assert target and target.timestamp == 1.0
+    seed = JointPose(joints.as_array() + 3.0)
+    out = JointPose()
+    result = kinematics.inverse_pose(target, seed, out)
+    assert result.converged
+    assert out and out.timestamp == 1.0
+    assert numpy.allclose(kinematics.forward(out.as_array()), target.as_array()[:6], atol=0.01)
+    solved = out.copy()
+    # 超出工作空间的目标不收敛，out 保持不变
+    target.x = 5000.0
+    result = kinematics.inverse_pose(target, seed, out, max_iter=20)
+    assert not result.converged
+    assert list(out) == list(solved)
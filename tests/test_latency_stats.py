@@ -0,0 +1,99 @@
+import io
+import random
+
+import pytest
+
+from latency_stats import LatencyHistogram, CommandStats
+
+RELATIVE_ERROR = 1.0 / 64  # 每个数量级 64 个线性子桶
+
+
+def _exact_percentile(values, p):
+    # 与 LatencyHistogram.percentile 相同的最近秩定义
+    ordered = sorted(values)
+    return ordered[max(1, int(round(len(ordered) * p / 100.0))) - 1]
+
+
+def _assert_close(estimate, exact):
+    # 返回值为桶的下界：不大于真实值，且误差在相对精度以内（另加取整到微秒的 1us）
+    assert exact - RELATIVE_ERROR * exact - 1e-6 <= estimate <= exact + 1e-9
+
+
+@pytest.mark.parametrize('p', [1, 50, 90, 99, 99.9])
+def test_percentiles_are_within_the_relative_error(p):
+    rng = random.Random(1)
+    values = [10 ** rng.uniform(-5, 0) for _ in range(20000)]  # 10us ~ 1s，对数均匀分布
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+    _assert_close(histogram.percentile(p), _exact_percentile(values, p))
+
+
+def test_known_values():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):  # 1ms ~ 100ms
+        histogram.record(ms / 1000.0)
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 100
+    assert snapshot['min'] == 0.001
+    assert snapshot['max'] == 0.1
+    assert snapshot['mean'] == pytest.approx(0.0505)
+    _assert_close(snapshot['p50'], 0.050)
+    _assert_close(snapshot['p90'], 0.090)
+    _assert_close(snapshot['p99'], 0.099)
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for us in (3, 5, 7, 100):
+        histogram.record(us / 1e6 + 1e-9)
+    assert histogram.percentile(25) == pytest.approx(3e-6)
+    assert histogram.percentile(100) == pytest.approx(100e-6)
+
+
+def test_values_above_the_range_go_to_the_top_bucket():
+    histogram = LatencyHistogram(max_seconds=1.0)
+    histogram.record(5.0)
+    assert histogram.max == 5.0
+    _assert_close(histogram.percentile(50), 1.0)
+
+
+def test_empty_and_reset():
+    histogram = LatencyHistogram()
+    assert histogram.percentile(50) is None
+    assert histogram.mean() is None
+    histogram.record(0.01)
+    histogram.reset()
+    assert histogram.snapshot() == {'count': 0, 'min': None, 'mean': None, 'p50': None, 'p90': None,
+                                    'p99': None, 'max': None}
+
+
+def test_command_stats_percentiles_and_counters():
+    stats = CommandStats()
+    for ms in range(1, 201):
+        stats.record_request('G21', 30, 50, ms / 2000.0, ms / 1000.0, complete=ms != 200, queue_wait=0.0002)
+    stats.record_request('G21', 30, 0, None, 0.3, complete=False)
+    stats.record_sleep('G00', 0.014)
+    stats.record_sleep('G00', 0.014)
+    snapshot = stats.snapshot()
+    g21 = snapshot['G21']
+    assert g21['count'] == 201
+    assert g21['timeouts'] == 2
+    assert g21['bytes_written'] == 201 * 30
+    assert g21['bytes_read'] == 200 * 50
+    assert g21['first_byte']['count'] == 200
+    assert g21['queue_wait']['count'] == 200
+    _assert_close(g21['first_byte']['p50'], 0.050)
+    full_reply = [ms / 1000.0 for ms in range(1, 201)] + [0.3]
+    _assert_close(g21['full_reply']['p50'], _exact_percentile(full_reply, 50))
+    _assert_close(g21['full_reply']['p99'], _exact_percentile(full_reply, 99))
+    assert g21['full_reply']['max'] == 0.3
+    assert snapshot['G00']['count'] == 0
+    assert snapshot['G00']['sleep_total'] == pytest.approx(0.028)
+    out = io.StringIO()
+    stats.dump(out)
+    lines = out.getvalue().splitlines()
+    assert lines[0].split()[0] == 'command'
+    assert [line.split()[0] for line in lines[1:]] == ['G00', 'G21']
+    stats.reset()
+    assert stats.snapshot() == {}
@@ -0,0 +1,36 @@
+import numpy
+
+from limits import JOINT_LIMITS, default_joint_limits
+from pose import JointPose
+from sanxi_core import joints_motion_code
+from sanxi_simulator import VirtualSanxi
+
+
+def test_j6_out_of_range_is_rejected_and_clamped():
+    points = numpy.array([[0.0, 0.0, 0.0, 0.0, 0.0, 400.0], [0.0, 0.0, 0.0, 0.0, 0.0, -10.0]])
+    report = default_joint_limits().check(points, clamp=False)
+    assert list(report.valid) == [False, True]
+    assert report.violations[0, 5]
+    report = default_joint_limits().check(points)
+    assert report.values[0, 5] == 360.0
+    assert b'J6=360.00' in joints_motion_code({'J6': 400.0})
+
+
+def test_simulator_uses_the_same_joint_limits():
+    for n in range(1, 7):
+        assert VirtualSanxi.JOINT_LIMITS[n] == JOINT_LIMITS['J{}'.format(n)]
+
+
+def test_joints_motion_code_writes_the_clamped_values_back():
+    pose = JointPose([200.0, -140.0, 0.0, 10.0, 95.0, -400.0])
+    code = joints_motion_code(pose)
+    assert list(pose) == [160.0, -130.0, 0.0, 10.0, 90.0, -360.0]
+    assert b'J1=160.00' in code and b'J2=-130.00' in code and b'J6=-360.00' in code
+    # 只发送部分轴时只截断这些轴
+    pose = JointPose([200.0, 0.0, 0.0, 0.0, 95.0, 0.0])
+    code = joints_motion_code(pose, axes=(5,))
+    assert list(pose) == [200.0, 0.0, 0.0, 0.0, 90.0, 0.0]
+    assert b'J5=90.00' in code and b'J1' not in code
+    joints = {'J3': 20.0, 'J4': -150.0}
+    joints_motion_code(joints)
+    assert joints == {'J3': 15.0, 'J4': -140.0}
@@ -0,0 +1,67 @@
+import pytest
+
+from sanxi_core import (ModeStateMachine, CMD_FREEZE, CMD_QUERY_MODE, CMD_IDLE, CMD_FILE, CMD_MODE14,
+                        CMD_SEARCH_ORIGIN)
+from sanxi_simulator import VirtualSanxi
+
+
+class RefusingSanxi(VirtualSanxi):
+    """
+    拒绝进入文件模式的控制器：回复当前模式字节而不是回显
+    """
+    def handle_byte(self, code):
+        if code == CMD_FILE:
+            return bytes([self.mode])
+        return super(RefusingSanxi, self).handle_byte(code)
+
+
+def test_plan_uses_the_fewest_commands():
+    machine = ModeStateMachine()
+    assert machine.plan(14) == [CMD_FREEZE, CMD_IDLE, CMD_MODE14]  # 未确认：先退出当前模式
+    assert machine.observe(CMD_IDLE, CMD_IDLE)
+    assert machine.plan(14) == [CMD_MODE14]
+    assert machine.plan(10) == []
+    assert machine.observe(CMD_QUERY_MODE, CMD_SEARCH_ORIGIN) and machine.mode == 12
+    assert machine.plan(10) == [CMD_FREEZE, CMD_IDLE]
+
+
+def test_a_mismatched_ack_leaves_the_mode_unconfirmed():
+    machine = ModeStateMachine()
+    machine.observe(CMD_MODE14, CMD_MODE14)
+    assert not machine.observe(CMD_FILE, CMD_MODE14)
+    assert not machine.confirmed
+    assert not machine.observe(CMD_QUERY_MODE, b'')  # 超时
+
+
+def test_redundant_switch_is_skipped(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    assert sanxi.mode_machine.confirmed and sanxi.current_mode == 14
+    skipped = sanxi.mode_machine.skipped_count
+    assert sanxi.enter_mode(14)
+    assert virtual_sanxi.received_commands == []
+    assert sanxi.mode_machine.skipped_count == skipped + 1
+
+
+def test_switch_is_confirmed_by_the_ack(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    assert sanxi.enter_mode(11)
+    assert virtual_sanxi.received_commands == [CMD_FREEZE, CMD_IDLE, CMD_FILE]
+    assert virtual_sanxi.mode == 0x11 and sanxi.current_mode == 11
+
+
+def test_invalidated_mode_is_resynced_before_switching(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    virtual_sanxi.mode = 0x10  # 控制器自行回到空闲模式
+    sanxi.mode_machine.invalidate()
+    assert sanxi.enter_mode(14)
+    assert virtual_sanxi.received_commands == [CMD_QUERY_MODE, CMD_MODE14]
+
+
+@pytest.mark.parametrize('sanxi_pair', [RefusingSanxi], indirect=True)
+def test_refused_switch_is_reported_and_resynced(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    assert not sanxi.enter_mode(11)
+    assert not sanxi.mode_machine.confirmed
+    del virtual_sanxi.received_commands[:]
+    assert sanxi.enter_mode(14)
+    assert virtual_sanxi.received_commands == [CMD_QUERY_MODE, CMD_MODE14]
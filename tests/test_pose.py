@@ -0,0 +1,68 @@
+import numpy
+
+from pose import JointPose, CartesianPose
+
+
+def test_truthiness_follows_valid():
+    pose = JointPose()
+    assert not pose
+    assert list(pose) == [0.0] * 6
+    pose.set([1, 2, 3, 4, 5, 6], 1.5)
+    assert pose
+    assert pose.timestamp == 1.5
+    pose.invalidate()
+    assert not pose
+    assert list(pose) == [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]  # 失效不清除坐标
+    assert CartesianPose([0.0] * 7)  # 全零但已写入的位姿为真
+
+
+def test_set_ignores_extra_values():
+    pose = JointPose([1, 2, 3, 4, 5, 6, 99.0])  # 带时间戳的 JointRecord
+    assert len(pose) == 6
+    assert pose.j6 == 6.0
+
+
+def test_axis_properties_and_to_dict():
+    pose = CartesianPose([1, 2, 3, 4, 5, 6, 7])
+    pose.z = 30.0
+    assert pose[2] == 30.0
+    pose[6] = 70.0
+    assert pose.d == 70.0
+    assert pose.to_dict() == {'X': 1.0, 'Y': 2.0, 'Z': 30.0, 'A': 4.0, 'B': 5.0, 'C': 6.0, 'D': 70.0}
+
+
+def test_copy_from_copies_in_place():
+    source = JointPose([1, 2, 3, 4, 5, 6], 2.0)
+    target = JointPose()
+    values = target.values
+    assert target.copy_from(source) is target
+    assert target.values is values  # 不分配新的数组
+    assert list(target) == list(source)
+    assert target.timestamp == 2.0
+    assert target
+    source[0] = 100.0
+    assert target[0] == 1.0
+    assert not target.copy_from(JointPose())  # 有效标志同样被复制
+
+
+def test_copy_is_independent():
+    source = CartesianPose([1, 2, 3, 4, 5, 6, 7], 3.0)
+    clone = source.copy()
+    assert type(clone) is CartesianPose
+    assert list(clone) == list(source) and clone.timestamp == 3.0 and clone
+    clone.x = -1.0
+    assert source.x == 1.0
+
+
+def test_as_array_shares_the_buffer():
+    pose = JointPose([1, 2, 3, 4, 5, 6])
+    view = pose.as_array()
+    assert view.dtype == numpy.float64
+    view[1] = 20.0
+    assert pose.j2 == 20.0
+    pose.j3 = 30.0
+    assert view[2] == 30.0
+    pose.set([6, 5, 4, 3, 2, 1])
+    assert list(view) == [6.0, 5.0, 4.0, 3.0, 2.0, 1.0]
+    pose.copy_from(JointPose([0, 0, 0, 0, 0, 7]))
+    assert view[5] == 7.0
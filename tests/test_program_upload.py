@@ -0,0 +1,57 @@
+import pytest
+
+from sanxi_simulator import VirtualSanxi
+
+PROGRAM = '\n'.join(['G00 J1={:.2f}'.format(value * 0.5) for value in range(1, 201)])
+
+
+class TruncatingSanxi(VirtualSanxi):
+    """
+    块回复正确、但保存时丢掉最后一个字节的控制器，整个程序的校验在 FILE CLOSE 时失败
+    """
+    def handle_file_data(self, line, payload):
+        reply = super(TruncatingSanxi, self).handle_file_data(line, payload)
+        for index in self.file_chunks:
+            if self.file_chunks[index] == payload:
+                self.file_chunks[index] = payload[:-1]
+        return reply
+
+
+def test_upload_without_run_returns_to_mode14(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    sanxi.uploader.chunk_size = 256
+    report = sanxi.upload_program(PROGRAM)
+    assert report.verified and not report.started
+    assert report.lines == 200 and report.chunks > 4 and report.retries == 0
+    assert virtual_sanxi.program == PROGRAM.splitlines()
+    assert virtual_sanxi.program_runs == 0
+    assert virtual_sanxi.mode == 0x14 and sanxi.current_mode == 14 and sanxi.mode_machine.confirmed
+
+
+def test_rejected_chunk_is_sent_again(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    sanxi.uploader.chunk_size = 256
+    virtual_sanxi.reject_chunks = {1, 3}
+    report = sanxi.upload_program(PROGRAM)
+    assert report.verified and report.retries == 2
+    assert virtual_sanxi.program == PROGRAM.splitlines()
+
+
+@pytest.mark.parametrize('sanxi_pair', [TruncatingSanxi], indirect=True)
+def test_checksum_mismatch_on_close_fails_the_upload(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    report = sanxi.upload_program(PROGRAM, run=True)
+    assert not report.verified and not report.started
+    assert sanxi.uploader.last_error == 'program verification failed'
+    assert virtual_sanxi.program == [] and virtual_sanxi.program_runs == 0
+    assert virtual_sanxi.mode == 0x14 and sanxi.current_mode == 14
+
+
+def test_run_starts_the_program_and_stays_in_file_mode(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    report = sanxi.upload_program(PROGRAM, run=True)
+    assert report.verified and report.started
+    assert virtual_sanxi.program_runs == 1 and virtual_sanxi.jn_value[0] == pytest.approx(100.0)
+    assert virtual_sanxi.mode == 0x11 and sanxi.current_mode == 11
+    assert sanxi.enter_mode(14)  # 程序结束后由调用者回到调试模式
+    assert virtual_sanxi.mode == 0x14
@@ -0,0 +1,123 @@
+import random
+import threading
+import time
+
+import pytest
+
+from sanxi_core import Sanxi, FRAME_ACK, FRAME_LINE, CMD_QUERY_MODE, CMD_FREEZE, CMD_MODE14
+from transport import MemoryTransport
+
+COORD_LINE = b'X=1.00 Y=2.00 Z=3.00 A=0.00 B=0.00 C=0.00 D=0.00\r\n'
+
+
+def split_commands(data):
+    """
+    把一次写出拆成命令：单字节控制命令，或以 \\n 结尾的行
+    """
+    commands = []
+    while data:
+        if data[:1] in (CMD_QUERY_MODE, CMD_FREEZE) or data[0] < 0x20:
+            commands.append(data[:1])
+            data = data[1:]
+        else:
+            end = data.index(b'\n') + 1
+            commands.append(data[:end])
+            data = data[end:]
+    return commands
+
+
+def reply_of(command):
+    if command == CMD_QUERY_MODE:
+        return CMD_MODE14
+    if command == CMD_FREEZE:
+        return COORD_LINE
+    if len(command) == 1:
+        return command  # 模式切换字节的回显
+    if command.startswith(b'N'):
+        return b''  # 无回复的命令
+    return b'R' + command[1:-1] + b'\r\n'  # b'Q7\n' -> b'R7\r\n'
+
+
+def respond(data):
+    return b''.join([reply_of(command) for command in split_commands(data)])
+
+
+@pytest.fixture
+def memory_sanxi():
+    transport = MemoryTransport(respond)
+    sanxi = Sanxi()
+    sanxi.set_transport(transport)
+    assert sanxi.connect()
+    yield sanxi, transport
+    sanxi.motion_monitor.stop()
+    sanxi.disconnect()
+
+
+def test_batch_is_written_once_and_replies_are_matched_in_order(memory_sanxi):
+    sanxi, transport = memory_sanxi
+    replies = sanxi.request_many([(CMD_QUERY_MODE, FRAME_ACK, 0.5), (CMD_FREEZE, FRAME_LINE, 0.5),
+                                  (b'N1\n', None, 0.5), (b'Q2\n', FRAME_LINE, 0.5)])
+    assert transport.written == [CMD_QUERY_MODE + CMD_FREEZE + b'N1\n' + b'Q2\n']
+    assert replies == [CMD_MODE14, COORD_LINE, b'', b'R2\r\n']
+    assert sanxi.mode_machine.confirmed and sanxi.current_mode == 14
+
+
+def test_batch_with_max_lines_is_written_in_chunks(memory_sanxi):
+    sanxi, transport = memory_sanxi
+    with sanxi.batch(max_lines=3) as batch:
+        for n in range(1, 8):
+            batch.add('Q{}\n'.format(n), 0.5)
+    assert transport.written == [b'Q1\nQ2\nQ3\n', b'Q4\nQ5\nQ6\n', b'Q7\n']
+    assert batch.replies == ['R{}\r\n'.format(n).encode() for n in range(1, 8)]
+
+
+def test_fragmented_reply_is_reassembled(memory_sanxi):
+    sanxi, transport = memory_sanxi
+
+    def fragmented(data):
+        reply = respond(data)
+        for i in range(0, len(reply) - 1, 5):
+            transport.feed(reply[i:min(i + 5, len(reply) - 1)])
+            time.sleep(0.002)
+        return reply[-1:]  # 最后一个字节随写出返回
+    transport.responder = fragmented
+    assert sanxi.request(CMD_FREEZE, FRAME_LINE, 0.5) == COORD_LINE
+    assert sanxi.request(CMD_QUERY_MODE, FRAME_ACK, 0.5) == CMD_MODE14
+
+
+def test_stale_bytes_are_not_taken_as_the_reply(memory_sanxi):
+    sanxi, transport = memory_sanxi
+    transport.feed(b'R99\r\n')  # 上一次超时后迟到的回复
+    time.sleep(0.1)
+    assert sanxi.request(b'Q5\n', FRAME_LINE, 0.5) == b'R5\r\n'
+    assert 'R99' in sanxi.return_code_history.tail(64)  # 只记入历史
+
+
+def test_timeout_returns_the_partial_reply(memory_sanxi):
+    sanxi, transport = memory_sanxi
+    transport.responder = lambda data: b'X=1.00 Y='
+    start = time.perf_counter()
+    assert sanxi.request(CMD_FREEZE, FRAME_LINE, 0.1) == b'X=1.00 Y='
+    assert time.perf_counter() - start < 0.5
+    transport.responder = respond
+    assert sanxi.request(b'Q6\n', FRAME_LINE, 0.5) == b'R6\r\n'
+
+
+def test_concurrent_requests_get_their_own_replies(memory_sanxi):
+    sanxi, transport = memory_sanxi
+    errors = []
+
+    def worker(n):
+        generator = random.Random(n)
+        for i in range(20):
+            time.sleep(generator.random() * 0.002)
+            tag = '{}-{}'.format(n, i).encode()
+            reply = sanxi.request(b'Q' + tag + b'\n', FRAME_LINE, 0.5)
+            if reply != b'R' + tag + b'\r\n':
+                errors.append((tag, reply))
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
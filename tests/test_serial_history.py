@@ -0,0 +1,67 @@
+from communication import SerialHistory
+
+
+def test_eviction_at_capacity_keeps_the_newest_bytes():
+    history = SerialHistory(capacity=8)
+    history.append('abcdef')
+    history.append(b'ghij')
+    assert len(history) == 8
+    assert history.text() == 'cdefghij'
+    assert history.tail(3) == 'hij'
+    assert history.total_appended == 10
+
+
+def test_since_returns_only_new_data():
+    history = SerialHistory(capacity=16)
+    text, mark = history.since(0)
+    assert (text, mark) == ('', 0)
+    history.append('abc')
+    text, mark = history.since(mark)
+    assert (text, mark) == ('abc', 3)
+    history.append('de')
+    text, mark = history.since(mark)
+    assert (text, mark) == ('de', 5)
+    assert history.since(mark) == ('', 5)
+
+
+def test_since_after_eviction_skips_the_evicted_part():
+    history = SerialHistory(capacity=8)
+    history.append('abc')
+    text, mark = history.since(0)
+    history.append('defghijklmno')  # 追加 12 字节，mark 之后的 def 等已被挤出
+    text, mark = history.since(mark)
+    assert text == 'hijklmno'
+    assert mark == 15
+
+
+def test_spill_file_receives_every_evicted_byte(tmp_path):
+    spill_path = str(tmp_path / 'serial.log')
+    history = SerialHistory(capacity=8, spill_path=spill_path)
+    history.append('abcdef')
+    history.append('ghij')
+    history.append('klmnopqrstuvwxyz')  # 单次超过容量
+    history.close()
+    with open(spill_path, 'rb') as f:
+        spilled = f.read()
+    # 溢出文件与内存中的历史首尾相接，合起来就是全部数据
+    assert spilled + history.text().encode() == b'abcdefghijklmnopqrstuvwxyz'
+    assert history.text() == 'stuvwxyz'
+
+
+def test_spill_file_is_appended_across_histories(tmp_path):
+    spill_path = str(tmp_path / 'serial.log')
+    for chunk in ('0123456789', 'abcdefghij'):
+        history = SerialHistory(capacity=8, spill_path=spill_path)
+        history.append(chunk)
+        history.close()
+    with open(spill_path, 'rb') as f:
+        assert f.read() == b'01ab'
+
+
+def test_without_spill_path_evicted_data_is_dropped():
+    history = SerialHistory(capacity=4)
+    history.append('abcdef')
+    assert history.text() == 'cdef'
+    history.clear()
+    assert history.text() == ''
+    assert history.total_appended == 6
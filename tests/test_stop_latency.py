@@ -0,0 +1,33 @@
+import threading
+import time
+
+import pytest
+
+from sanxi_core import FRAME_LINE
+from sanxi_simulator import VirtualSanxi
+
+
+class SilentSanxi(VirtualSanxi):
+    """
+    不回复 G 代码行命令的控制器
+    """
+    def __init__(self, **kwargs):
+        super(SilentSanxi, self).__init__(line_reply=None, **kwargs)
+
+
+@pytest.mark.parametrize('sanxi_pair', [SilentSanxi, VirtualSanxi], indirect=True)
+def test_freeze_is_not_delayed_by_an_outstanding_move(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    virtual_sanxi.linear_speed = 10.0
+    replies = []
+    move = threading.Thread(target=lambda: replies.append(
+        sanxi.request(b'G21 X=100.00 \n', FRAME_LINE, 0.5)))  # 不回复时等待 0.5 秒超时
+    move.start()
+    time.sleep(0.02)
+    start = time.perf_counter()
+    sanxi.freeze_motion()
+    seconds = time.perf_counter() - start
+    move.join()
+    assert seconds < 0.02  # 不等运动命令的回复超时
+    assert sanxi.pose_snapshot.cartesian.timestamp >= start  # 冻结命令取得了坐标行
+    assert replies == [virtual_sanxi.line_reply or b'']
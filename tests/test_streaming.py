@@ -0,0 +1,34 @@
+import numpy
+import pytest
+
+from sanxi_core import Sanxi
+from sanxi_simulator import VirtualSanxi
+
+
+def stream(line_reply, n=40):
+    with VirtualSanxi(reply_latency=0.0002, line_reply=line_reply) as virtual_sanxi:
+        sanxi = Sanxi()
+        assert sanxi.connect_sanxi(virtual_sanxi.port_name)
+        points = numpy.zeros((n, 6))
+        points[:, 0] = numpy.linspace(1.0, 40.0, n)
+        report = sanxi.stream_trajectory(points, 'joint')
+        sanxi.query_current_mode()
+        final = list(virtual_sanxi.jn_value)
+        sanxi.disconnect()
+    return sanxi.streamer, report, final
+
+
+def test_streaming_uses_replies_when_the_controller_acks():
+    streamer, report, final = stream(b'OK\r\n')
+    assert streamer.line_ack is True
+    assert report.points == 40 and report.timeouts == 0
+    assert final[0] == pytest.approx(40.0)
+
+
+def test_streaming_is_paced_when_the_controller_does_not_ack():
+    streamer, report, final = stream(None)
+    assert streamer.line_ack is False
+    assert report.points == 40
+    # 探测一次 + 每点 14ms，不会每点等待 0.5s 的回复超时
+    assert report.seconds < 0.05 + 40 * 0.03
+    assert final[0] == pytest.approx(40.0)
@@ -0,0 +1,39 @@
+import time
+
+from sanxi_core import Sanxi
+from sanxi_simulator import VirtualSanxi
+
+
+def test_request_succeeds_after_the_connection_drops():
+    virtual_sanxi = VirtualSanxi(reply_latency=0.0002)
+    port_name = virtual_sanxi.start_tcp()
+    sanxi = Sanxi()
+    try:
+        assert sanxi.connect_sanxi(port_name)
+        assert sanxi.query_current_mode() == 14
+        virtual_sanxi.drop_connection()  # 模拟网络中断
+        time.sleep(0.1)  # 读线程发现断开并重连
+        assert sanxi.query_current_mode() == 14
+        assert sanxi.transport.reconnect_count == 1 and virtual_sanxi.connection_count == 2
+    finally:
+        sanxi.motion_monitor.stop()
+        sanxi.disconnect()
+        virtual_sanxi.stop()
+
+
+def test_disconnect_closes_the_tcp_connection():
+    virtual_sanxi = VirtualSanxi(reply_latency=0.0002)
+    port_name = virtual_sanxi.start_tcp()
+    sanxi = Sanxi()
+    try:
+        assert sanxi.connect_sanxi(port_name)
+        transport = sanxi.transport
+        assert sanxi.disconnect()
+        assert not transport.is_open()
+        assert sanxi.connect_sanxi(port_name)  # 复用传输层，建立新的连接
+        assert sanxi.transport is transport and virtual_sanxi.connection_count == 2
+        assert sanxi.query_current_mode() == 14
+    finally:
+        sanxi.motion_monitor.stop()
+        sanxi.disconnect()
+        virtual_sanxi.stop()
@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+from sanxi_core import CMD_FREEZE
+
+
+def freeze_count(virtual_sanxi):
+    return virtual_sanxi.received_commands.count(CMD_FREEZE)
+
+
+def test_active_telemetry_does_not_interrupt_motion(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    virtual_sanxi.linear_speed = 10.0
+    sanxi.start_telemetry(50)
+    time.sleep(0.2)
+    assert freeze_count(virtual_sanxi) > 0  # 静止时主动采样
+    sanxi.rect_move('line', X=100, Y=0, Z=0, A=0, B=0, C=0, D=0)
+    frozen = freeze_count(virtual_sanxi)
+    time.sleep(1.2)
+    assert freeze_count(virtual_sanxi) == frozen
+    sanxi.query_current_mode()  # 虚拟控制器收到命令时才推进运动
+    assert virtual_sanxi.xyz_value[0] > 10.0  # 仍在运动，没有停在 5mm 附近
+    sanxi.freeze_motion()
+    time.sleep(0.2)
+    assert freeze_count(virtual_sanxi) > frozen + 1  # 冻结后恢复主动采样
+
+
+def test_tracked_motion_completes_with_telemetry(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    virtual_sanxi.linear_speed = 20.0
+    sanxi.start_telemetry(50)
+    result = sanxi.submit_rect_move('line', X=30, Y=0, Z=0, A=0, B=0, C=0, D=0, timeout=10).result(15)
+    assert result.reached and result.verified
+    assert virtual_sanxi.xyz_value[0] == pytest.approx(30.0)
+
+
+def test_query_pose_does_not_freeze_a_moving_arm(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    virtual_sanxi.linear_speed = 10.0
+    snapshot = sanxi.query_pose(0)  # 静止：冻结查询两个空间的坐标
+    assert snapshot.joint is not None and snapshot.cartesian is not None
+    sanxi.rect_move('line', X=100, Y=0, Z=0, A=0, B=0, C=0, D=0)
+    frozen = freeze_count(virtual_sanxi)
+    time.sleep(0.3)
+    assert sanxi.query_pose(0) is sanxi.pose_snapshot
+    assert freeze_count(virtual_sanxi) == frozen
+    assert not sanxi._telemetry_idle()
+    snapshot = sanxi.query_pose(0, True)  # 调用者明确要求时冻结
+    assert freeze_count(virtual_sanxi) == frozen + 2
+    assert 0.0 < snapshot.cartesian.x < 100.0
+
+
+def test_pipelined_moves_are_not_reported_reached_without_a_measurement(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    virtual_sanxi.linear_speed = 20.0
+    first = sanxi.submit_rect_move('line', X=10, Y=0, Z=0, A=0, B=0, C=0, D=0, timeout=10)
+    last = sanxi.submit_rect_move('line', X=20, Y=0, Z=0, A=0, B=0, C=0, D=0, timeout=10)
+    result = first.result(15)
+    assert result.reached is None and not result.verified  # 按预测时间结束，未测量
+    result = last.result(15)
+    assert result.reached is True and result.verified
+    assert result.pose is not None
+    assert virtual_sanxi.xyz_value[0] == pytest.approx(20.0)
+
+
+def test_freeze_during_a_poll_is_not_followed_by_a_resend(sanxi_pair):
+    sanxi, virtual_sanxi = sanxi_pair
+    virtual_sanxi.linear_speed = 10.0
+    sanxi.motion_monitor.speeds['rect'] = 1000.0  # 第一次轮询时远未到达，轮询后会重发
+    query_pose = sanxi.query_pose
+    stopped = []
+
+    def query_pose_then_freeze(*args):
+        snapshot = query_pose(*args)
+        if not stopped:
+            # 轮询的冻结之后、重发之前，用户冻结运动；等到冻结命令已写出再继续轮询
+            frozen = freeze_count(virtual_sanxi)
+            stopped.append(threading.Thread(target=sanxi.freeze_motion))
+            stopped[0].start()
+            while freeze_count(virtual_sanxi) == frozen:
+                time.sleep(0.001)
+        return snapshot
+    sanxi.query_pose = query_pose_then_freeze
+    result = sanxi.submit_rect_move('line', X=100, Y=0, Z=0, A=0, B=0, C=0, D=0, timeout=10).result(5)
+    stopped[0].join()
+    time.sleep(0.1)
+    assert not result.reached
+    commands = virtual_sanxi.received_commands
+    last_freeze = len(commands) - commands[::-1].index(CMD_FREEZE)
+    assert not [command for command in commands[last_freeze:] if command.startswith(b'G2')]  # 没有运动命令
+    assert sanxi.motion_monitor.resend_count == 0
@@ -0,0 +1,78 @@
+import ctypes
+from unittest import mock
+
+import numpy
+import pytest
+
+if not hasattr(ctypes, 'windll'):
+    ctypes.windll = mock.MagicMock()  # hd.dll 只在 Windows 上存在，这里只测试环形缓冲区之后的处理
+
+from geomagic_touch_core import TouchSampler, SAMPLE_TIME, SAMPLE_POSITION, SAMPLE_GIMBAL, SAMPLE_BUTTONS
+from master_slave import TouchAccumulator
+from touch_filter import FilterPipeline, OneEuroFilter, LowPassFilter
+
+RATE = 1000.0
+
+
+@pytest.fixture
+def accumulator():
+    sampler = TouchSampler(mock.MagicMock(), capacity=4096)
+    pipeline = FilterPipeline([OneEuroFilter(SAMPLE_POSITION, min_cutoff=1.0, beta=0.05),
+                               LowPassFilter(SAMPLE_GIMBAL, cutoff=5.0)])
+    return sampler, TouchAccumulator(sampler, pipeline)
+
+
+def write(sampler, x, buttons, gimbal=None):
+    """
+    以 1kHz 写入一段采样：x 为每行的 X 位置，gimbal 为每行的万向节 X 角度，buttons 为按钮状态
+    """
+    for i, value in enumerate(x):
+        row = sampler.ring[sampler.count % sampler.capacity]
+        row[:] = 0
+        row[SAMPLE_TIME] = sampler.count / RATE
+        row[SAMPLE_POSITION.start] = value
+        if gimbal is not None:
+            row[SAMPLE_GIMBAL.start] = gimbal[i]
+        row[SAMPLE_BUTTONS] = buttons
+        sampler.count += 1
+
+
+def run(sampler, accumulator, x, buttons, tick=80, gimbal=None):
+    for start in range(0, len(x), tick):
+        write(sampler, x[start:start + tick], buttons, None if gimbal is None else gimbal[start:start + tick])
+        accumulator.update()
+
+
+def test_only_motion_with_its_button_held_is_accumulated():
+    sampler = TouchSampler(mock.MagicMock(), capacity=4096)
+    accumulator = TouchAccumulator(sampler)
+    run(sampler, accumulator, numpy.linspace(0.0, 3.0, 100), 2, tick=30)  # 按钮2：位置
+    run(sampler, accumulator, numpy.linspace(3.0, 7.0, 100), 0, tick=30)  # 松开：不计入
+    run(sampler, accumulator, numpy.full(100, 7.0), 1, tick=30, gimbal=numpy.linspace(0.0, 0.5, 100))  # 按钮1：角度
+    run(sampler, accumulator, numpy.linspace(7.0, 8.0, 100), 2, tick=30)
+    assert accumulator.position[0] == pytest.approx(4.0)  # 跨越读取周期的差值也被计入
+    assert accumulator.gimbal_angles[0] == pytest.approx(0.5)
+    assert accumulator.buttons == 2 and accumulator.sample_count == 400
+    assert accumulator.take_position() == pytest.approx([4.0, 0.0, 0.0])
+    assert not accumulator.position.any()
+    write(sampler, numpy.linspace(8.0, 10.0, 50), 2)
+    accumulator.reset()  # 丢弃尚未读取的采样，从当前帧重新开始
+    run(sampler, accumulator, numpy.linspace(10.0, 11.0, 100), 2)
+    assert accumulator.position[0] == pytest.approx(1.0)
+    assert accumulator.take_gimbal_angles() == [0.0, 0.0, 0.0]
+
+
+def test_reposition_while_released_is_not_commanded(accumulator):
+    sampler, accumulator = accumulator
+    run(sampler, accumulator, numpy.zeros(200), 2)
+    run(sampler, accumulator, numpy.linspace(0.0, 5.0, 300), 0)  # 松开按钮，手柄复位 5mm
+    accumulator.clear()
+    run(sampler, accumulator, numpy.full(1000, 5.0), 2)  # 按下按钮后保持不动
+    assert numpy.abs(accumulator.position).max() < 0.01
+
+
+def test_held_motion_is_commanded_one_to_one(accumulator):
+    sampler, accumulator = accumulator
+    run(sampler, accumulator, numpy.zeros(200), 2)
+    run(sampler, accumulator, numpy.concatenate((numpy.linspace(0.0, 10.0, 500), numpy.full(1500, 10.0))), 2)
+    assert accumulator.position[0] == pytest.approx(10.0, abs=0.05)
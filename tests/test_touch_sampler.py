@@ -0,0 +1,125 @@
+import ctypes
+import threading
+import time
+from unittest import mock
+
+import numpy
+
+if not hasattr(ctypes, 'windll'):
+    ctypes.windll = mock.MagicMock()  # hd.dll 只在 Windows 上存在，这里只测试环形缓冲区与顺序锁
+
+import geomagic_touch_core
+from geomagic_touch_core import TouchSampler, SAMPLE_TIME, SAMPLE_WIDTH
+
+
+def _make_sampler(capacity=8):
+    return TouchSampler(mock.MagicMock(), capacity=capacity)
+
+
+def _write(sampler, t):
+    # 与伺服回调相同：先写第 count 行，再发布
+    row = numpy.zeros(SAMPLE_WIDTH)
+    row[SAMPLE_TIME] = t
+    sampler.ring[sampler.count % sampler.capacity] = row
+    sampler.count += 1
+
+
+def test_latest_is_none_before_any_sample():
+    sampler = _make_sampler()
+    assert sampler.latest() is None
+    _write(sampler, 1.0)
+    _write(sampler, 2.0)
+    assert sampler.latest()[SAMPLE_TIME] == 2.0
+
+
+def test_since_returns_rows_in_order_across_a_wrap():
+    sampler = _make_sampler(capacity=8)
+    for t in range(6):
+        _write(sampler, t)
+    rows, mark = sampler.since(0)
+    assert list(rows[:, SAMPLE_TIME]) == [0, 1, 2, 3, 4, 5]
+    assert mark == 6
+    for t in range(6, 11):  # 第 8、9、10 行回绕到环形缓冲区开头
+        _write(sampler, t)
+    rows, mark = sampler.since(mark)
+    assert list(rows[:, SAMPLE_TIME]) == [6, 7, 8, 9, 10]
+    assert mark == 11
+
+
+def test_since_after_an_overrun_keeps_only_the_newest_rows():
+    sampler = _make_sampler(capacity=8)
+    _write(sampler, 0)
+    rows, mark = sampler.since(0)
+    for t in range(1, 21):  # 超前 20 行，远多于一圈
+        _write(sampler, t)
+    rows, mark = sampler.since(mark)
+    # 最多 capacity - 1 行，正在被写入的下一行不返回
+    assert list(rows[:, SAMPLE_TIME]) == list(range(14, 21))
+    assert mark == 21
+
+
+def test_since_drops_rows_overwritten_during_the_copy():
+    sampler = _make_sampler(capacity=8)
+    for t in range(8):
+        _write(sampler, t)
+
+    class _Ring(numpy.ndarray):
+        # 模拟伺服回调在复制期间又写入两行
+        def __getitem__(self, index):
+            rows = numpy.ndarray.__getitem__(self, index)
+            if isinstance(index, numpy.ndarray):
+                for t in (8, 9):
+                    numpy.ndarray.__setitem__(self, sampler.count % sampler.capacity, t)
+                    sampler.count += 1
+            return rows
+
+    sampler.ring = sampler.ring.view(_Ring)
+    rows, mark = sampler.since(0)
+    # 复制的是第 1~7 行，写入者已到第 10 行，第 1 行已被覆盖，第 2 行可能正在被写入
+    assert list(numpy.asarray(rows)[:, SAMPLE_TIME]) == [3, 4, 5, 6, 7]
+    assert mark == 8
+
+
+def test_snapshot_waits_while_the_sequence_is_odd():
+    sampler = _make_sampler()
+    state = sampler.state
+    state.sequence = 1  # 写入中
+    state.position[0] = -1.0
+
+    def finish_frame():
+        time.sleep(0.02)
+        state.position[0] = 5.0
+        state.timestamp = 7.0
+        state.sequence = 2
+
+    writer = threading.Thread(target=finish_frame)
+    writer.start()
+    out = sampler.snapshot()
+    writer.join()
+    assert out.sequence == 2
+    assert out.position[0] == 5.0
+    assert out.timestamp == 7.0
+
+
+def test_snapshot_retries_when_the_sequence_changes_during_the_copy(monkeypatch):
+    sampler = _make_sampler()
+    state = sampler.state
+    state.sequence = 2
+    state.position[0] = 1.0
+    copies = []
+    memmove = geomagic_touch_core.memmove
+
+    def racing_memmove(dst, src, size):
+        result = memmove(dst, src, size)
+        copies.append(size)
+        if len(copies) == 1:
+            # 复制完成后伺服回调写入了新的一帧，第一次复制的结果作废
+            state.position[0] = 2.0
+            state.sequence = 4
+        return result
+
+    monkeypatch.setattr(geomagic_touch_core, 'memmove', racing_memmove)
+    out = sampler.snapshot()
+    assert len(copies) == 2
+    assert out.sequence == 4
+    assert out.position[0] == 2.0
@@ -0,0 +1,329 @@
+"""
+This module includes the real-time filtering of the haptic device input
+Class: FilterPipeline runs a list of filter stages over the new rows of the TouchSampler ring every control tick,
+         in place and vectorized over the rows, and records its own time per tick.
+       LowPassFilter, OneEuroFilter and VelocityScaling are stages, each one works on a group of ring columns
+         (SAMPLE_POSITION, SAMPLE_GIMBAL, or a single axis) and keeps its state between ticks, so a stage can be
+         plugged per axis and its parameters may be scalars or one value per axis.
+       Deadband holds back an accumulated motion until it is large enough to be worth a robot command.
+Functions: smooth() cutoff_alpha() benchmark()
+Note: the first-order recursion y_i = y_(i-1) + a_i (x_i - y_(i-1)) is evaluated in closed form with cumulative sums,
+      see smooth(), so no stage loops over the samples in Python.
+
+Author: Mr SoSimple
+"""
+
+
+import math
+import sys
+import time
+
+import numpy
+
+from geomagic_touch_core import SAMPLE_TIME, SAMPLE_POSITION, SAMPLE_GIMBAL, SAMPLE_BUTTONS, SAMPLE_WIDTH
+from latency_stats import LatencyHistogram
+
+
+MAX_LOG_DECAY = 600.0  # smooth() 分段计算时每段累计衰减的上限，保证 exp(±) 不溢出
+
+
+def cutoff_alpha(cutoff, intervals):
+    """
+    一阶低通滤波器的平滑系数
+    :param cutoff: float 或 numpy.ndarray 截止频率，单位Hz
+    :param intervals: numpy.ndarray 各采样与前一个采样的时间间隔，单位秒
+    :return: numpy.ndarray 平滑系数，间隔为 0 时为 0
+    """
+    tau = 1.0 / (2 * math.pi * numpy.asarray(cutoff))
+    return intervals / (intervals + tau)
+
+
+def smooth(values, alpha, previous):
+    """
+    一阶指数平滑 y_i = y_(i-1) + a_i (x_i - y_(i-1)) 的向量化计算：
+    记 c_i = sum(log(1 - a_k), k <= i)，则 y_i = exp(c_i) (y_(-1) + sum(a_k x_k exp(-c_k), k <= i))，
+    c 超过 MAX_LOG_DECAY 时分段，以上一段的末值为下一段的 y_(-1)
+    :param values: numpy.ndarray N×k 输入
+    :param alpha: numpy.ndarray N×k 或 N×1 各采样的平滑系数，取值 [0, 1]
+    :param previous: numpy.ndarray k 上一次的输出 y_(-1)
+    :return: numpy.ndarray N×k 输出
+    """
+    alpha = numpy.broadcast_to(alpha, values.shape)
+    log_decay = numpy.log(numpy.maximum(1.0 - alpha, 1e-12))
+    out = numpy.empty(values.shape)
+    start = 0
+    while start < len(values):
+        decay = numpy.cumsum(log_decay[start:], axis=0)
+        deep = decay.min(axis=1) < -MAX_LOG_DECAY
+        end = start + int(numpy.argmax(deep)) if deep.any() else len(values)
+        end = max(end, start + 1)
+        decay = decay[:end - start]
+        out[start:end] = numpy.exp(decay) * (previous + numpy.cumsum(
+            alpha[start:end] * values[start:end] * numpy.exp(-decay), axis=0))
+        previous = out[end - 1]
+        start = end
+    return out
+
+
+class FilterStage(object):
+    """
+    滤波级的基类，columns 为作用的环形缓冲区列，process() 原地改写这些列
+    """
+    def __init__(self, columns):
+        """
+        :param columns: slice 或 int 或 list of int，见 geomagic_touch_core.SAMPLE_*
+        """
+        super(FilterStage, self).__init__()
+        self.columns = columns
+        self._last_time = None
+        self._last_input = None  # 上一次最后一个采样的输入值
+        self._last_output = None  # 上一次最后一个采样的输出值
+
+    def reset(self, sample_time=None, sample=None):
+        """
+        清除跨周期的状态；给出采样时以它为种子，下一次 process() 从该采样继续，输出不再向旧的状态收敛
+        :param sample_time: float 种子采样的时刻，单位秒，None 表示无种子
+        :param sample: numpy.ndarray k 种子采样在本级作用的列上的原始值
+        :return: None
+        """
+        self._last_time = sample_time
+        self._last_input = None if sample is None else numpy.array(sample, dtype=float, ndmin=1)
+        self._last_output = None if sample is None else self._last_input.copy()
+
+    def _intervals(self, times):
+        """
+        :return: numpy.ndarray N×1 各采样与前一个采样的时间间隔，单位秒，第一次的第一个采样为 0
+        """
+        intervals = numpy.empty((len(times), 1))
+        intervals[0, 0] = 0.0 if self._last_time is None else max(times[0] - self._last_time, 0.0)
+        intervals[1:, 0] = numpy.maximum(numpy.diff(times), 0.0)
+        self._last_time = times[-1]
+        return intervals
+
+    def _steps(self, values):
+        """
+        :return: numpy.ndarray N×k 各采样相对前一个采样的输入变化量，第一次的第一个采样为 0
+        """
+        steps = numpy.empty(values.shape)
+        steps[0] = 0.0 if self._last_input is None else values[0] - self._last_input
+        steps[1:] = values[1:] - values[:-1]
+        self._last_input = values[-1].copy()
+        return steps
+
+    def process(self, times, values):
+        """
+        :param times: numpy.ndarray N 采样时刻，单位秒
+        :param values: numpy.ndarray N×k 本级作用的列
+        :return: numpy.ndarray N×k 输出
+        """
+        raise NotImplementedError
+
+
+class LowPassFilter(FilterStage):
+    def __init__(self, columns, cutoff=5.0):
+        """
+        :param columns: 作用的列
+        :param cutoff: float 或 list 每轴的截止频率，单位Hz
+        """
+        super(LowPassFilter, self).__init__(columns)
+        self.cutoff = numpy.asarray(cutoff, dtype=float)
+
+    def process(self, times, values):
+        alpha = cutoff_alpha(self.cutoff, self._intervals(times))
+        previous = values[0] if self._last_output is None else self._last_output
+        out = smooth(values, alpha, previous)
+        self._last_output = out[-1].copy()
+        return out
+
+
+class OneEuroFilter(FilterStage):
+    """
+    One-Euro 滤波器：截止频率随速度升高，慢速时抑制抖动，快速时减小滞后。
+    速度取自输入的变化量，经 derivative_cutoff 低通，因此两次平滑都是线性递推，可整体向量化
+    """
+    def __init__(self, columns, min_cutoff=1.0, beta=0.05, derivative_cutoff=1.0):
+        """
+        :param columns: 作用的列
+        :param min_cutoff: float 或 list 每轴静止时的截止频率，单位Hz
+        :param beta: float 或 list 截止频率随速度的增量，单位 Hz / (列的单位/秒)
+        :param derivative_cutoff: float 速度低通的截止频率，单位Hz
+        """
+        super(OneEuroFilter, self).__init__(columns)
+        self.min_cutoff = numpy.asarray(min_cutoff, dtype=float)
+        self.beta = numpy.asarray(beta, dtype=float)
+        self.derivative_cutoff = derivative_cutoff
+        self.__last_speed = None
+
+    def reset(self, sample_time=None, sample=None):
+        super(OneEuroFilter, self).reset(sample_time, sample)
+        self.__last_speed = None  # 速度从 0 开始
+
+    def process(self, times, values):
+        intervals = self._intervals(times)
+        steps = self._steps(values)
+        speed = numpy.divide(steps, intervals, out=numpy.zeros(values.shape), where=intervals > 0)
+        previous_speed = numpy.zeros(values.shape[1]) if self.__last_speed is None else self.__last_speed
+        speed = smooth(speed, cutoff_alpha(self.derivative_cutoff, intervals), previous_speed)
+        self.__last_speed = speed[-1].copy()
+        alpha = cutoff_alpha(self.min_cutoff + self.beta * numpy.abs(speed), intervals)
+        previous = values[0] if self._last_output is None else self._last_output
+        out = smooth(values, alpha, previous)
+        self._last_output = out[-1].copy()
+        return out
+
+
+class VelocityScaling(FilterStage):
+    """
+    按手部速度调整增益：每个采样的变化量乘以增益后累加，慢速时增益 low_gain 便于精细操作，快速时 high_gain，
+    之间线性过渡；速度为本组各列变化量的模
+    """
+    def __init__(self, columns, low_gain=0.5, high_gain=1.0, low_speed=10.0, high_speed=100.0):
+        """
+        :param columns: 作用的列
+        :param low_gain: float 或 list 每轴在 low_speed 及以下的增益
+        :param high_gain: float 或 list 每轴在 high_speed 及以上的增益
+        :param low_speed: float 单位 列的单位/秒，例如位置为 mm/s
+        :param high_speed: float 同上
+        """
+        super(VelocityScaling, self).__init__(columns)
+        self.low_gain = numpy.asarray(low_gain, dtype=float)
+        self.high_gain = numpy.asarray(high_gain, dtype=float)
+        self.low_speed = low_speed
+        self.high_speed = high_speed
+
+    def process(self, times, values):
+        intervals = self._intervals(times)
+        steps = self._steps(values)
+        distance = numpy.sqrt(numpy.square(steps).sum(axis=1, keepdims=True))
+        speed = numpy.divide(distance, intervals, out=numpy.zeros(intervals.shape), where=intervals > 0)
+        ratio = numpy.clip((speed - self.low_speed) / (self.high_speed - self.low_speed), 0.0, 1.0)
+        gain = self.low_gain + (self.high_gain - self.low_gain) * ratio
+        previous = values[0] if self._last_output is None else self._last_output
+        out = previous + numpy.cumsum(steps * gain, axis=0)
+        self._last_output = out[-1].copy()
+        return out
+
+
+class Deadband(object):
+    def __init__(self, threshold):
+        """
+        :param threshold: float 或 list 每轴的阈值，与被检查的增量同单位
+        """
+        super(Deadband, self).__init__()
+        self.threshold = numpy.asarray(threshold, dtype=float)
+        self.held_count = 0  # 因未超过阈值而暂缓发出的次数
+
+    def passes(self, delta):
+        """
+        :param delta: numpy.ndarray 累加的增量
+        :return: Bool 任一轴达到阈值时为真，否则应继续累加，暂不发出指令
+        """
+        if numpy.any(numpy.abs(delta) >= self.threshold):
+            return True
+        if numpy.any(delta):
+            self.held_count += 1
+        return False
+
+
+class FilterPipeline(object):
+    def __init__(self, stages=None, name='Touch_Filter'):
+        """
+        :param stages: list of FilterStage 按顺序执行，同一列可以经过多级
+        :param name: str 输出统计时的名称
+        """
+        super(FilterPipeline, self).__init__()
+        self.stages = [] if stages is None else list(stages)
+        self.name = name
+        self.process_time = LatencyHistogram()  # 每次 process() 的耗时
+        self.row_count = 0  # 已处理的采样数
+
+    def reset(self, frame=None):
+        """
+        :param frame: numpy.ndarray SAMPLE_WIDTH 未滤波的一行，给出时各级以它为种子，例如离合器接合时的采样
+        :return: None
+        """
+        for stage in self.stages:
+            if frame is None:
+                stage.reset()
+            else:
+                stage.reset(frame[SAMPLE_TIME], frame[stage.columns])
+
+    def reset_stats(self):
+        self.process_time.reset()
+        self.row_count = 0
+
+    def process(self, frames):
+        """
+        依次执行各级，原地改写 frames 中各级作用的列
+        :param frames: numpy.ndarray N×SAMPLE_WIDTH 按时间顺序的新采样，见 TouchSampler.since()
+        :return: numpy.ndarray frames
+        """
+        if not len(frames):
+            return frames
+        start_time = time.perf_counter()
+        times = frames[:, SAMPLE_TIME]
+        for stage in self.stages:
+            values = frames[:, stage.columns]
+            if values.ndim == 1:
+                values = values[:, numpy.newaxis]
+                frames[:, stage.columns] = stage.process(times, values)[:, 0]
+            else:
+                frames[:, stage.columns] = stage.process(times, values)
+        self.row_count += len(frames)
+        self.process_time.record(time.perf_counter() - start_time)
+        return frames
+
+    def dump(self, file=None):
+        """
+        输出每次 process() 的耗时，单位微秒
+        :param file: 输出文件对象，默认标准输出
+        :return: None
+        """
+        if file is None:
+            file = sys.stdout
+
+        def us(value):
+            return '-' if value is None else '{:.1f}'.format(value * 1e6)
+        stats = self.process_time.snapshot()
+        file.write('{}: {} stages, calls {}, rows {}, p50 {} us  p99 {} us  max {} us\n'.format(
+            self.name, len(self.stages), stats['count'], self.row_count, us(stats['p50']), us(stats['p99']),
+            us(stats['max'])))
+
+
+def benchmark(pipeline, rows=80, ticks=2000, rate=1000.0):
+    """
+    用合成的手部运动（慢速移动叠加抖动与噪声）测量 process() 的耗时
+    :param pipeline: FilterPipeline
+    :param rows: int 每次处理的采样数，1kHz 伺服与 12.5Hz 控制循环时为 80
+    :param ticks: int 处理次数
+    :param rate: float 合成采样的频率，单位Hz
+    :return: dict {'per_tick': p50 耗时(秒), 'p99': p99 耗时(秒), 'per_row': 每个采样的平均耗时(秒)}
+    """
+    times = numpy.arange(rows * ticks) / rate
+    frames = numpy.zeros((len(times), SAMPLE_WIDTH))
+    frames[:, SAMPLE_TIME] = times
+    noise = numpy.random.RandomState(0).normal(0.0, 0.05, (len(times), 6))
+    drift = 20.0 * numpy.sin(2 * math.pi * 0.2 * times)[:, numpy.newaxis]
+    tremor = 0.3 * numpy.sin(2 * math.pi * 9.0 * times)[:, numpy.newaxis]
+    frames[:, SAMPLE_POSITION] = drift + tremor + noise[:, :3]
+    frames[:, SAMPLE_GIMBAL] = 0.01 * (drift + tremor) + 0.001 * noise[:, 3:]
+    frames[:, SAMPLE_BUTTONS] = 2
+    pipeline.reset()
+    pipeline.reset_stats()
+    for i in range(ticks):
+        pipeline.process(frames[i * rows:(i + 1) * rows])
+    stats = pipeline.process_time.snapshot()
+    return {'per_tick': stats['p50'], 'p99': stats['p99'], 'per_row': stats['mean'] / rows}
+
+
+if __name__ == '__main__':
+    candidates = [('low-pass', lambda: [LowPassFilter(SAMPLE_POSITION)]),
+                  ('one-euro', lambda: [OneEuroFilter(SAMPLE_POSITION)]),
+                  ('velocity-scaling', lambda: [VelocityScaling(SAMPLE_POSITION)]),
+                  ('full', lambda: [OneEuroFilter(SAMPLE_POSITION), VelocityScaling(SAMPLE_POSITION),
+                                    LowPassFilter(SAMPLE_GIMBAL)])]
+    for rows in (1, 80, 1000):
+        for name, stages in candidates:
+            result = benchmark(FilterPipeline(stages()), rows=rows, ticks=max(200, 20000 // rows))
+            print('rows {:>5}   {:<17} p50 {:7.1f} us/tick   p99 {:7.1f} us/tick   {:6.3f} us/row'.format(
+                rows, name, result['per_tick'] * 1e6, result['p99'] * 1e6, result['per_row'] * 1e6))
@@ -0,0 +1,234 @@
+"""
+This module includes the byte transports underneath RS232 in communication.py
+Class: SerialTransport  local serial port through pyserial, e.g. 'COM10' or '/dev/ttyUSB0'
+       TcpTransport     raw TCP socket to a serial-to-Ethernet bridge, e.g. 'tcp://192.168.1.20:4001', with
+                          TCP_NODELAY and transparent reconnection; the connection is closed on close() unless
+                          keep_connection is set
+       PtyTransport     raw POSIX file descriptor, e.g. 'pty:///dev/pts/3'
+       MemoryTransport  in-memory transport driven by a responder function, for tests
+Every transport provides open() close() is_open() write(data) read(max_bytes), read() blocks at most timeout seconds.
+Functions: make_transport(port_name, baud_rate, timeout)
+
+Author: Mr SoSimple
+"""
+
+
+import collections
+import os
+import select
+import socket
+import threading
+import time
+
+import serial
+
+
+class SerialTransport(object):
+    def __init__(self, port_name, baud_rate=115200, timeout=0.05):
+        super(SerialTransport, self).__init__()
+        self.__ser = serial.Serial()
+        self.__ser.port = port_name
+        self.__ser.baudrate = baud_rate
+        self.__ser.timeout = timeout
+
+    def open(self):
+        self.__ser.open()
+
+    def close(self):
+        self.__ser.close()
+
+    def is_open(self):
+        return self.__ser.isOpen()
+
+    def write(self, data):
+        self.__ser.write(data)
+
+    def read(self, max_bytes=4096):
+        # 有数据时一次读完，无数据时阻塞至多 timeout 秒等待第一个字节
+        return self.__ser.read(min(self.__ser.in_waiting, max_bytes) or 1)
+
+
+class TcpTransport(object):
+    def __init__(self, host, port, timeout=0.05, connect_timeout=3.0, keep_connection=False):
+        """
+        :param host: str 串口服务器地址
+        :param port: int 串口服务器端口
+        :param timeout: float read() 的最长阻塞时间，单位秒
+        :param connect_timeout: float 建立连接的超时时间，单位秒
+        :param keep_connection: Bool close() 时是否保留已建立的连接，供下次 open() 复用；只服务一个客户端的串口服务器
+                                在连接保留期间不接受其他客户端，因此默认为假
+        """
+        super(TcpTransport, self).__init__()
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.keep_connection = keep_connection
+        self.reconnect_count = 0  # 重连次数
+        self.__sock = None
+        self.__opened = False
+        self.__lock = threading.Lock()  # 保护重连过程
+
+    def __connect_socket(self):
+        sock = socket.create_connection((self.host, self.port), self.connect_timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # 关闭 Nagle 算法，短命令立即发出
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        sock.settimeout(self.timeout)
+        self.__sock = sock
+
+    def open(self):
+        with self.__lock:
+            if self.__sock is None:
+                self.__connect_socket()
+            self.__opened = True
+
+    def close(self, force=False):
+        """
+        :param force: Bool 为真时即使 keep_connection 也关闭连接
+        """
+        with self.__lock:
+            self.__opened = False
+            if self.__sock is not None and (force or not self.keep_connection):
+                self.__sock.close()
+                self.__sock = None
+
+    def is_open(self):
+        return self.__opened and self.__sock is not None
+
+    def reconnect(self):
+        """
+        连接断开后重新建立连接
+        :return: None
+        """
+        with self.__lock:
+            if self.__sock is not None:
+                self.__sock.close()
+                self.__sock = None
+            self.__connect_socket()
+            self.reconnect_count += 1
+
+    def write(self, data):
+        try:
+            self.__sock.sendall(data)
+        except (OSError, AttributeError):
+            # 连接已断开：重连一次后重发
+            self.reconnect()
+            self.__sock.sendall(data)
+
+    def read(self, max_bytes=4096):
+        sock = self.__sock
+        if sock is None:
+            time.sleep(self.timeout)
+            return b''
+        try:
+            data = sock.recv(max_bytes)
+        except socket.timeout:
+            return b''
+        if not data:
+            # 对端关闭连接
+            if self.__opened:
+                self.reconnect()
+            return b''
+        return data
+
+
+class PtyTransport(object):
+    def __init__(self, path, timeout=0.05):
+        super(PtyTransport, self).__init__()
+        self.path = path
+        self.timeout = timeout
+        self.__fd = -1
+
+    def open(self):
+        import tty
+        self.__fd = os.open(self.path, os.O_RDWR | os.O_NOCTTY)
+        tty.setraw(self.__fd)
+
+    def close(self):
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+    def is_open(self):
+        return self.__fd >= 0
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            n = os.write(self.__fd, view)
+            view = view[n:]
+
+    def read(self, max_bytes=4096):
+        readable, _, _ = select.select([self.__fd], [], [], self.timeout)
+        if not readable:
+            return b''
+        return os.read(self.__fd, max_bytes)
+
+
+class MemoryTransport(object):
+    def __init__(self, responder=None, timeout=0.05):
+        """
+        :param responder: function(bytes) -> bytes 对写入数据的回复，None 时原样回环
+        :param timeout: float read() 的最长阻塞时间，单位秒
+        """
+        super(MemoryTransport, self).__init__()
+        self.responder = responder
+        self.timeout = timeout
+        self.written = []  # 写入的全部数据，便于测试检查
+        self.__rx_chunks = collections.deque()
+        self.__condition = threading.Condition()
+        self.__opened = False
+
+    def open(self):
+        self.__opened = True
+
+    def close(self):
+        self.__opened = False
+
+    def is_open(self):
+        return self.__opened
+
+    def feed(self, data):
+        """
+        注入接收数据
+        :param data: bytes
+        :return: None
+        """
+        if data:
+            with self.__condition:
+                self.__rx_chunks.append(bytes(data))
+                self.__condition.notify_all()
+
+    def write(self, data):
+        self.written.append(bytes(data))
+        if self.responder is None:
+            self.feed(data)
+        else:
+            self.feed(self.responder(bytes(data)))
+
+    def read(self, max_bytes=4096):
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.__rx_chunks, self.timeout):
+                return b''
+            data = self.__rx_chunks.popleft()
+            if len(data) > max_bytes:
+                self.__rx_chunks.appendleft(data[max_bytes:])
+                data = data[:max_bytes]
+            return data
+
+
+def make_transport(port_name, baud_rate=115200, timeout=0.05):
+    """
+    根据端口名称创建传输层
+    :param port_name: str 'COM10' '/dev/ttyUSB0' 'tcp://host:port' 'socket://host:port' 'pty:///dev/pts/3'
+    :param baud_rate: int 波特率，只对串口有效
+    :param timeout: float 读超时，单位秒
+    :return: 传输层对象
+    """
+    for scheme in ('tcp://', 'socket://'):
+        if port_name.startswith(scheme):
+            host, port = port_name[len(scheme):].rsplit(':', 1)
+            return TcpTransport(host, int(port), timeout)
+    if port_name.startswith('pty://'):
+        return PtyTransport(port_name[len('pty://'):], timeout)
+    return SerialTransport(port_name, baud_rate, timeout)